@@ -2,55 +2,63 @@
 Analysis & Cleaning Module
 Cleans raw scraped CSVs, categorizes sources, extracts entities,
 and generates Matplotlib visualizations.
+Every function takes the date it works on; importing the module does no I/O.
+
+Backfill:  python Data_Processing/analysis_function.py --backfill 2026_05_01 2026_08_31
 """
 import os
-import ast
+import sys
 import logging
-import pathlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from datetime import date
-import glob
-from typing import Optional, Tuple
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Tuple, Union
 
 import pandas as pd
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-today = date.today().strftime("%Y_%m_%d")
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
-INPUT_FILE = PROJECT_ROOT / f"raw_csv_daily/raw_headlines_data_{today}.csv"
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from Scraping_Scripts.entity_codec import entity_arrays
+from Data_Processing.entity_store import content_digest, get_entity_store, stat_fingerprint
+from Data_Processing.dataset import TABLES, sync_table
+from Data_Processing.charts import render_charts, sentiment_by_source_job, top_entities_job
 
+RAW_DIR = PROJECT_ROOT / "raw_csv_daily"
 OUTPUT_DIR = PROJECT_ROOT / "cleaned_csv_daily"
-OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+CHART_DIR = PROJECT_ROOT / "Data_Output/Matplotlib_Charts"
+ANALYSIS_WORKERS = int(os.environ.get('ANALYSIS_WORKERS', os.cpu_count() or 1))
 
-OUTPUT_FILE = OUTPUT_DIR / f"processed_data_final_{today}.csv"
-ENTITIES_OUTPUT_FILE = OUTPUT_DIR / f"processed_entities_final_{today}.csv"
+DateLike = Union[str, date, None]
+
+
+def day_key(run_date: DateLike = None) -> str:
+    """'YYYY_MM_DD' for a date or a 'YYYY-MM-DD' / 'YYYY_MM_DD' string; today when None."""
+    if run_date is None:
+        run_date = date.today()
+    if isinstance(run_date, date):
+        return run_date.strftime("%Y_%m_%d")
+    return str(run_date).replace('-', '_')
 
-CHART_DIR = PROJECT_ROOT / "Data_Output/Matplotlib_Charts"
 
+def input_file(run_date: DateLike = None) -> Path:
+    return RAW_DIR / f"raw_headlines_data_{day_key(run_date)}.csv"
 
-def load_cumulative_entities(entities_dir: Path) -> pd.DataFrame:
-    """Load all entity CSVs in the directory and merge them into one DataFrame."""
-    all_files = glob.glob(os.path.join(entities_dir, "processed_entities_final_*.csv"))
-    
-    if not all_files:
-        return pd.DataFrame()
-        
-    df_list = []
-    for filename in all_files:
-        try:
-            df_list.append(pd.read_csv(filename))
-        except pd.errors.EmptyDataError:
-            continue
-        
-    if not df_list:
-        return pd.DataFrame()
-        
-    return pd.concat(df_list, ignore_index=True)
+
+def output_files(run_date: DateLike = None) -> Tuple[Path, Path]:
+    """(headlines CSV, entities CSV) written for the day."""
+    day = day_key(run_date)
+    return OUTPUT_DIR / f"processed_data_final_{day}.csv", OUTPUT_DIR / f"processed_entities_final_{day}.csv"
+
+
+def days_between(start: DateLike, end: DateLike) -> List[str]:
+    """Every day from start to end inclusive, as day keys."""
+    first = datetime.strptime(day_key(start), "%Y_%m_%d").date()
+    last = datetime.strptime(day_key(end), "%Y_%m_%d").date()
+    return [day_key(first + timedelta(days=i)) for i in range((last - first).days + 1)]
 
 
 def load_and_clean_data(input_filepath: Path) -> Tuple[Optional[pd.DataFrame], Optional[pd.DataFrame]]:
@@ -77,77 +85,110 @@ def load_and_clean_data(input_filepath: Path) -> Tuple[Optional[pd.DataFrame], O
             return 'Other'
         df['Source_Name'] = df['Source_URL'].apply(clean_source)
 
-    df['Entities_List'] = df['Entities_Raw'].apply(lambda x: ast.literal_eval(x) if pd.notna(x) and x.strip() else [])
-
-    entities_df = df.explode('Entities_List').dropna(subset=['Entities_List'])
-    entities_df[['Entity', 'Label']] = pd.DataFrame(
-        entities_df['Entities_List'].tolist(), index=entities_df.index
-    )
-    df_entities_clean = entities_df[['Source_Name', 'Entity', 'Label', 'Scrape_Date']].copy()
+    # JSON (current) and tuple-repr (legacy) Entities_Raw cells decode the same way,
+    # straight into flat arrays; rows[i] is the headline entity i belongs to.
+    rows, entities, labels = entity_arrays(df['Entities_Raw'])
+    df_entities_clean = pd.DataFrame({
+        'Source_Name': df['Source_Name'].to_numpy()[rows],
+        'Entity': entities,
+        'Label': labels,
+        'Scrape_Date': df['Scrape_Date'].to_numpy()[rows],
+    }, index=df.index[rows])
 
     df_headlines_clean = df[['Source_Name', 'Original_Headline', 'Translated_Headline', 'Polarity','Scrape_Date']].copy()
 
     return df_headlines_clean, df_entities_clean
 
 
-def generate_visualizations(df_headlines, df_entities_cumulative, chart_dir):
-    pathlib.Path(chart_dir).mkdir(parents=True, exist_ok=True)
-    
-    sentiment_summary = df_headlines.groupby('Source_Name')['Polarity'].mean().sort_values()
-
-    plt.figure(figsize=(10, 6))
-    sentiment_summary.plot(kind='bar', color=['#4CAF50' if p > 0 else '#FF5722' for p in sentiment_summary.values])
-    plt.title('Average Sentiment Polarity by News Source (Daily Score)', fontsize=14)
-    plt.ylabel('Average Polarity')
-    plt.xlabel('News Source')
-    plt.xticks(rotation=45, ha='right')
-    plt.grid(axis='y', linestyle='--', alpha=0.7)
-    plt.tight_layout()
-    plt.savefig(os.path.join(chart_dir, f'sentiment_by_source_{today}.png')) 
-    plt.close()
-
-    if not df_entities_cumulative.empty:
-        top_entities = df_entities_cumulative[df_entities_cumulative['Label'].isin(['ORG', 'PERSON', 'GPE'])]['Entity'].value_counts().head(10)
-
-        plt.figure(figsize=(10, 6))
-        top_entities.sort_values().plot(kind='barh', color='#2196F3')
-        plt.title('Top 10 Named Entities (Cumulative)', fontsize=14)
-        plt.xlabel('Frequency')
-        plt.ylabel('Entity Name')
-        plt.grid(axis='x', linestyle='--', alpha=0.7)
-        plt.tight_layout()
-        plt.savefig(os.path.join(chart_dir, 'top_entities.png'))
-        plt.close()
-
-
-def run_analysis_pipeline():
-    df_headlines, df_entities = load_and_clean_data(INPUT_FILE)
-
-    if df_headlines is None:
+def generate_visualizations(df_headlines, top_entities, chart_dir, run_date: DateLike = None):
+    """Daily sentiment-by-source and cumulative top-entities charts; unchanged ones are skipped."""
+    jobs = [sentiment_by_source_job(df_headlines, day_key(run_date)), top_entities_job(top_entities)]
+    return render_charts(jobs, chart_dir)
+
+
+def _write_csv_atomic(df: pd.DataFrame, path: Path) -> None:
+    """Write to a temp file and rename, so readers never see a half-written day."""
+    tmp_path = f"{path}.tmp"
+    df.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def process_day(run_date: DateLike) -> Tuple[str, Optional[pd.DataFrame], Optional[pd.DataFrame]]:
+    """Clean one day's raw CSV and write its processed CSVs. Touches nothing shared, so days can run in parallel."""
+    day = day_key(run_date)
+    df_headlines, df_entities = load_and_clean_data(input_file(day))
+    if df_headlines is not None:
+        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        headlines_file, entities_file = output_files(day)
+        _write_csv_atomic(df_headlines, headlines_file)
+        _write_csv_atomic(df_entities, entities_file)
+    return day, df_headlines, df_entities
+
+
+def _process_days(days: List[str], max_workers: int) -> List[Tuple[str, Optional[pd.DataFrame], Optional[pd.DataFrame]]]:
+    if len(days) == 1 or max_workers <= 1:
+        return [process_day(day) for day in days]
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(days))) as pool:
+        return list(pool.map(process_day, days))
+
+
+def run_analysis_pipeline(run_date: DateLike = None, end_date: DateLike = None,
+                          max_workers: int = ANALYSIS_WORKERS):
+    """Process one day (today by default), or every day from run_date to end_date.
+
+    Days are cleaned in parallel; the shared outputs (entity totals, charts,
+    Parquet dataset) are then updated once from the main process. Returns the
+    (headlines, entities) frames, concatenated over the range; (None, None)
+    when no day had data.
+    """
+    days = days_between(run_date, end_date) if end_date is not None else [day_key(run_date)]
+    if len(days) > 1:
+        days = [day for day in days if input_file(day).exists()]
+    results = [r for r in _process_days(days, max_workers) if r[1] is not None]
+    if not results:
         return None, None
 
-    df_headlines.to_csv(OUTPUT_FILE, index=False)
-    df_entities.to_csv(ENTITIES_OUTPUT_FILE, index=False)
+    # Fold the days' entities into the running totals; days not yet ingested
+    # (first run, or files produced elsewhere) are caught up from their CSVs.
+    entity_store = get_entity_store()
+    entity_store.sync_directory(OUTPUT_DIR, skip=[day for day, _, _ in results])
+    for day, _, df_entities in results:
+        entities_csv = output_files(day)[1]
+        entity_store.fold(day, df_entities, stat_fingerprint(entities_csv), content_digest(entities_csv))
 
-    df_entities_cumulative = load_cumulative_entities(OUTPUT_DIR)
-    
-    generate_visualizations(df_headlines, df_entities_cumulative, CHART_DIR)
+    jobs = [sentiment_by_source_job(df_headlines, day) for day, df_headlines, _ in results]
+    render_charts(jobs + [top_entities_job(entity_store.top_entities(10))], CHART_DIR)
 
-    # Generate dashboard JSON data
-    try:
-        from Data_Processing.data_aggregator import generate_dashboard_data
-        print("\n[STEP 2.5] Generating dashboard JSON data...")
-        generate_dashboard_data()
-    except ImportError:
-        try:
-            from data_aggregator import generate_dashboard_data
-            print("\n[STEP 2.5] Generating dashboard JSON data...")
-            generate_dashboard_data()
-        except ImportError:
-            print("  [WARNING] data_aggregator module not found, skipping JSON generation.")
+    # Keep the Parquet copy of the history current (a no-op without pyarrow).
+    for table in TABLES:
+        sync_table(table)
+
+    if len(results) == 1:
+        _, df_headlines, df_entities = results[0]
+    else:
+        df_headlines = pd.concat([r[1] for r in results], ignore_index=True)
+        df_entities = pd.concat([r[2] for r in results], ignore_index=True)
 
     return df_headlines, df_entities
 
 
 if __name__ == "__main__":
-    run_analysis_pipeline()
\ No newline at end of file
+    import argparse
+    import time
+
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Clean raw headline CSVs and draw the charts.")
+    parser.add_argument("--date", help="day to process, YYYY_MM_DD or YYYY-MM-DD (default: today)")
+    parser.add_argument("--backfill", nargs=2, metavar=("START", "END"), help="process every day in the range")
+    parser.add_argument("--workers", type=int, default=ANALYSIS_WORKERS)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    if args.backfill:
+        df_h, df_e = run_analysis_pipeline(*args.backfill, max_workers=args.workers)
+    else:
+        df_h, df_e = run_analysis_pipeline(args.date, max_workers=args.workers)
+    if df_h is None:
+        print("[DONE] No raw data for the requested date(s).")
+    else:
+        print(f"[DONE] {len(df_h)} headlines, {len(df_e)} entities in {time.perf_counter() - started:.2f}s")
\ No newline at end of file
@@ -0,0 +1,203 @@
+"""
+Chart Rendering Module
+Renders the pipeline's Matplotlib charts as independent jobs. Each job's
+input series is hashed and the hash recorded next to the PNGs, so a chart
+whose inputs have not changed since its last render is skipped. Charts
+that do need drawing are rendered in a process pool.
+
+Backfill missing daily charts:
+    python -m Data_Processing.charts --backfill 2026_05_01 2026_08_31
+"""
+
+import os
+import json
+import hashlib
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# ── Project root resolved from this file's location ───────────
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+CHART_DIR = PROJECT_ROOT / "Data_Output/Matplotlib_Charts"
+CHART_WORKERS = int(os.environ.get('CHART_WORKERS', min(4, os.cpu_count() or 1)))
+HASHES_NAME = '.chart_inputs.json'
+# Part of every input hash: bump it when a chart's styling changes so every PNG is redrawn.
+CHART_STYLE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ChartJob:
+    """One PNG: which renderer draws it, and the (label, value) series it plots."""
+    kind: str
+    filename: str
+    points: Tuple[Tuple[str, float], ...]
+
+    def input_hash(self) -> str:
+        payload = json.dumps([CHART_STYLE_VERSION, self.kind, self.points], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _series_points(series: pd.Series) -> Tuple[Tuple[str, float], ...]:
+    return tuple((str(label), float(value)) for label, value in series.items())
+
+
+def sentiment_by_source_job(df_headlines: pd.DataFrame, day: str) -> ChartJob:
+    """Average polarity per source for one day's headlines."""
+    summary = df_headlines.groupby('Source_Name')['Polarity'].mean().sort_values()
+    return ChartJob('sentiment_by_source', f'sentiment_by_source_{day}.png', _series_points(summary))
+
+
+def top_entities_job(top_entities: pd.Series) -> Optional[ChartJob]:
+    """Cumulative top-N entities; None when there are none yet."""
+    if top_entities.empty:
+        return None
+    return ChartJob('top_entities', 'top_entities.png', _series_points(top_entities))
+
+
+# ── Renderers (run in worker processes) ────────────────────────────────────
+
+def _render_sentiment_by_source(job: ChartJob, path: str) -> None:
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    summary = pd.Series(dict(job.points), dtype=float)
+    plt.figure(figsize=(10, 6))
+    summary.plot(kind='bar', color=['#4CAF50' if p > 0 else '#FF5722' for p in summary.values])
+    plt.title('Average Sentiment Polarity by News Source (Daily Score)', fontsize=14)
+    plt.ylabel('Average Polarity')
+    plt.xlabel('News Source')
+    plt.xticks(rotation=45, ha='right')
+    plt.grid(axis='y', linestyle='--', alpha=0.7)
+    plt.tight_layout()
+    plt.savefig(path)
+    plt.close()
+
+
+def _render_top_entities(job: ChartJob, path: str) -> None:
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    top_entities = pd.Series(dict(job.points), dtype=float)
+    plt.figure(figsize=(10, 6))
+    top_entities.sort_values().plot(kind='barh', color='#2196F3')
+    plt.title('Top 10 Named Entities (Cumulative)', fontsize=14)
+    plt.xlabel('Frequency')
+    plt.ylabel('Entity Name')
+    plt.grid(axis='x', linestyle='--', alpha=0.7)
+    plt.tight_layout()
+    plt.savefig(path)
+    plt.close()
+
+
+RENDERERS = {
+    'sentiment_by_source': _render_sentiment_by_source,
+    'top_entities': _render_top_entities,
+}
+
+
+def _render(job: ChartJob, path: str) -> str:
+    """Draw into a temp file and rename, so a crashed worker never leaves a half-written PNG."""
+    tmp_path = f"{path}.tmp.png"
+    RENDERERS[job.kind](job, tmp_path)
+    os.replace(tmp_path, path)
+    return job.filename
+
+
+# ── Rendering stage ────────────────────────────────────────────────────────
+
+def _load_hashes(chart_dir: str) -> Dict[str, str]:
+    path = os.path.join(chart_dir, HASHES_NAME)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_hashes(chart_dir: str, hashes: Dict[str, str]) -> None:
+    path = os.path.join(chart_dir, HASHES_NAME)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(dict(sorted(hashes.items())), f, indent=1)
+    os.replace(tmp_path, path)
+
+
+def render_charts(jobs: Sequence[Optional[ChartJob]], chart_dir=CHART_DIR,
+                  max_workers: int = CHART_WORKERS) -> Dict[str, List[str]]:
+    """Render every job whose inputs changed since its PNG was drawn.
+
+    Returns {'rendered': [...], 'skipped': [...]} file names.
+    """
+    chart_dir = str(chart_dir)
+    os.makedirs(chart_dir, exist_ok=True)
+    hashes = _load_hashes(chart_dir)
+    todo, skipped = [], []
+    for job in filter(None, jobs):
+        digest = job.input_hash()
+        if hashes.get(job.filename) == digest and os.path.exists(os.path.join(chart_dir, job.filename)):
+            skipped.append(job.filename)
+        else:
+            todo.append((job, digest))
+
+    rendered = []
+    if len(todo) == 1 or max_workers <= 1:
+        # A pool's start-up costs more than drawing a single figure.
+        for job, digest in todo:
+            rendered.append(_render(job, os.path.join(chart_dir, job.filename)))
+            hashes[job.filename] = digest
+    elif todo:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(todo))) as pool:
+            futures = {pool.submit(_render, job, os.path.join(chart_dir, job.filename)): (job, digest)
+                       for job, digest in todo}
+            for future, (job, digest) in futures.items():
+                try:
+                    rendered.append(future.result())
+                    hashes[job.filename] = digest
+                except Exception as e:
+                    logger.error(f"Chart {job.filename} failed: {e}")
+    if rendered:
+        _save_hashes(chart_dir, hashes)
+    logger.info(f"Charts: {len(rendered)} rendered, {len(skipped)} unchanged")
+    return {'rendered': rendered, 'skipped': skipped}
+
+
+def backfill_daily_charts(start: Optional[str] = None, end: Optional[str] = None, chart_dir=CHART_DIR,
+                          max_workers: int = CHART_WORKERS) -> Dict[str, List[str]]:
+    """Render the sentiment_by_source chart of every day in [start, end] that is missing or stale."""
+    try:
+        from Data_Processing.dataset import read_table
+    except ImportError:
+        from dataset import read_table
+
+    df = read_table('headlines', columns=['Source_Name', 'Polarity', 'Scrape_Date'], start=start, end=end)
+    if df.empty:
+        return {'rendered': [], 'skipped': []}
+    jobs = [sentiment_by_source_job(day_df, str(day)) for day, day_df in df.groupby('Scrape_Date', sort=True)]
+    return render_charts(jobs, chart_dir, max_workers)
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Render missing or stale pipeline charts.")
+    parser.add_argument("--backfill", nargs=2, metavar=("START", "END"), required=True,
+                        help="date range, YYYY_MM_DD or YYYY-MM-DD")
+    parser.add_argument("--workers", type=int, default=CHART_WORKERS)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    result = backfill_daily_charts(*args.backfill, max_workers=args.workers)
+    print(f"[DONE] {len(result['rendered'])} charts rendered, {len(result['skipped'])} unchanged "
+          f"in {time.perf_counter() - started:.2f}s")
@@ -6,7 +6,6 @@ Generates: daily_summary, weekly_reports, monthly_reports, entities, geo_data, r
 
 import os
 import json
-import glob
 import logging
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -17,20 +16,31 @@ try:
     # Try relative import first
     import Data_Processing.summary_generator as summary_generator
     generate_all_briefings = summary_generator.generate_all_briefings
+    briefing_input_state = summary_generator.briefing_input_state
     SOURCE_REGION_MAP = summary_generator.SOURCE_REGION_MAP
 except ImportError:
     try:
         # Try local import
         import summary_generator
         generate_all_briefings = summary_generator.generate_all_briefings
+        briefing_input_state = summary_generator.briefing_input_state
         SOURCE_REGION_MAP = summary_generator.SOURCE_REGION_MAP
     except ImportError:
         print("  [AGGREGATOR] CRITICAL: summary_generator module not found.")
         generate_all_briefings = None
+        briefing_input_state = None
         SOURCE_REGION_MAP = {}
 
+import numpy as np
 import pandas as pd
 
+try:
+    from Data_Processing.dataset import csv_files, read_table
+    from Data_Processing.run_manifest import file_fingerprint, get_run_manifest, input_version
+except ImportError:
+    from dataset import csv_files, read_table
+    from run_manifest import file_fingerprint, get_run_manifest, input_version
+
 logger = logging.getLogger(__name__)
 
 # ── Project root resolved from this file's location ───────────
@@ -106,30 +116,6 @@ def _parse_date(date_str):
         return None
 
 
-def _load_all_csvs(directory, prefix):
-    """Load all CSVs matching a prefix from a directory into a single DataFrame."""
-    pattern = os.path.join(directory, f"{prefix}*.csv")
-    files = sorted(glob.glob(pattern))
-
-    if not files:
-        return pd.DataFrame()
-
-    frames = []
-    for f in files:
-        try:
-            df = pd.read_csv(f, on_bad_lines='skip')
-            if not df.empty:
-                frames.append(df)
-        except Exception as e:
-            print(f"  [AGGREGATOR] Skipping corrupt file: {os.path.basename(f)} ({e})")
-            continue
-
-    if not frames:
-        return pd.DataFrame()
-
-    return pd.concat(frames, ignore_index=True)
-
-
 def _sentiment_label(polarity):
     """Classify polarity into sentiment category."""
     if polarity > 0.05:
@@ -171,6 +157,33 @@ def _generate_executive_summary(df_period, df_prev_period, period_label):
     return summary
 
 
+def _sentiment_labels(polarity: pd.Series) -> np.ndarray:
+    """Vectorized _sentiment_label over a whole Polarity column (NaN -> Neutral, as there)."""
+    return np.select([polarity > 0.05, polarity < -0.05], ['Positive', 'Negative'], default='Neutral')
+
+
+def _top_entities_by_date(df_entities, n=5):
+    """date -> {entity: count} of each day's n most frequent entities.
+
+    Same order as Counter.most_common(n) on the day's entities: count
+    descending, ties by first appearance.
+    """
+    if df_entities is None or df_entities.empty or 'Scrape_Date' not in df_entities.columns \
+            or 'Entity' not in df_entities.columns:
+        return {}
+    ents = df_entities.loc[df_entities['Scrape_Date'].notna(), ['Scrape_Date', 'Entity']]
+    # sort=False keeps each (date, entity) group in order of first appearance;
+    # a stable sort on the count then breaks ties the way Counter does.
+    counts = ents.groupby(['Scrape_Date', 'Entity'], sort=False, dropna=False).size().reset_index(name='count')
+    counts = counts.sort_values('count', ascending=False, kind='stable')
+    top = counts.groupby('Scrape_Date', sort=False).head(n)
+
+    by_date = {}
+    for date, entity, count in zip(top['Scrape_Date'].tolist(), top['Entity'].tolist(), top['count'].tolist()):
+        by_date.setdefault(date, {})[entity] = int(count)
+    return by_date
+
+
 def _build_daily_summary(df_headlines, df_entities=None):
     """Build per-date, per-source aggregated stats with sentiment breakdown and top entities."""
     if df_headlines.empty:
@@ -182,28 +195,46 @@ def _build_daily_summary(df_headlines, df_entities=None):
     ).reset_index()
 
     result = {}
-    for _, row in grouped.iterrows():
-        date_key = str(row['Scrape_Date'])
+    for date, source, count, avg in zip(grouped['Scrape_Date'].tolist(), grouped['Source_Name'].tolist(),
+                                        grouped['count'].tolist(), grouped['avg_polarity'].tolist()):
+        date_key = str(date)
         if date_key not in result:
             result[date_key] = {'date': date_key, 'sources': {}}
 
-        result[date_key]['sources'][row['Source_Name']] = {
-            'count': int(row['count']),
-            'avg_polarity': round(float(row['avg_polarity']), 4)
+        result[date_key]['sources'][source] = {
+            'count': int(count),
+            'avg_polarity': round(float(avg), 4)
         }
 
-    # Add totals, sentiment breakdown, and top entities per day
+    # Day totals and sentiment breakdown, all days in one grouped pass
+    labels = _sentiment_labels(df_headlines['Polarity'])
+    day_stats = pd.DataFrame({
+        'Scrape_Date': df_headlines['Scrape_Date'],
+        'Polarity': df_headlines['Polarity'],
+        'positive': labels == 'Positive',
+        'neutral': labels == 'Neutral',
+        'negative': labels == 'Negative',
+    }).groupby('Scrape_Date').agg(
+        total=('Polarity', 'size'),
+        avg_polarity=('Polarity', 'mean'),
+        positive=('positive', 'sum'),
+        neutral=('neutral', 'sum'),
+        negative=('negative', 'sum'),
+    )
+    day_stats = dict(zip(day_stats.index.tolist(), day_stats.to_dict('records')))
+    top_entities = _top_entities_by_date(df_entities)
+    no_rows = {'total': 0, 'avg_polarity': float('nan'), 'positive': 0, 'neutral': 0, 'negative': 0}
+
     for date_key, data in result.items():
-        day_df = df_headlines[df_headlines['Scrape_Date'] == date_key]
-        total = len(day_df)
+        stats = day_stats.get(date_key, no_rows)
+        total = int(stats['total'])
         data['total_headlines'] = total
-        data['avg_polarity'] = round(float(day_df['Polarity'].mean()), 4)
+        data['avg_polarity'] = round(float(stats['avg_polarity']), 4)
 
         # Sentiment distribution
-        sentiments = day_df['Polarity'].apply(_sentiment_label).value_counts()
-        pos = int(sentiments.get('Positive', 0))
-        neu = int(sentiments.get('Neutral', 0))
-        neg = int(sentiments.get('Negative', 0))
+        pos = int(stats['positive'])
+        neu = int(stats['neutral'])
+        neg = int(stats['negative'])
         data['sentiment_distribution'] = {
             'positive': pos,
             'neutral': neu,
@@ -220,15 +251,7 @@ def _build_daily_summary(df_headlines, df_entities=None):
             data['most_negative_source'] = min(src_sent, key=lambda s: src_sent[s]['avg_polarity'])
 
         # Top 5 entities for this day
-        if df_entities is not None and not df_entities.empty and 'Scrape_Date' in df_entities.columns:
-            day_ents = df_entities[df_entities['Scrape_Date'] == date_key]
-            if not day_ents.empty and 'Entity' in day_ents.columns:
-                ent_counts = Counter(day_ents['Entity'].tolist())
-                data['top_entities'] = dict(ent_counts.most_common(5))
-            else:
-                data['top_entities'] = {}
-        else:
-            data['top_entities'] = {}
+        data['top_entities'] = top_entities.get(date_key, {})
 
     return list(result.values())
 
@@ -455,17 +478,47 @@ def _build_recent_headlines(df_headlines, days=7):
     return records
 
 
-def generate_dashboard_data(force_summaries: bool = False) -> None:
-    """Main entry point: reads all CSVs and writes dashboard_data.json."""
+def dashboard_input_version(cleaned_dir: str) -> str:
+    """Version of everything dashboard_data.json is built from.
+
+    The processed CSVs, plus the calendar day (daily briefings, records_today)
+    and what the briefings read: whether a Gemini key is configured (env or
+    .env) and the state of the headline databases.
+    """
+    files = [path for table in ('headlines', 'entities') for path in csv_files(table, cleaned_dir).values()]
+    briefings = briefing_input_state() if generate_all_briefings and briefing_input_state else None
+    return input_version(file_fingerprint(files), datetime.now().strftime('%Y_%m_%d'), briefings)
+
+
+def generate_dashboard_data(force_summaries: bool = False, force: bool = False) -> Dict[str, Any]:
+    """Main entry point: reads all CSVs, writes dashboard_data.json and returns its contents.
+
+    Runs once per input version: when nothing it reads has changed since the
+    last build today, the existing JSON is reused. A build with a failed
+    briefing is not recorded, so the next run retries it.
+    """
     cleaned_dir = str(PROJECT_ROOT / 'cleaned_csv_daily')
     output_dir = str(PROJECT_ROOT / 'Data_Output')
+    output_path = os.path.join(output_dir, 'dashboard_data.json')
+
+    manifest = get_run_manifest()
+    version = dashboard_input_version(cleaned_dir)
+    if not (force or force_summaries) and manifest.is_current('dashboard_data', version):
+        try:
+            with open(output_path, encoding='utf-8') as f:
+                dashboard_data = json.load(f)
+            print(f"  [AGGREGATOR] Inputs unchanged since the last build; reusing {output_path}")
+            return dashboard_data
+        except (OSError, ValueError) as e:
+            print(f"  [AGGREGATOR] Cannot reuse {output_path} ({e}); rebuilding.")
     os.makedirs(output_dir, exist_ok=True)
+    briefings_failed = False
 
-    print("  [AGGREGATOR] Loading all processed headline CSVs...")
-    df_headlines = _load_all_csvs(cleaned_dir, 'processed_data_final_')
+    print("  [AGGREGATOR] Loading processed headline history...")
+    df_headlines = read_table('headlines', csv_dir=cleaned_dir)
 
-    print("  [AGGREGATOR] Loading all processed entity CSVs...")
-    df_entities = _load_all_csvs(cleaned_dir, 'processed_entities_final_')
+    print("  [AGGREGATOR] Loading processed entity history...")
+    df_entities = read_table('entities', csv_dir=cleaned_dir)
 
     if df_headlines.empty:
         print("  [AGGREGATOR] WARNING: No headline data found. Writing empty JSON.")
@@ -513,6 +566,8 @@ def generate_dashboard_data(force_summaries: bool = False) -> None:
                 briefings = generate_all_briefings(force_regenerate=force_summaries)
             except Exception as e:
                 print(f"  [AGGREGATOR] Briefing generation failed: {e}")
+                briefings_failed = True
+            briefings_failed |= any(str(b.get('briefing', '')).startswith('Error:') for b in briefings.values())
 
         # Build the reports structure with briefings + supporting entity data
         top_entity_list = entity_data.get('entities', [])[:10]
@@ -572,9 +627,14 @@ def generate_dashboard_data(force_summaries: bool = False) -> None:
             }
         }
 
-    output_path = os.path.join(output_dir, 'dashboard_data.json')
-    with open(output_path, 'w', encoding='utf-8') as f:
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
         json.dump(dashboard_data, f, ensure_ascii=False, default=str)
+    os.replace(tmp_path, output_path)
+    if briefings_failed:
+        print("  [AGGREGATOR] A briefing failed; the next run will rebuild instead of reusing this JSON.")
+    else:
+        manifest.record('dashboard_data', version, [output_path])
 
     print(f"  [AGGREGATOR] Dashboard data written to {output_path}")
     print(f"  [AGGREGATOR] JSON size: {os.path.getsize(output_path) / 1024:.1f} KB")
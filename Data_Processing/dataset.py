@@ -0,0 +1,355 @@
+"""
+Partitioned Dataset Module
+Columnar (Parquet) copy of the pipeline's per-day CSVs, kept alongside them:
+  raw_headlines  <- raw_csv_daily/raw_headlines_data_<date>.csv
+  headlines      <- cleaned_csv_daily/processed_data_final_<date>.csv
+  entities       <- cleaned_csv_daily/processed_entities_final_<date>.csv
+Each table is one Parquet file per month (month=YYYY_MM/part.parquet) with
+typed columns and dictionary-encoded low-cardinality strings. read_table()
+scans it with column projection and date-range pushdown, and reads the CSV
+of any day the dataset does not hold yet (or holds an older copy of), so
+callers always get the full, current history. A CSV counts as unchanged when
+its (mtime, size) or, failing that, its content digest matches, so a fresh
+checkout of the CSVs does not re-migrate them. A day whose CSV has been
+deleted is no longer served, and the next sync drops it. Without pyarrow
+it reads the CSVs alone, exactly as before.
+
+Migrate / compact:  python -m Data_Processing.dataset [--rebuild]
+"""
+
+import os
+import re
+import json
+import hashlib
+import time
+import logging
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# ── Project root resolved from this file's location ───────────
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+DATASET_DIR = os.environ.get('DATASET_DIR', str(PROJECT_ROOT / "Data_Output" / "dataset"))
+# Day a row belongs to, taken from its CSV's file name. Older entity files
+# have no Scrape_Date column, so this is the one date every row carries.
+DATE_COLUMN = '_file_date'
+MANIFEST_NAME = '_manifest.json'
+
+# ── Table definitions: (csv dir, file prefix, [(column, kind)]) ───────────
+# kind: 'string', 'category' (dictionary-encoded) or 'float'.
+TABLES: Dict[str, Tuple[str, str, List[Tuple[str, str]]]] = {
+    'raw_headlines': ('raw_csv_daily', 'raw_headlines_data_', [
+        ('Scrape_Date', 'string'), ('Source_Name', 'category'), ('Source_URL', 'category'),
+        ('Source_Language_Code', 'category'), ('Source_Region', 'category'), ('Original_Headline', 'string'),
+        ('Translated_Headline', 'string'), ('Polarity', 'float'), ('Sentiment_Label', 'category'),
+        ('Entities_Raw', 'string'),
+    ]),
+    'headlines': ('cleaned_csv_daily', 'processed_data_final_', [
+        ('Source_Name', 'category'), ('Original_Headline', 'string'), ('Translated_Headline', 'string'),
+        ('Polarity', 'float'), ('Scrape_Date', 'string'),
+    ]),
+    'entities': ('cleaned_csv_daily', 'processed_entities_final_', [
+        ('Source_Name', 'category'), ('Entity', 'string'), ('Label', 'category'), ('Scrape_Date', 'string'),
+    ]),
+}
+
+DateLike = Union[str, date, None]
+
+
+def _pyarrow():
+    """(pyarrow, pyarrow.parquet, pyarrow.dataset, pyarrow.compute), or None when not installed."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        import pyarrow.dataset as ds
+        import pyarrow.compute as pc
+    except ImportError:
+        return None
+    return pa, pq, ds, pc
+
+
+def _day(value: DateLike) -> Optional[str]:
+    """'YYYY_MM_DD' for a date, 'YYYY-MM-DD' or 'YYYY_MM_DD' string; None passes through."""
+    if value is None:
+        return None
+    if isinstance(value, date):
+        return value.strftime('%Y_%m_%d')
+    return str(value).replace('-', '_')
+
+
+def _as_date(day: str) -> date:
+    return datetime.strptime(day, '%Y_%m_%d').date()
+
+
+def _csv_dir(table: str, csv_dir: Optional[str] = None) -> str:
+    return os.path.abspath(csv_dir or PROJECT_ROOT / TABLES[table][0])
+
+
+def csv_files(table: str, csv_dir: Optional[str] = None) -> Dict[str, str]:
+    """Date -> CSV path for every daily file of `table`, in date order."""
+    prefix = TABLES[table][1]
+    directory = _csv_dir(table, csv_dir)
+    pattern = re.compile(rf"{re.escape(prefix)}(\d{{4}}_\d{{2}}_\d{{2}})\.csv$")
+    names = sorted(os.listdir(directory)) if os.path.isdir(directory) else []
+    return {m.group(1): os.path.join(directory, name) for name in names if (m := pattern.match(name))}
+
+
+def _read_csv(path: str, columns: Optional[Sequence[str]] = None) -> Optional[pd.DataFrame]:
+    """One day's CSV (bad lines skipped), or None when it is empty or unreadable."""
+    usecols = (lambda c: c in columns) if columns is not None else None
+    try:
+        df = pd.read_csv(path, on_bad_lines='skip', usecols=usecols)
+    except Exception as e:
+        logger.error(f"Skipping {os.path.basename(path)}: {e}")
+        return None
+    return None if df.empty else df
+
+
+def _signature(path: str) -> Tuple[float, int]:
+    stat = os.stat(path)
+    return stat.st_mtime, stat.st_size
+
+
+def _digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class PartitionedDataset:
+    """Month-partitioned Parquet tables under `root`, plus a manifest of the CSV each day came from."""
+
+    def __init__(self, root: str = DATASET_DIR):
+        self.root = Path(root)
+
+    # ── Manifest ───────────────────────────────────────────────────────────
+
+    def _manifest_path(self, table: str) -> Path:
+        return self.root / table / MANIFEST_NAME
+
+    def manifest(self, table: str) -> Dict[str, Dict]:
+        """Date -> {'source', 'mtime', 'size', 'digest', 'rows', 'columns'} for every day stored."""
+        path = self._manifest_path(table)
+        if not path.exists():
+            return {}
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+
+    def _save_manifest(self, table: str, manifest: Dict[str, Dict]) -> None:
+        path = self._manifest_path(table)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(dict(sorted(manifest.items())), f, indent=1)
+        os.replace(tmp_path, path)
+
+    def _fresh_days(self, table: str, csvs: Dict[str, str], directory: str) -> List[str]:
+        """Days the dataset can serve for `directory`: same source CSV, still there and unchanged.
+
+        A CSV whose mtime alone moved (a fresh checkout) is hashed and compared
+        with the digest it was migrated with.
+        """
+        fresh = []
+        for day, entry in self.manifest(table).items():
+            if os.path.dirname(entry['source']) != directory:
+                continue
+            path = csvs.get(day)
+            if path is None:
+                continue
+            mtime, size = _signature(path)
+            if size == entry['size'] and (mtime == entry['mtime'] or entry.get('digest') == _digest(path)):
+                fresh.append(day)
+        return fresh
+
+    # ── Writing ────────────────────────────────────────────────────────────
+
+    def _schema(self, table: str):
+        pa = _pyarrow()[0]
+        kinds = {'string': pa.string(), 'category': pa.dictionary(pa.int32(), pa.string()), 'float': pa.float64()}
+        fields = [(name, kinds[kind]) for name, kind in TABLES[table][2]]
+        return pa.schema(fields + [(DATE_COLUMN, pa.date32())])
+
+    def _to_arrow(self, table: str, day: str, df: pd.DataFrame):
+        pa = _pyarrow()[0]
+        names = [name for name, _ in TABLES[table][2]]
+        df = df.reindex(columns=names)
+        for name, kind in TABLES[table][2]:
+            if kind == 'float':
+                df[name] = pd.to_numeric(df[name], errors='coerce')
+            else:
+                df[name] = df[name].astype('string')
+        df[DATE_COLUMN] = _as_date(day)
+        # No pandas metadata: reads should come back with the default dtypes, as from read_csv.
+        return pa.Table.from_pandas(df, schema=self._schema(table), preserve_index=False).replace_schema_metadata()
+
+    def _write_month(self, table: str, month: str, days: Dict[str, Optional[pd.DataFrame]]) -> None:
+        """Replace `days` inside one month's file; rows stay sorted by day."""
+        pa, pq, _, pc = _pyarrow()
+        path = self.root / table / f"month={month}" / "part.parquet"
+        parts = []
+        if path.exists():
+            existing = pq.read_table(path)
+            replaced = pa.array([_as_date(d) for d in days], pa.date32())
+            parts.append(existing.filter(pc.invert(pc.is_in(existing[DATE_COLUMN], value_set=replaced))))
+        parts.extend(self._to_arrow(table, day, df) for day, df in days.items() if df is not None)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        combined = pa.concat_tables(parts).sort_by(DATE_COLUMN) if parts else self._schema(table).empty_table()
+        tmp_path = f"{path}.tmp"
+        pq.write_table(combined, tmp_path, compression='zstd')
+        os.replace(tmp_path, path)
+
+    def sync(self, table: str, csv_dir: Optional[str] = None, rebuild: bool = False) -> int:
+        """Copy new or changed daily CSVs into the dataset. Returns the number of days written.
+
+        Days whose CSV has been deleted are dropped. Each touched month file is
+        rewritten once; `rebuild` re-reads every CSV (the one-shot migration /
+        compaction).
+        """
+        if _pyarrow() is None:
+            return 0
+        csvs = csv_files(table, csv_dir)
+        directory = _csv_dir(table, csv_dir)
+        manifest = {} if rebuild else self.manifest(table)
+        deleted = [day for day, entry in manifest.items()
+                   if os.path.dirname(entry['source']) == directory and day not in csvs]
+        if not csvs and not deleted:
+            return 0
+        if rebuild:
+            for old in self.root.joinpath(table).glob("month=*/part.parquet"):
+                old.unlink()
+        fresh = set(self._fresh_days(table, csvs, directory)) if not rebuild else set()
+        stale = [day for day in csvs if day not in fresh]
+        # Unchanged content under a new mtime: record the mtime so the next run only stats the file.
+        restamped = [day for day in fresh if _signature(csvs[day])[0] != manifest[day]['mtime']]
+        for day in restamped:
+            manifest[day]['mtime'] = _signature(csvs[day])[0]
+
+        by_month: Dict[str, Dict[str, Optional[pd.DataFrame]]] = {}
+        for day in stale:
+            by_month.setdefault(day[:7], {})[day] = _read_csv(csvs[day])
+        for day in deleted:
+            by_month.setdefault(day[:7], {})[day] = None
+        for month, days in by_month.items():
+            self._write_month(table, month, days)
+            for day, df in days.items():
+                if day not in csvs:
+                    del manifest[day]
+                    continue
+                mtime, size = _signature(csvs[day])
+                manifest[day] = {'source': csvs[day], 'mtime': mtime, 'size': size, 'digest': _digest(csvs[day]),
+                                 'rows': 0 if df is None else len(df),
+                                 'columns': [] if df is None else list(df.columns)}
+        if deleted:
+            logger.info(f"{table}: dropped {len(deleted)} day(s) whose CSV was deleted")
+        if stale or deleted or restamped or rebuild:
+            self._save_manifest(table, manifest)
+        return len(stale)
+
+    # ── Reading ────────────────────────────────────────────────────────────
+
+    def read(self, table: str, columns: Optional[Sequence[str]] = None, start: DateLike = None,
+             end: DateLike = None, csv_dir: Optional[str] = None) -> pd.DataFrame:
+        """Rows of `table` for days in [start, end], in day order, as a DataFrame.
+
+        Days the dataset holds come from one Parquet scan (only the requested
+        columns, only the months and row groups in range); any other day is
+        read from its CSV. Columns come in the order concatenating the CSVs
+        would give: each day's header in turn, new columns appended.
+        """
+        start, end = _day(start), _day(end)
+        csvs = {d: p for d, p in csv_files(table, csv_dir).items()
+                if (start is None or d >= start) and (end is None or d <= end)}
+        directory = _csv_dir(table, csv_dir)
+        fresh = [d for d in self._fresh_days(table, csvs, directory)
+                 if (start is None or d >= start) and (end is None or d <= end)] if _pyarrow() else []
+
+        manifest = self.manifest(table) if fresh else {}
+        headers = {day: [c for c in manifest[day].get('columns', []) if columns is None or c in columns]
+                   for day in fresh if manifest[day].get('rows')}
+        pieces = [self._scan(table, columns, fresh)] if fresh else []
+        for day in sorted(set(csvs) - set(fresh)):
+            df = _read_csv(csvs[day], columns)
+            if df is not None:
+                headers[day] = list(df.columns)
+                pieces.append(df.assign(**{DATE_COLUMN: _as_date(day)}))
+        pieces = [df for df in pieces if not df.empty]
+        if not pieces:
+            return pd.DataFrame()
+        combined = pd.concat(pieces, ignore_index=True)
+        if len(pieces) > 1:
+            combined = combined.sort_values(DATE_COLUMN, kind='stable', ignore_index=True)
+        order = list(dict.fromkeys(c for day in sorted(headers) for c in headers[day]))
+        return combined[order]
+
+    def _scan(self, table: str, columns: Optional[Sequence[str]], days: List[str]) -> pd.DataFrame:
+        pa, _, ds, pc = _pyarrow()
+        # Only the columns the source CSVs actually had, as a CSV read would return.
+        manifest = self.manifest(table)
+        present = set().union(*(manifest[d].get('columns', []) for d in days))
+        names = [n for n, _ in TABLES[table][2] if n in present and (columns is None or n in columns)]
+
+        partitioning = ds.partitioning(pa.schema([('month', pa.string())]), flavor='hive')
+        dataset = ds.dataset(str(self.root / table), format='parquet', partitioning=partitioning)
+        wanted = [_as_date(d) for d in days]
+        # The month bounds prune whole files; the date bounds prune row groups by their statistics.
+        predicate = ((ds.field('month') >= min(days)[:7]) & (ds.field('month') <= max(days)[:7])
+                     & (ds.field(DATE_COLUMN) >= min(wanted)) & (ds.field(DATE_COLUMN) <= max(wanted))
+                     & ds.field(DATE_COLUMN).isin(pa.array(wanted, pa.date32())))
+        scanned = dataset.to_table(columns=names + [DATE_COLUMN], filter=predicate)
+        # Consumers expect plain strings, not pandas categoricals.
+        for i, field in enumerate(scanned.schema):
+            if pa.types.is_dictionary(field.type):
+                scanned = scanned.set_column(i, field.name, pc.cast(scanned[field.name], pa.string()))
+        return scanned.to_pandas(date_as_object=True)
+
+
+_dataset: Optional[PartitionedDataset] = None
+
+
+def get_dataset() -> PartitionedDataset:
+    """Process-wide dataset at DATASET_DIR."""
+    global _dataset
+    if _dataset is None:
+        _dataset = PartitionedDataset()
+    return _dataset
+
+
+def read_table(table: str, columns: Optional[Sequence[str]] = None, start: DateLike = None,
+               end: DateLike = None, csv_dir: Optional[str] = None) -> pd.DataFrame:
+    """Full (or date-ranged) history of `table`; see PartitionedDataset.read()."""
+    return get_dataset().read(table, columns, start, end, csv_dir)
+
+
+def sync_table(table: str, csv_dir: Optional[str] = None) -> int:
+    """Bring `table` up to date with its CSVs; see PartitionedDataset.sync()."""
+    return get_dataset().sync(table, csv_dir)
+
+
+# ── Migration / compaction CLI ─────────────────────────────────────────────
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Migrate the daily CSVs into the partitioned Parquet dataset.")
+    parser.add_argument("--tables", nargs="+", choices=sorted(TABLES), default=sorted(TABLES))
+    parser.add_argument("--rebuild", action="store_true", help="rewrite every partition from the CSVs")
+    args = parser.parse_args()
+
+    if _pyarrow() is None:
+        raise SystemExit("pyarrow is not installed: pip install pyarrow")
+    dataset = get_dataset()
+    for name in args.tables:
+        started = time.perf_counter()
+        days = dataset.sync(name, rebuild=args.rebuild)
+        took = time.perf_counter() - started
+        started = time.perf_counter()
+        rows = len(dataset.read(name))
+        print(f"[DONE] {name}: {days} day(s) written in {took:.2f}s; "
+              f"full-history read {rows} rows in {time.perf_counter() - started:.3f}s")
@@ -0,0 +1,178 @@
+"""
+Entity Count Store Module
+Incrementally maintained (entity, label) -> count totals behind the
+cumulative top-entities chart. Each run folds in only its own day's
+entities; the dates already ingested are kept as a watermark together with
+the (mtime, size) and content digest of the file each was read from, so a
+daily processed_entities_final_*.csv is re-read only when it has been
+rewritten; a fresh checkout, which only moves mtimes, costs a hash per file.
+Stored as one small SQLite file under Data_Output/cache/.
+"""
+
+import os
+import re
+import hashlib
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# ── Project root resolved from this file's location ───────────
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+ENTITY_STORE_PATH = os.environ.get(
+    'ENTITY_STORE_PATH', str(PROJECT_ROOT / "Data_Output" / "cache" / "entity_counts.db")
+)
+ENTITY_FILE_PATTERN = re.compile(r"processed_entities_final_(\d{4}_\d{2}_\d{2})\.csv$")
+CHART_LABELS = ('ORG', 'PERSON', 'GPE')
+
+
+def stat_fingerprint(path) -> Tuple[float, int]:
+    """(mtime, size) of a file: changes whenever it is rewritten."""
+    stat = os.stat(path)
+    return stat.st_mtime, stat.st_size
+
+
+def content_digest(path) -> str:
+    """sha256 of a file's bytes: unlike its mtime, the same after a fresh checkout."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class EntityCountStore:
+    """Cumulative entity counts plus per-day counts, so a re-run day replaces rather than double-counts."""
+
+    def __init__(self, path: str = ENTITY_STORE_PATH):
+        self.path = str(path)
+        self._lock = threading.Lock()
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS entity_totals (
+                entity TEXT NOT NULL, label TEXT NOT NULL, count INTEGER NOT NULL,
+                PRIMARY KEY (entity, label));
+            CREATE TABLE IF NOT EXISTS entity_day_counts (
+                scrape_date TEXT NOT NULL, entity TEXT NOT NULL, label TEXT NOT NULL, count INTEGER NOT NULL,
+                PRIMARY KEY (scrape_date, entity, label));
+            CREATE TABLE IF NOT EXISTS ingested_dates (
+                scrape_date TEXT PRIMARY KEY, rows INTEGER NOT NULL, mtime REAL, size INTEGER, digest TEXT);
+        """)
+        # Stores created before the file fingerprint was kept: those dates are re-read once.
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(ingested_dates)")}
+        for column, sql_type in (('mtime', 'REAL'), ('size', 'INTEGER'), ('digest', 'TEXT')):
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE ingested_dates ADD COLUMN {column} {sql_type}")
+        self._conn.commit()
+
+    def ingested_dates(self) -> List[str]:
+        """The watermark: every date whose entities are already in the totals."""
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT scrape_date FROM ingested_dates ORDER BY 1")]
+
+    def _fingerprints(self) -> Dict[str, Tuple[Optional[float], Optional[int], Optional[str]]]:
+        """date -> (mtime, size, digest) of the file it was folded from; all None for dates folded from memory."""
+        with self._lock:
+            return {day: (mtime, size, digest) for day, mtime, size, digest in
+                    self._conn.execute("SELECT scrape_date, mtime, size, digest FROM ingested_dates")}
+
+    def fold(self, scrape_date: str, df_entities: pd.DataFrame,
+             fingerprint: Optional[Tuple[float, int]] = None, digest: Optional[str] = None) -> int:
+        """Add one day's entities to the totals, replacing that day's earlier counts if any.
+
+        `fingerprint` and `digest` are the stat_fingerprint() and
+        content_digest() of the CSV the frame matches; without a fingerprint
+        the day is re-read from its CSV on the next sync_directory().
+        Returns the number of distinct (entity, label) pairs folded in.
+        """
+        if df_entities is None or df_entities.empty:
+            day = []
+        else:
+            counts = df_entities.dropna(subset=['Entity', 'Label']).groupby(['Entity', 'Label']).size()
+            day = [(scrape_date, str(e), str(l), int(n)) for (e, l), n in counts.items()]
+        with self._lock, self._conn:
+            self._conn.execute("""
+                UPDATE entity_totals SET count = count - (
+                    SELECT d.count FROM entity_day_counts d
+                    WHERE d.scrape_date = ? AND d.entity = entity_totals.entity AND d.label = entity_totals.label)
+                WHERE (entity, label) IN (SELECT entity, label FROM entity_day_counts WHERE scrape_date = ?)
+            """, (scrape_date, scrape_date))
+            self._conn.execute("DELETE FROM entity_day_counts WHERE scrape_date = ?", (scrape_date,))
+            self._conn.executemany("INSERT INTO entity_day_counts VALUES (?, ?, ?, ?)", day)
+            self._conn.executemany("""
+                INSERT INTO entity_totals VALUES (?, ?, ?)
+                ON CONFLICT(entity, label) DO UPDATE SET count = count + excluded.count
+            """, [(e, l, n) for _, e, l, n in day])
+            self._conn.execute("DELETE FROM entity_totals WHERE count <= 0")
+            mtime, size = fingerprint or (None, None)
+            self._conn.execute("INSERT OR REPLACE INTO ingested_dates VALUES (?, ?, ?, ?, ?)",
+                               (scrape_date, sum(n for *_, n in day), mtime, size, digest))
+        return len(day)
+
+    def sync_directory(self, entities_dir, skip: Sequence[str] = ()) -> List[str]:
+        """Fold in every processed_entities_final_<date>.csv not yet ingested, or rewritten since.
+
+        Files whose (mtime, size) still match the watermark are only stat'ed,
+        never opened; a file whose mtime alone moved is hashed, and if its
+        content is unchanged only its mtime is updated. Returns the dates folded in.
+        """
+        done = self._fingerprints()
+        skip = set(skip)
+        folded = []
+        for name in sorted(os.listdir(entities_dir)) if os.path.isdir(entities_dir) else []:
+            match = ENTITY_FILE_PATTERN.match(name)
+            if not match or match.group(1) in skip:
+                continue
+            path = os.path.join(entities_dir, name)
+            fingerprint = stat_fingerprint(path)
+            mtime, size, digest = done.get(match.group(1), (None, None, None))
+            if (mtime, size) == fingerprint:
+                continue
+            current = content_digest(path)
+            if size == fingerprint[1] and digest == current:
+                with self._lock, self._conn:
+                    self._conn.execute("UPDATE ingested_dates SET mtime = ? WHERE scrape_date = ?",
+                                       (fingerprint[0], match.group(1)))
+                continue
+            try:
+                df = pd.read_csv(path)
+            except pd.errors.EmptyDataError:
+                df = None
+            self.fold(match.group(1), df, fingerprint, current)
+            folded.append(match.group(1))
+        if folded:
+            logger.info(f"Entity store: folded in {len(folded)} day(s) from {entities_dir}")
+        return folded
+
+    def top_entities(self, n: int = 10, labels: Sequence[str] = CHART_LABELS) -> pd.Series:
+        """Entity -> total count over `labels`, largest first (the chart's value_counts)."""
+        marks = ",".join("?" * len(labels))
+        with self._lock:
+            rows = self._conn.execute(f"""
+                SELECT entity, SUM(count) AS total FROM entity_totals WHERE label IN ({marks})
+                GROUP BY entity ORDER BY total DESC, entity LIMIT ?
+            """, (*labels, n)).fetchall()
+        return pd.Series([total for _, total in rows], index=[e for e, _ in rows], name='count', dtype='int64')
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_store: Optional[EntityCountStore] = None
+
+
+def get_entity_store() -> EntityCountStore:
+    """Process-wide store at ENTITY_STORE_PATH."""
+    global _store
+    if _store is None:
+        _store = EntityCountStore()
+    return _store
@@ -0,0 +1,90 @@
+"""
+Run Manifest Module
+Records, per pipeline stage, the version of the inputs its last run consumed
+and the artifacts it produced. An expensive stage asks is_current() first
+and, when nothing it reads has changed and its outputs are still on disk,
+reuses them instead of running again. Stored as one JSON file under
+Data_Output/cache/.
+"""
+
+import os
+import json
+import hashlib
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Sequence
+
+# ── Project root resolved from this file's location ───────────
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+RUN_MANIFEST_PATH = os.environ.get(
+    'RUN_MANIFEST_PATH', str(PROJECT_ROOT / "Data_Output" / "cache" / "run_manifest.json")
+)
+
+
+def file_fingerprint(paths: Iterable[str]) -> list:
+    """(name, mtime, size) of each existing file: changes whenever any of them is rewritten."""
+    entries = []
+    for path in sorted(paths):
+        if os.path.exists(path):
+            stat = os.stat(path)
+            entries.append([os.path.basename(path), stat.st_mtime, stat.st_size])
+    return entries
+
+
+def input_version(*parts) -> str:
+    """Stable hash of JSON-serializable parts describing a stage's inputs."""
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+class RunManifest:
+    """stage -> {'input_version', 'outputs', 'finished_at'}."""
+
+    def __init__(self, path: str = RUN_MANIFEST_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Dict]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def entry(self, stage: str) -> Optional[Dict]:
+        return self._load().get(stage)
+
+    def is_current(self, stage: str, version: str) -> bool:
+        """True when the stage last ran on `version` and all its outputs still exist."""
+        entry = self.entry(stage)
+        return bool(entry) and entry.get('input_version') == version and \
+            all(os.path.exists(p) for p in entry.get('outputs', []))
+
+    def record(self, stage: str, version: str, outputs: Sequence[str]) -> None:
+        with self._lock:
+            stages = self._load()
+            stages[stage] = {
+                'input_version': version,
+                'outputs': [str(p) for p in outputs],
+                'finished_at': datetime.now().isoformat(),
+            }
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(stages, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+
+
+_manifest: Optional[RunManifest] = None
+
+
+def get_run_manifest() -> RunManifest:
+    """Process-wide manifest at RUN_MANIFEST_PATH."""
+    global _manifest
+    if _manifest is None:
+        _manifest = RunManifest()
+    return _manifest
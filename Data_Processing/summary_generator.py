@@ -23,6 +23,8 @@ PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
+from Scraping_Scripts.source_registry import get_registry
+
 try:
     import mysql.connector
     MYSQL_AVAILABLE = True
@@ -48,23 +50,16 @@ DB_CONFIG = {
 
 SQLITE_PATH = os.path.join(os.path.dirname(__file__), 'news_headlines.db')
 
-# Map source names to approximate regions
-SOURCE_REGION_MAP = {
-    'BBC Hindi': 'South Asia',
-    'BBC Japanese': 'East Asia',
-    'BBC Portuguese': 'Latin America',
-    'BBC Russian': 'Eastern Europe',
+# Regions come from the source registry; these cover names that only appear
+# in older data and are no longer scraped.
+_RETIRED_SOURCE_REGIONS = {
     'BBC Spanish': 'Latin America',
-    'BBC Swahili': 'Africa',
-    'Reuters': 'Global',
-    'Al Jazeera': 'Middle East',
     'AP News': 'Global',
     'DW News': 'Europe',
-    'France 24': 'Europe',
-    'The Hindu': 'South Asia',
     'Dawn': 'South Asia',
     'Le Monde': 'Europe',
 }
+SOURCE_REGION_MAP = {**_RETIRED_SOURCE_REGIONS, **get_registry().regions()}
 
 
 # ── Prompt Templates (PHASE 3 Overhaul) ───────────────────────
@@ -509,7 +504,8 @@ def rule_based_briefing(clusters: list, period_type: str, period_label: str) ->
 
     return '\n\n'.join(sections)
 
-def generate_all_briefings(force_regenerate: bool = False) -> Dict[str, Any]:
+def get_gemini_api_key() -> Optional[str]:
+    """GEMINI_API_KEY from the environment, else from the project's .env file."""
     api_key = os.environ.get("GEMINI_API_KEY")
     if not api_key:
         try:
@@ -517,6 +513,32 @@ def generate_all_briefings(force_regenerate: bool = False) -> Dict[str, Any]:
                 for line in f:
                     if line.startswith("GEMINI_API_KEY="): api_key = line.split("=", 1)[1].strip(); break
         except Exception: pass
+    return api_key or None
+
+def briefing_input_state() -> List[Any]:
+    """What generate_all_briefings() reads besides the clock, for input versioning.
+
+    Whether a Gemini key is configured, and the row counts / latest date of
+    the headline tables in MySQL and the SQLite fallback. The summaries
+    table is left out: it is the briefings' own cache.
+    """
+    state: List[Any] = [bool(get_gemini_api_key())]
+    query = "SELECT (SELECT COUNT(*) FROM headlines), (SELECT MAX(scrape_date) FROM headlines), (SELECT COUNT(*) FROM entities)"
+    cnx = _get_mysql_connection()
+    if cnx:
+        try:
+            cursor = cnx.cursor(); cursor.execute(query); row = cursor.fetchone(); cursor.close(); cnx.close()
+            state.append(['mysql', *map(str, row)])
+        except Exception: pass
+    if os.path.exists(SQLITE_PATH):
+        try:
+            conn = _get_sqlite_connection(); row = conn.execute(query).fetchone(); conn.close()
+            state.append(['sqlite', *map(str, row)])
+        except Exception: pass
+    return state
+
+def generate_all_briefings(force_regenerate: bool = False) -> Dict[str, Any]:
+    api_key = get_gemini_api_key()
     if not api_key: return {}
     
     results = {}
@@ -6,7 +6,7 @@ Loads cleaned CSV data into a dimensional model:
 """
 
 import os
-import glob
+import sys
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Set
@@ -19,6 +19,11 @@ logger = logging.getLogger(__name__)
 
 # ── Project root resolved from this file's location ───────────
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from Scraping_Scripts.source_registry import get_registry
+from Data_Processing.dataset import read_table
 
 
 WAREHOUSE_PATH = str(PROJECT_ROOT / "Data_Output" / "warehouse.duckdb")
@@ -42,44 +47,15 @@ def build_warehouse(cleaned_dir: Optional[str] = None, warehouse_path: Optional[
     for tbl in ['bridge_article_entity', 'fact_articles', 'dim_entity', 'dim_date', 'dim_source']:
         con.execute(f"DROP TABLE IF EXISTS {tbl}")
 
-    # ── Load all cleaned headline CSVs ─────────────────────────
-    headline_files = sorted(glob.glob(os.path.join(cleaned_dir, "processed_data_final_*.csv")))
-    entity_files = sorted(glob.glob(os.path.join(cleaned_dir, "processed_entities_final_*.csv")))
-
-    if not headline_files:
-        logger.warning("No headline CSVs found. Skipping.")
-        con.close()
-        return
-
-    # Load headlines
-    headline_frames = []
-    for f in headline_files:
-        try:
-            df = pd.read_csv(f, on_bad_lines='skip')
-            if not df.empty:
-                headline_frames.append(df)
-        except Exception as e:
-            logger.error(f"Skipping {os.path.basename(f)}: {e}")
-
-    if not headline_frames:
-        logger.warning("No valid headline data. Skipping.")
+    # ── Load the cleaned headline / entity history ─────────────
+    df_headlines = read_table('headlines', csv_dir=cleaned_dir)
+    if df_headlines.empty:
+        logger.warning("No headline data found. Skipping.")
         con.close()
         return
 
-    df_headlines = pd.concat(headline_frames, ignore_index=True)
     df_headlines['Scrape_Date'] = df_headlines['Scrape_Date'].astype(str)
-
-    # Load entities
-    entity_frames = []
-    for f in entity_files:
-        try:
-            df = pd.read_csv(f, on_bad_lines='skip')
-            if not df.empty:
-                entity_frames.append(df)
-        except Exception:
-            continue
-
-    df_entities = pd.concat(entity_frames, ignore_index=True) if entity_frames else pd.DataFrame()
+    df_entities = read_table('entities', csv_dir=cleaned_dir)
 
     logger.info(f"Loaded {len(df_headlines)} headlines, {len(df_entities)} entity records")
 
@@ -98,19 +74,7 @@ def build_warehouse(cleaned_dir: Optional[str] = None, warehouse_path: Optional[
         )
     """)
 
-    known_metadata = {
-        'BBC Mundo':      ('es', 'Latin America', 'https://www.bbc.com/mundo'),
-        'BBC Hindi':      ('hi', 'South Asia',    'https://www.bbc.com/hindi'),
-        'BBC Portuguese': ('pt', 'Latin America', 'https://www.bbc.com/portuguese'),
-        'BBC Russian':    ('ru', 'Eastern Europe', 'https://www.bbc.com/russian'),
-        'BBC Japanese':   ('ja', 'East Asia',     'https://www.bbc.com/japanese'),
-        'BBC Swahili':    ('sw', 'Africa',        'https://www.bbc.com/swahili'),
-        'Al Jazeera':     ('en', 'Middle East',   'https://www.aljazeera.com/news'),
-        'France 24':      ('en', 'Global',        'https://www.france24.com/en'),
-        'The Hindu':      ('en', 'South Asia',    'https://www.thehindu.com'),
-        'BBC World RSS':  ('en', 'Global',        'https://feeds.bbci.co.uk/news/world/rss.xml'),
-        'NYT World RSS':  ('en', 'Global',        'https://rss.nytimes.com/services/xml/rss/nyt/World.xml'),
-    }
+    known_metadata = get_registry().metadata()
 
     unique_sources = df_headlines['Source_Name'].unique()
     src_keys = {}
@@ -0,0 +1,105 @@
+"""
+Entity Codec Module
+Storage format of the raw CSV's Entities_Raw column.
+New files hold a JSON list of [text, label] pairs; files written before the
+switch hold a Python repr of (text, label) tuples. Both are read by the same
+regex scan, so nothing is eval'd. A whole column is decoded from one scan
+of its joined text into flat (row, entity, label) arrays, instead of one
+ast.literal_eval call and one tuple per entity.
+"""
+
+import re
+import json
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+_STRING = r"""'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*\""""
+# One (text, label) pair: a 2-element JSON array or a Python 2-tuple.
+PAIR_PATTERN = re.compile(rf"""[\[(]\s*({_STRING})\s*,\s*({_STRING})\s*[\])]""")
+# Every quoted string in a well-formed cell is half of a pair, so a column can
+# be scanned for strings alone; the separator between cells is matched too so
+# that each string's row falls out of a running count.
+_ROW_SEPARATOR = "\x1e"   # a control character: escaped in both formats, so never raw in a cell
+_TOKEN_PATTERN = re.compile(rf"""{_ROW_SEPARATOR}|{_STRING}""")
+
+
+def encode_entities(entities: Iterable[Sequence[str]]) -> str:
+    """[(text, label), ...] -> '[["text", "label"], ...]'."""
+    return json.dumps([[str(text), str(label)] for text, label in entities], ensure_ascii=False)
+
+
+_ESCAPE = re.compile(r"\\(x[0-9a-fA-F]{2}|u[0-9a-fA-F]{4}|U[0-9a-fA-F]{8}|.)", re.DOTALL)
+_SIMPLE_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', '0': '\0', '/': '/'}
+
+
+def _unescape(match) -> str:
+    code = match.group(1)
+    if len(code) > 1:
+        return chr(int(code[1:], 16))
+    return _SIMPLE_ESCAPES.get(code, code)
+
+
+def _unquote(token: str) -> str:
+    """Text of a quoted token, with the escapes json.dumps and repr() emit undone."""
+    body = token[1:-1]
+    if '\\' not in body:
+        return body
+    text = _ESCAPE.sub(_unescape, body)
+    # ASCII-escaped JSON writes astral characters as surrogate pairs.
+    return text.encode('utf-16', 'surrogatepass').decode('utf-16') if '\\ud' in body.lower() else text
+
+
+def decode_entities(value: Optional[str]) -> List[Tuple[str, str]]:
+    """Entities of one Entities_Raw cell, in either format. Empty or missing -> []."""
+    if not isinstance(value, str) or not value.strip():
+        return []
+    return [(_unquote(text), _unquote(label)) for text, label in PAIR_PATTERN.findall(value)]
+
+
+def entity_arrays(column):
+    """Flat (rows, entities, labels) arrays for a whole Entities_Raw Series.
+
+    rows[i] is the position in `column` of the cell entity i came from, so
+    other columns of the same frame can be gathered with a single take.
+    """
+    import numpy as np
+
+    cells = ["" if not isinstance(cell, str) else cell for cell in column.tolist()]
+    tokens = np.array(_TOKEN_PATTERN.findall(_ROW_SEPARATOR.join(cells)), dtype=object)
+    is_separator = tokens == _ROW_SEPARATOR
+    token_rows = np.cumsum(is_separator)[~is_separator]
+    tokens = tokens[~is_separator]
+
+    per_row = np.bincount(token_rows, minlength=len(cells))
+    odd = np.flatnonzero(per_row % 2)
+    if odd.size:
+        # Malformed cells (an unpaired string) would shift every later pair;
+        # decode those few cells on their own and merge them back in row order.
+        keep = ~np.isin(token_rows, odd)
+        fixed = [(row, text, label) for row in odd.tolist() for text, label in PAIR_PATTERN.findall(cells[row])]
+        rows = np.concatenate([token_rows[keep][0::2], np.array([r for r, _, _ in fixed], dtype=np.int64)])
+        texts = np.concatenate([tokens[keep][0::2], np.array([t for _, t, _ in fixed], dtype=object)])
+        labels = np.concatenate([tokens[keep][1::2], np.array([l for _, _, l in fixed], dtype=object)])
+        order = np.argsort(rows, kind='stable')
+        rows, texts, labels = rows[order], texts[order], labels[order]
+    else:
+        rows, texts, labels = token_rows[0::2], tokens[0::2], tokens[1::2]
+    return rows.astype(np.int64), _unquote_all(texts), _unquote_all(labels)
+
+
+def _unquote_all(tokens):
+    """Strip the quotes from every token; only tokens with escapes go through _unquote()."""
+    import numpy as np
+
+    return np.array([t[1:-1] if '\\' not in t else _unquote(t) for t in tokens.tolist()], dtype=object)
+
+
+def explode_entities(column):
+    """One row per entity for a whole Entities_Raw Series.
+
+    Returns a DataFrame with Entity and Label columns, indexed by the row the
+    entity came from (the same index DataFrame.explode would give).
+    """
+    import pandas as pd
+
+    rows, texts, labels = entity_arrays(column)
+    return pd.DataFrame({'Entity': texts, 'Label': labels}, index=column.index[rows])
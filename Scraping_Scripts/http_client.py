@@ -0,0 +1,156 @@
+"""
+HTTP Client Module
+Shared, pooled requests.Session for every outbound call the scraper makes
+(page fetches, RSS feeds, HF inference). Connections are kept alive and
+reused per host; transient failures are retried with exponential backoff.
+Also holds the ETag / Last-Modified validator cache for conditional GETs.
+"""
+
+import os
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# ── Project root resolved from this file's location ───────────
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# ── Pool & Retry Config ────────────────────────────────────────────────────
+POOL_CONNECTIONS = int(os.environ.get('HTTP_POOL_CONNECTIONS', 32))   # distinct hosts kept warm
+POOL_MAXSIZE = int(os.environ.get('HTTP_POOL_MAXSIZE', 4))            # keep-alive connections per host
+MAX_RETRIES = int(os.environ.get('HTTP_MAX_RETRIES', 3))
+BACKOFF_FACTOR = float(os.environ.get('HTTP_BACKOFF_FACTOR', 0.5))
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Hosts that need a bigger pool than the default, e.g. concurrent HF batches.
+HOST_POOL_SIZES: Dict[str, int] = {
+    'router.huggingface.co': int(os.environ.get('HF_POOL_MAXSIZE', 8)),
+}
+
+VALIDATOR_CACHE_PATH = os.environ.get(
+    'HTTP_VALIDATOR_CACHE_PATH', str(PROJECT_ROOT / "Data_Output" / "cache" / "http_validators.json")
+)
+
+_session = None   # shared requests.Session, see get_session()
+_session_lock = threading.Lock()
+
+
+def _retry_policy():
+    from urllib3.util.retry import Retry
+    # POST is retried too: HF inference calls are idempotent.
+    return Retry(
+        total=MAX_RETRIES,
+        backoff_factor=BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(['GET', 'HEAD', 'POST']),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+def build_session(pool_maxsize: int = POOL_MAXSIZE, host_pool_sizes: Optional[Dict[str, int]] = None) -> "requests.Session":
+    """Create a Session with keep-alive pools, retry/backoff and per-host pool sizes."""
+    # Imported here so that importing the scraper does not pay for requests.
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    default_adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=pool_maxsize, max_retries=_retry_policy())
+    session.mount('https://', default_adapter)
+    session.mount('http://', default_adapter)
+
+    for host, size in (HOST_POOL_SIZES if host_pool_sizes is None else host_pool_sizes).items():
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=size, max_retries=_retry_policy())
+        session.mount(f'https://{host}/', adapter)
+    return session
+
+
+def get_session() -> "requests.Session":
+    """Process-wide shared Session, created on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = build_session()
+    return _session
+
+
+def close_session() -> None:
+    """Close pooled connections (end of run, or before forking workers)."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+# ── Conditional GET Validators ────────────────────────────────────────────
+
+class ValidatorCache:
+    """Per-URL ETag / Last-Modified plus the headlines parsed from that version.
+
+    A 304 Not Modified answer can then be served from the stored headlines
+    without downloading or parsing the body. Persisted as a small JSON file.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or VALIDATOR_CACHE_PATH
+        self.not_modified = 0
+        self._lock = threading.Lock()
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                self._entries: Dict[str, Dict[str, Any]] = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self._entries = {}
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        entry = self._entries.get(url) or {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def reset_counts(self) -> None:
+        """Start a new scrape pass: not_modified counts only this pass's 304s."""
+        with self._lock:
+            self.not_modified = 0
+
+    def cached_headlines(self, url: str) -> Optional[List[str]]:
+        """Headlines stored for `url`, counted as a 304 short-circuit."""
+        entry = self._entries.get(url)
+        if entry is None:
+            return None
+        with self._lock:
+            self.not_modified += 1
+        return list(entry['headlines'])
+
+    def store(self, url: str, response_headers, headlines: List[str]) -> None:
+        """Remember validators for a 200 response. Responses without validators are skipped."""
+        etag = response_headers.get('ETag')
+        last_modified = response_headers.get('Last-Modified')
+        if not (etag or last_modified) or not headlines:
+            return
+        with self._lock:
+            self._entries[url] = {'etag': etag, 'last_modified': last_modified, 'headlines': list(headlines)}
+            self._save()
+
+    def _save(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._entries, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+
+_validator_cache: Optional[ValidatorCache] = None
+
+
+def get_validator_cache() -> ValidatorCache:
+    global _validator_cache
+    if _validator_cache is None:
+        with _session_lock:
+            if _validator_cache is None:
+                _validator_cache = ValidatorCache()
+    return _validator_cache
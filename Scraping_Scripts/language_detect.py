@@ -0,0 +1,113 @@
+"""
+Language Detection Module
+Fast, local script + stopword language detector used before translation.
+Headlines that are already English skip the translator, and the rest are
+grouped by detected language so each group goes out as one batch.
+No model or network: Unicode script counts decide non-Latin languages, and
+small stopword profiles separate English from other Latin-script languages.
+"""
+
+import re
+import unicodedata
+from collections import Counter
+from typing import Dict, List, Optional
+
+# ── Script → language for the registry's non-Latin sources ───────────────
+SCRIPT_LANGUAGES: Dict[str, str] = {
+    'DEVANAGARI': 'hi',
+    'CYRILLIC': 'ru',
+    'HIRAGANA': 'ja',
+    'KATAKANA': 'ja',
+    'ARABIC': 'ar',
+    'HANGUL': 'ko',
+    'GREEK': 'el',
+    'HEBREW': 'he',
+    'THAI': 'th',
+    'BENGALI': 'bn',
+}
+# Han characters alone could be Chinese or Japanese; the source decides.
+HAN_LANGUAGES = ('ja', 'zh', 'zh-cn', 'zh-tw')
+
+# ── Stopword profiles for Latin-script languages ──────────────────────────
+# Words common to several languages (de, que, a, se ...) are left out or
+# shared so that they cancel out instead of tipping the vote.
+STOPWORDS: Dict[str, frozenset] = {
+    'en': frozenset('the an of to in on for and is are was were with at by from after over says '
+                    'has have will be its their this that not new who why how what'.split()),
+    'es': frozenset('el los las del y en un una es son lo al tras más su sus pero hasta ni mi muy ante '
+                    'qué cómo a de por para que se como sobre'.split()),
+    'pt': frozenset('o os as do da dos das em no na nos nas um uma é são ao aos às após mais seu sua não '
+                    'pelo pela a de por para que se como sobre'.split()),
+    'sw': frozenset('na ya wa za kwa katika ni cha vya kuhusu baada hii huo hiyo kwamba lakini au '
+                    'watu serikali rais yake wake huwa nini kwanini'.split()),
+    'fr': frozenset('le les du des et est sont au aux dans sur après plus qui ne pas une de'.split()),
+}
+# Another Latin-script language must beat the source's language by this many
+# stopword hits before it overrides it; names and loanwords stay put.
+OVERRIDE_MARGIN = 3
+_WORD_RE = re.compile(r"[^\W\d_]+", re.UNICODE)
+_JAPANESE_SCRIPTS = ('HIRAGANA', 'KATAKANA')
+
+
+def _script_of(ch: str) -> Optional[str]:
+    """First word of the character's Unicode name (LATIN, CYRILLIC, CJK, ...)."""
+    try:
+        name = unicodedata.name(ch)
+    except ValueError:
+        return None
+    return name.split(' ', 1)[0]
+
+
+def script_counts(text: str) -> Counter:
+    """Letters per Unicode script."""
+    counts = Counter(_script_of(ch) for ch in text if ch.isalpha())
+    counts.pop(None, None)
+    return counts
+
+
+def dominant_script(text: str) -> Optional[str]:
+    """Script that most of the text's letters belong to, or None if there are none."""
+    counts = script_counts(text)
+    return counts.most_common(1)[0][0] if counts else None
+
+
+def _stopword_hits(text: str) -> Counter:
+    words = [w.lower() for w in _WORD_RE.findall(text)]
+    return Counter({lang: sum(1 for w in words if w in profile) for lang, profile in STOPWORDS.items()})
+
+
+def detect_language(text: str, expected: str) -> str:
+    """Best guess of `text`'s language, defaulting to the source's `expected` language.
+
+    Any non-Latin letters decide by script (a Hindi headline quoting "BBC" is
+    still Hindi). All-Latin text is English on a non-Latin-script source;
+    otherwise stopwords must clearly favour another language to override.
+    """
+    expected = expected.lower()
+    counts = script_counts(text)
+    if not counts:
+        return expected
+    non_latin = Counter({script: n for script, n in counts.items() if script != 'LATIN'})
+    if non_latin:
+        if any(script in non_latin for script in _JAPANESE_SCRIPTS):
+            return 'ja'
+        script = non_latin.most_common(1)[0][0]
+        if script == 'CJK':
+            return expected if expected in HAN_LANGUAGES else 'zh'
+        return SCRIPT_LANGUAGES.get(script, expected)
+
+    if expected in SCRIPT_LANGUAGES.values() or expected in HAN_LANGUAGES:
+        return 'en'
+    hits = _stopword_hits(text)
+    best, best_hits = max(hits.items(), key=lambda item: item[1])
+    if best == expected or best_hits < hits.get(expected, 0) + OVERRIDE_MARGIN:
+        return expected
+    return best
+
+
+def group_by_language(headlines: List[str], expected: str) -> Dict[str, List[str]]:
+    """Detected language -> headlines, in first-seen order."""
+    groups: Dict[str, List[str]] = {}
+    for headline in headlines:
+        groups.setdefault(detect_language(headline, expected), []).append(headline)
+    return groups
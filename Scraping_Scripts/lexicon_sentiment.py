@@ -0,0 +1,227 @@
+"""
+Lexicon Sentiment Module
+Keyword fallback scorer used whenever the HF API is unavailable.
+A headline's polarity is the weight-averaged sign of the lexicon terms it
+contains (plain substring match on the lower-cased text, each term counted
+once). score_batch() scores a whole column at once by scanning the joined
+text in C (str.split per term, or one trie-shaped regex for big lexicons),
+so backfilling months of CSVs takes seconds; the lexicon can be swapped for
+a larger weighted one via SENTIMENT_LEXICON_PATH.
+"""
+
+import os
+import re
+import json
+import hashlib
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# ── Default Lexicon ────────────────────────────────────────────────────────
+POSITIVE_WORDS = ('good', 'great', 'success', 'win', 'peace', 'growth', 'progress', 'victory', 'improve')
+NEGATIVE_WORDS = ('war', 'kill', 'death', 'attack', 'crisis', 'fail', 'disaster', 'conflict', 'terror')
+DEFAULT_LEXICON: Dict[str, float] = {
+    **{w: 1.0 for w in POSITIVE_WORDS},
+    **{w: -1.0 for w in NEGATIVE_WORDS},
+}
+
+# Optional JSON file of {"term": weight}; positive weights push towards 'positive'.
+SENTIMENT_LEXICON_PATH = os.environ.get('SENTIMENT_LEXICON_PATH', '')
+
+_ROW_SEPARATOR = "\x00"   # joins headlines for the single-pass scan; never inside a term
+# Up to this many terms, one str.split scan per term beats a single regex pass;
+# beyond it the trie-shaped regex wins because its cost barely grows with size.
+TRIE_MIN_TERMS = int(os.environ.get('SENTIMENT_LEXICON_TRIE_MIN_TERMS', 200))
+
+
+def load_lexicon(path: str) -> Dict[str, float]:
+    """Read a weighted lexicon file. Terms are lower-cased; zero weights are dropped."""
+    with open(path, encoding='utf-8') as f:
+        raw = json.load(f)
+    if not isinstance(raw, dict):
+        raise ValueError(f"{path}: expected a JSON object of term -> weight")
+    lexicon: Dict[str, float] = {}
+    for term, weight in raw.items():
+        term = str(term).lower()
+        if not term or _ROW_SEPARATOR in term:
+            raise ValueError(f"{path}: invalid term {term!r}")
+        if float(weight):
+            lexicon[term] = float(weight)
+    return lexicon
+
+
+def _label(polarity: float) -> str:
+    return 'positive' if polarity > 0 else ('negative' if polarity < 0 else 'neutral')
+
+
+def _trie_pattern(terms: Sequence[str]) -> str:
+    """Regex matching the longest term at a position, structured as a prefix trie.
+
+    Python's re handles a trie-shaped pattern in near-linear time, where a
+    flat alternation of thousands of terms would backtrack through each one.
+    """
+    trie: dict = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def build(node: dict) -> str:
+        alternatives = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not alternatives:
+            return ''
+        body = alternatives[0] if len(alternatives) == 1 else '(?:' + '|'.join(alternatives) + ')'
+        return f'(?:{body})?' if '' in node else body
+
+    return build(trie)
+
+
+class LexiconScorer:
+    """Weighted keyword scorer: polarity = sum(weights) / sum(|weights|) of the terms present."""
+
+    def __init__(self, lexicon: Optional[Dict[str, float]] = None):
+        self.lexicon = dict(DEFAULT_LEXICON if lexicon is None else lexicon)
+        # Identifies the lexicon in cache keys, so swapping it never reuses old scores.
+        self.fingerprint = hashlib.sha256(
+            json.dumps(sorted(self.lexicon.items())).encode('utf-8')).hexdigest()[:12]
+        self.is_default = self.lexicon == DEFAULT_LEXICON
+        self._terms = list(self.lexicon)
+        self._weights = [self.lexicon[t] for t in self._terms]
+        self._index = {t: i for i, t in enumerate(self._terms)}
+        # Every lexicon term that is a prefix of term i (itself included): a
+        # match of the longest term at a position implies all of these.
+        self._prefix_ids = [
+            [self._index[term[:k]] for k in range(1, len(term) + 1) if term[:k] in self._index]
+            for term in self._terms
+        ]
+        self._pattern = (re.compile(f'(?=({_trie_pattern(self._terms)}))')
+                         if len(self._terms) > TRIE_MIN_TERMS else None)
+
+    def score(self, headline_en: str) -> Tuple[float, str]:
+        """Score one headline."""
+        text = headline_en.lower()
+        present = [w for t, w in self.lexicon.items() if t in text]
+        total = sum(abs(w) for w in present)
+        if total == 0:
+            return 0.0, 'neutral'
+        polarity = round(sum(present) / total, 4)
+        return polarity, _label(polarity)
+
+    def score_batch(self, headlines_en: Sequence[str]) -> List[Tuple[float, str]]:
+        """Score a column of headlines in one pass. Same results as score() per item."""
+        if not headlines_en:
+            return []
+        # Identical headlines (common across days) are scored once.
+        slots: Dict[str, int] = {}
+        inverse = [slots.setdefault(h, len(slots)) for h in headlines_en]
+        scored = self._score_unique(list(slots))
+        return [scored[i] for i in inverse]
+
+    def _score_unique(self, texts: List[str]) -> List[Tuple[float, str]]:
+        import numpy as np
+
+        if not self._terms:
+            return [(0.0, 'neutral')] * len(texts)
+        joined = _ROW_SEPARATOR.join(texts)
+        if joined.count(_ROW_SEPARATOR) != len(texts) - 1:
+            joined = _ROW_SEPARATOR.join(t.replace(_ROW_SEPARATOR, ' ') for t in texts)
+        # Lower-casing can change a string's length, so row offsets are taken
+        # from the lowered text itself.
+        joined = joined.lower()
+        lengths = np.fromiter(map(len, joined.split(_ROW_SEPARATOR)), dtype=np.int64, count=len(texts))
+        starts = np.cumsum(lengths + 1) - lengths - 1
+        if len(self._terms) <= TRIE_MIN_TERMS:
+            positions, term_ids = self._find_by_term(joined)
+        else:
+            positions, term_ids = self._find_by_trie(joined)
+
+        rows = np.searchsorted(starts, positions, side='right') - 1
+        # Each term counts once per headline, however often it occurs.
+        pairs = np.unique(rows * len(self._terms) + term_ids)
+        rows, term_ids = np.divmod(pairs, len(self._terms))
+        weights = np.asarray(self._weights, dtype=float)[term_ids]
+        signed = np.bincount(rows, weights=weights, minlength=len(texts))
+        total = np.bincount(rows, weights=np.abs(weights), minlength=len(texts))
+        polarity = np.divide(signed, total, out=np.zeros(len(texts)), where=total > 0)
+
+        # Only a handful of distinct polarities exist; round and label each once.
+        values, value_ids = np.unique(polarity, return_inverse=True)
+        table = []
+        for value in values.tolist():
+            rounded = round(value, 4) + 0.0
+            table.append((rounded, _label(rounded)))
+        return [table[i] for i in value_ids.tolist()]
+
+    def _find_by_term(self, joined: str):
+        """One C-level str.split scan per term; occurrence offsets come from the piece lengths.
+
+        Matches never span the row separator, so every headline containing a
+        term yields at least one offset even though the scan is non-overlapping.
+        """
+        import numpy as np
+
+        positions, term_ids = [], []
+        for term_id, term in enumerate(self._terms):
+            pieces = joined.split(term)
+            if len(pieces) == 1:
+                continue
+            lengths = np.fromiter(map(len, pieces[:-1]), dtype=np.int64, count=len(pieces) - 1)
+            positions.append(np.cumsum(lengths + len(term)) - len(term))
+            term_ids.append(np.full(len(pieces) - 1, term_id, dtype=np.int64))
+        if not positions:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        return np.concatenate(positions), np.concatenate(term_ids)
+
+    def _find_by_trie(self, joined: str):
+        """One regex pass for large lexicons: the longest term at each offset, plus its prefixes."""
+        import numpy as np
+
+        positions, term_ids = [], []
+        for match in self._pattern.finditer(joined):
+            for term_id in self._prefix_ids[self._index[match.group(1)]]:
+                positions.append(match.start())
+                term_ids.append(term_id)
+        return np.asarray(positions, dtype=np.int64), np.asarray(term_ids, dtype=np.int64)
+
+
+_scorer: Optional[LexiconScorer] = None
+
+
+def get_lexicon_scorer() -> LexiconScorer:
+    """Scorer for SENTIMENT_LEXICON_PATH, or the built-in lexicon when unset."""
+    global _scorer
+    if _scorer is None:
+        _scorer = LexiconScorer(load_lexicon(SENTIMENT_LEXICON_PATH) if SENTIMENT_LEXICON_PATH else None)
+    return _scorer
+
+
+# ── Backfill CLI ───────────────────────────────────────────────────────────
+
+def rescore_csv(in_path: str, out_path: str, scorer: Optional[LexiconScorer] = None) -> int:
+    """Recompute Polarity / Sentiment_Label of a raw CSV with the lexicon. Returns rows scored."""
+    import pandas as pd
+
+    scorer = scorer or get_lexicon_scorer()
+    df = pd.read_csv(in_path)
+    scores = scorer.score_batch(df['Translated_Headline'].fillna('').astype(str).tolist())
+    df['Polarity'] = [p for p, _ in scores]
+    df['Sentiment_Label'] = [label for _, label in scores]
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    df.to_csv(out_path, index=False, encoding='utf-8')
+    return len(df)
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Re-score raw CSVs with the keyword lexicon.")
+    parser.add_argument("csv_files", nargs="+")
+    parser.add_argument("--out-dir", required=True, help="where the re-scored copies are written")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    total_rows = sum(
+        rescore_csv(path, os.path.join(args.out_dir, os.path.basename(path))) for path in args.csv_files
+    )
+    print(f"[DONE] {total_rows} headlines in {len(args.csv_files)} files re-scored "
+          f"in {time.perf_counter() - started:.2f}s")
@@ -0,0 +1,211 @@
+"""
+Local Sentiment Module
+Offline, in-process sentiment engine: a hashed n-gram softmax regression
+(negative / neutral / positive) trained from the pipeline's own historical
+raw CSVs and scored with numpy on CPU. Needs no network and no model
+download, so scoring latency does not depend on the HF router.
+
+Train:  python -m Scraping_Scripts.local_sentiment raw_csv_daily/*.csv
+Use:    SENTIMENT_ENGINE=local python Scraping_Scripts/web_scraper.py
+"""
+
+import os
+import re
+import time
+import zlib
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# ── Project root resolved from this file's location ───────────
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+LOCAL_MODEL_PATH = os.environ.get(
+    'LOCAL_SENTIMENT_MODEL_PATH', str(PROJECT_ROOT / "Data_Output" / "cache" / "local_sentiment_model.npz")
+)
+LABELS = ('negative', 'neutral', 'positive')
+N_FEATURES = 2 ** 18
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _features(text: str, n_features: int = N_FEATURES) -> List[int]:
+    """Hashed unigram + bigram ids. crc32 keeps ids stable across processes."""
+    tokens = _TOKEN_RE.findall(str(text).lower())
+    grams = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    return sorted({zlib.crc32(g.encode('utf-8')) % n_features for g in grams})
+
+
+def _design(texts: Sequence[str], n_features: int):
+    """CSR-style (indices, row offsets) for a batch, every active feature weighted 1."""
+    import numpy as np
+
+    rows = [_features(t, n_features) for t in texts]
+    offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(r) for r in rows])
+    indices = np.fromiter((i for r in rows for i in r), dtype=np.int64, count=int(offsets[-1]))
+    return indices, offsets
+
+
+def _softmax(logits):
+    import numpy as np
+
+    logits = logits - logits.max(axis=1, keepdims=True)
+    exp = np.exp(logits)
+    return exp / exp.sum(axis=1, keepdims=True)
+
+
+class LocalSentimentModel:
+    """Hashed-feature multinomial logistic regression over LABELS."""
+
+    def __init__(self, weights, bias, n_features: int = N_FEATURES):
+        self.weights = weights          # (n_features, len(LABELS))
+        self.bias = bias                # (len(LABELS),)
+        self.n_features = n_features
+        self.rows_scored = 0
+        self.seconds = 0.0
+        self._name: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        """Cache key: changes whenever the model is retrained."""
+        if self._name is None:
+            digest = hashlib.sha256(self.weights.tobytes() + self.bias.tobytes()).hexdigest()[:12]
+            self._name = f"local-linear:{digest}"
+        return self._name
+
+    def _logits(self, indices, offsets):
+        import numpy as np
+
+        logits = np.tile(self.bias, (len(offsets) - 1, 1))
+        lengths = np.diff(offsets)
+        nonempty = lengths > 0
+        if indices.size:
+            sums = np.add.reduceat(self.weights[indices], offsets[:-1][nonempty], axis=0)
+            logits[nonempty] += sums
+        return logits
+
+    def predict_proba(self, texts: Sequence[str]):
+        """(n, 3) class probabilities in LABELS order."""
+        import numpy as np
+
+        if not texts:
+            return np.zeros((0, len(LABELS)))
+        started = time.perf_counter()
+        probs = _softmax(self._logits(*_design(texts, self.n_features)))
+        self.seconds += time.perf_counter() - started
+        self.rows_scored += len(texts)
+        return probs
+
+    def predictions(self, texts: Sequence[str]) -> List[List[Dict]]:
+        """HF-style [{label, score}, ...] per text, for _polarity_from_predictions()."""
+        return [
+            [{'label': label, 'score': float(p)} for label, p in zip(LABELS, row)]
+            for row in self.predict_proba(texts)
+        ]
+
+    def throughput(self) -> float:
+        """Headlines scored per second so far in this process."""
+        return self.rows_scored / self.seconds if self.seconds else 0.0
+
+    @classmethod
+    def train(cls, texts: Sequence[str], labels: Sequence[str], epochs: int = 60, learning_rate: float = 0.5,
+              l2: float = 1e-5, n_features: int = N_FEATURES, seed: int = 0) -> "LocalSentimentModel":
+        """Full-batch AdaGrad (per-feature step sizes suit sparse hashed n-grams), class-balanced."""
+        import numpy as np
+
+        y = np.array([LABELS.index(label) for label in labels])
+        indices, offsets = _design(texts, n_features)
+        row_of = np.repeat(np.arange(len(y)), np.diff(offsets))
+        counts = np.bincount(y, minlength=len(LABELS)).astype(float)
+        sample_weight = (len(y) / (len(LABELS) * np.maximum(counts, 1)))[y]
+
+        rng = np.random.default_rng(seed)
+        model = cls(rng.normal(0, 1e-3, (n_features, len(LABELS))), np.zeros(len(LABELS)), n_features)
+        onehot = np.eye(len(LABELS))[y]
+        sq_w, sq_b = np.full_like(model.weights, 1e-8), np.full_like(model.bias, 1e-8)
+        for _ in range(epochs):
+            probs = _softmax(model._logits(indices, offsets))
+            grad_rows = (probs - onehot) * sample_weight[:, None] / len(y)
+            grad_w = l2 * model.weights
+            np.add.at(grad_w, indices, grad_rows[row_of])
+            grad_b = grad_rows.sum(axis=0)
+            sq_w += grad_w ** 2
+            sq_b += grad_b ** 2
+            model.weights -= learning_rate * grad_w / np.sqrt(sq_w)
+            model.bias -= learning_rate * grad_b / np.sqrt(sq_b)
+        return model
+
+    def save(self, path: str) -> None:
+        import numpy as np
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp.npz"
+        np.savez_compressed(tmp_path, weights=self.weights.astype(np.float32), bias=self.bias,
+                            n_features=self.n_features)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "LocalSentimentModel":
+        import numpy as np
+
+        with np.load(path) as data:
+            return cls(data['weights'].astype(np.float64), data['bias'], int(data['n_features']))
+
+
+def labels_from_frame(df) -> Tuple[List[str], List[str]]:
+    """(Translated_Headline, label) pairs from raw CSV rows.
+
+    Uses Sentiment_Label when present and the sign of Polarity otherwise
+    (older files only carry Polarity).
+    """
+    df = df.dropna(subset=['Translated_Headline'])
+    labels = df['Sentiment_Label'].tolist() if 'Sentiment_Label' in df.columns else [None] * len(df)
+    polarity = df['Polarity'].fillna(0.0)
+    derived = ['positive' if p > 0 else ('negative' if p < 0 else 'neutral') for p in polarity]
+    labels = [label if label in LABELS else fallback for label, fallback in zip(labels, derived)]
+    return df['Translated_Headline'].astype(str).tolist(), labels
+
+
+_model: Optional[LocalSentimentModel] = None
+_model_loaded = False
+
+
+def get_local_model() -> Optional[LocalSentimentModel]:
+    """The trained model at LOCAL_MODEL_PATH, or None when none has been trained."""
+    global _model, _model_loaded
+    if not _model_loaded:
+        _model_loaded = True
+        if os.path.exists(LOCAL_MODEL_PATH):
+            _model = LocalSentimentModel.load(LOCAL_MODEL_PATH)
+        else:
+            print(f"    [SENTIMENT WARN] No local model at {LOCAL_MODEL_PATH}; "
+                  f"train one with: python -m Scraping_Scripts.local_sentiment raw_csv_daily/*.csv")
+    return _model
+
+
+# ── Training CLI ───────────────────────────────────────────────────────────
+
+if __name__ == "__main__":
+    import argparse
+    import numpy as np
+    import pandas as pd
+
+    parser = argparse.ArgumentParser(description="Train the offline sentiment model from raw CSVs.")
+    parser.add_argument("csv_files", nargs="+")
+    parser.add_argument("--out", default=LOCAL_MODEL_PATH)
+    parser.add_argument("--epochs", type=int, default=60)
+    args = parser.parse_args()
+
+    frame = pd.concat((pd.read_csv(f) for f in args.csv_files), ignore_index=True)
+    frame = frame.drop_duplicates(subset=['Translated_Headline'])
+    texts, labels = labels_from_frame(frame)
+    order = np.random.default_rng(0).permutation(len(texts))
+    split = int(len(order) * 0.9)
+    train_idx, test_idx = order[:split], order[split:]
+
+    model = LocalSentimentModel.train([texts[i] for i in train_idx], [labels[i] for i in train_idx], epochs=args.epochs)
+    probs = model.predict_proba([texts[i] for i in test_idx])
+    accuracy = float(np.mean([LABELS[p] == labels[i] for p, i in zip(probs.argmax(axis=1), test_idx)])) if len(test_idx) else 0.0
+    model.save(args.out)
+    print(f"[DONE] Trained on {len(train_idx)} headlines, held-out accuracy {accuracy:.3f}, "
+          f"{model.throughput():,.0f} headlines/s. Saved to {args.out}")
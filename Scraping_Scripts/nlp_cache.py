@@ -0,0 +1,216 @@
+"""
+NLP Cache Module
+Persistent, content-addressed caches for the scraper's remote NLP calls
+(sentiment scores and the translation memory), plus the cross-run headline
+index that lets already-seen headlines skip NLP entirely.
+Each cache is a small SQLite table with size-bounded LRU eviction and
+hit/miss counters, stored under Data_Output/cache/.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# ── Project root resolved from this file's location ───────────
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+CACHE_DIR = Path(os.environ.get('NLP_CACHE_DIR', PROJECT_ROOT / "Data_Output" / "cache"))
+SENTIMENT_CACHE_MAX_ENTRIES = int(os.environ.get('SENTIMENT_CACHE_MAX_ENTRIES', 200_000))
+TRANSLATION_MEMORY_MAX_ENTRIES = int(os.environ.get('TRANSLATION_MEMORY_MAX_ENTRIES', 200_000))
+HEADLINE_INDEX_MAX_ENTRIES = int(os.environ.get('HEADLINE_INDEX_MAX_ENTRIES', 500_000))
+
+# SQLite caps bound parameters per statement; look keys up in slices.
+_SQL_CHUNK = 500
+
+
+def normalize_text(text: str) -> str:
+    """Canonical form used for cache keys: NFC, trimmed, single-spaced."""
+    return " ".join(unicodedata.normalize("NFC", str(text)).split())
+
+
+def content_key(*parts: str) -> str:
+    """SHA-256 over the NUL-joined parts."""
+    return hashlib.sha256("\x00".join(parts).encode("utf-8")).hexdigest()
+
+
+class _SqliteLRUCache:
+    """Key/value table with last-used timestamps and LRU trimming."""
+
+    TABLE = ""
+    COLUMNS: Tuple[Tuple[str, str], ...] = ()   # (name, SQL type) of the value columns
+
+    def __init__(self, path, max_entries: int):
+        self.path = str(path)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        cols = ", ".join(f"{name} {sql_type}" for name, sql_type in self.COLUMNS)
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.TABLE} (key TEXT PRIMARY KEY, {cols}, last_used REAL NOT NULL)"
+        )
+        self._conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{self.TABLE}_lru ON {self.TABLE}(last_used)")
+        self._conn.commit()
+
+    def _get_many(self, keys: Sequence[str]) -> Dict[str, tuple]:
+        found: Dict[str, tuple] = {}
+        unique = list(dict.fromkeys(keys))
+        cols = ", ".join(name for name, _ in self.COLUMNS)
+        with self._lock:
+            for i in range(0, len(unique), _SQL_CHUNK):
+                chunk = unique[i:i + _SQL_CHUNK]
+                marks = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, {cols} FROM {self.TABLE} WHERE key IN ({marks})", chunk
+                ).fetchall()
+                found.update((row[0], tuple(row[1:])) for row in rows)
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    f"UPDATE {self.TABLE} SET last_used = ? WHERE key = ?", [(now, k) for k in found]
+                )
+                self._conn.commit()
+        hits = sum(1 for k in keys if k in found)
+        self.hits += hits
+        self.misses += len(keys) - hits
+        return found
+
+    def _put_many(self, rows: Sequence[tuple]) -> None:
+        if not rows:
+            return
+        now = time.time()
+        marks = ",".join("?" * (len(self.COLUMNS) + 2))
+        with self._lock:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO {self.TABLE} VALUES ({marks})", [(*row, now) for row in rows]
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        count = self._conn.execute(f"SELECT COUNT(*) FROM {self.TABLE}").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                f"DELETE FROM {self.TABLE} WHERE key IN "
+                f"(SELECT key FROM {self.TABLE} ORDER BY last_used ASC LIMIT ?)", (excess,)
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {self.TABLE}").fetchone()[0]
+
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(self)}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class SentimentCache(_SqliteLRUCache):
+    """(model, normalized English text) -> (polarity, label)."""
+
+    TABLE = "sentiment"
+    COLUMNS = (("polarity", "REAL NOT NULL"), ("label", "TEXT NOT NULL"))
+
+    def __init__(self, path=None, max_entries: int = SENTIMENT_CACHE_MAX_ENTRIES):
+        super().__init__(path or CACHE_DIR / "sentiment_cache.db", max_entries)
+
+    @staticmethod
+    def key(model: str, text: str) -> str:
+        return content_key(model, normalize_text(text))
+
+    def get_many(self, model: str, texts: Sequence[str]) -> List[Optional[Tuple[float, str]]]:
+        """Cached (polarity, label) per text, or None for a miss. Order is preserved."""
+        keys = [self.key(model, t) for t in texts]
+        found = self._get_many(keys)
+        return [found.get(k) for k in keys]
+
+    def put_many(self, model: str, items: Sequence[Tuple[str, float, str]]) -> None:
+        """Store (text, polarity, label) results produced by `model`."""
+        self._put_many([(self.key(model, text), float(pol), label) for text, pol, label in items])
+
+
+class TranslationMemory(_SqliteLRUCache):
+    """(source language, original text) -> English translation."""
+
+    TABLE = "translation"
+    COLUMNS = (("translated", "TEXT NOT NULL"),)
+
+    def __init__(self, path=None, max_entries: int = TRANSLATION_MEMORY_MAX_ENTRIES):
+        super().__init__(path or CACHE_DIR / "translation_memory.db", max_entries)
+
+    @staticmethod
+    def key(src_language: str, text: str) -> str:
+        return content_key(src_language.lower(), normalize_text(text))
+
+    def get_many(self, src_language: str, texts: Sequence[str]) -> List[Optional[str]]:
+        """Bulk lookup: the stored translation per text, or None for a miss."""
+        keys = [self.key(src_language, t) for t in texts]
+        found = self._get_many(keys)
+        return [found[k][0] if k in found else None for k in keys]
+
+    def put_many(self, src_language: str, items: Sequence[Tuple[str, str]]) -> None:
+        """Store (original, translated) pairs for `src_language`."""
+        self._put_many([(self.key(src_language, original), translated) for original, translated in items])
+
+
+class HeadlineIndex(_SqliteLRUCache):
+    """(models, source name, original headline) fingerprint -> the analysis stored for it.
+
+    Checked right after scraping: a headline a source has already published
+    reuses its translation, sentiment and entities instead of going through
+    translation, HF and spaCy again. `models` names the sentiment and NER
+    models behind the analysis, so switching either one re-analyses.
+    """
+
+    TABLE = "headline"
+    COLUMNS = (
+        ("translated", "TEXT NOT NULL"),
+        ("polarity", "REAL NOT NULL"),
+        ("label", "TEXT NOT NULL"),
+        ("entities", "TEXT NOT NULL"),   # JSON list of [text, label] pairs
+    )
+
+    def __init__(self, path=None, max_entries: int = HEADLINE_INDEX_MAX_ENTRIES):
+        super().__init__(path or CACHE_DIR / "headline_index.db", max_entries)
+
+    @staticmethod
+    def key(models: str, source_name: str, original: str) -> str:
+        return content_key(models, source_name, normalize_text(original))
+
+    def get_many(self, models: str, source_name: str, originals: Sequence[str]) -> List[Optional[Dict]]:
+        """Stored analysis per headline (keys as in the raw CSV), or None if never seen under `models`."""
+        keys = [self.key(models, source_name, h) for h in originals]
+        found = self._get_many(keys)
+        results: List[Optional[Dict]] = []
+        for k in keys:
+            if k not in found:
+                results.append(None)
+                continue
+            translated, polarity, label, entities = found[k]
+            results.append({
+                'Translated_Headline': translated,
+                'Polarity': polarity,
+                'Sentiment_Label': label,
+                'Entities': [tuple(pair) for pair in json.loads(entities)],
+            })
+        return results
+
+    def put_many(self, models: str, items: Sequence[Tuple[str, str, str, float, str, List[Tuple[str, str]]]]) -> None:
+        """Store (source name, original, translated, polarity, label, entities) rows produced by `models`."""
+        self._put_many([
+            (self.key(models, source_name, original), translated, float(polarity), label,
+             json.dumps([list(e) for e in entities], ensure_ascii=False))
+            for source_name, original, translated, polarity, label, entities in items
+        ])
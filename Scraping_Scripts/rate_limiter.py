@@ -0,0 +1,99 @@
+"""
+Rate Limiter Module
+Per-host token buckets for the scraper. Only repeat hits to the same host
+are throttled; requests to different hosts never wait on each other.
+"""
+
+import time
+import threading
+from typing import Dict, Iterable
+from urllib.parse import urlparse
+
+# ── Defaults ───────────────────────────────────────────────────────────────
+# One request per second per host, no burst: the old fixed-sleep rhythm.
+DEFAULT_BURST = 1
+DEFAULT_REFILL_PER_SEC = 1.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket. `burst` tokens max, refilled at `refill_per_sec`."""
+
+    def __init__(self, burst: int = DEFAULT_BURST, refill_per_sec: float = DEFAULT_REFILL_PER_SEC, clock=time.monotonic):
+        if burst < 1 or refill_per_sec <= 0:
+            raise ValueError("burst must be >= 1 and refill_per_sec > 0")
+        self.burst = burst
+        self.refill_per_sec = refill_per_sec
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait before using it."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.refill_per_sec)
+            self._updated = now
+            self._tokens -= 1.0
+            # A negative balance queues the caller behind earlier reservations.
+            return max(0.0, -self._tokens / self.refill_per_sec)
+
+    def acquire(self) -> float:
+        """Block until a token is available. Returns the seconds spent waiting."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class HostRateLimiter:
+    """Token buckets keyed by hostname, created on first use."""
+
+    def __init__(self, burst: int = DEFAULT_BURST, refill_per_sec: float = DEFAULT_REFILL_PER_SEC):
+        self.default_burst = burst
+        self.default_refill_per_sec = refill_per_sec
+        self._settings: Dict[str, tuple] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_sources(cls, sources: Iterable[dict]) -> "HostRateLimiter":
+        """Build a limiter from the source registry's optional `rate_limit` settings.
+
+        Sources sharing a host share one bucket; if they disagree, the most
+        conservative burst and refill rate win.
+        """
+        limiter = cls()
+        for source in sources:
+            settings = source.get("rate_limit")
+            if settings:
+                limiter.configure(
+                    host_of(source["url"]),
+                    burst=int(settings.get("burst", DEFAULT_BURST)),
+                    refill_per_sec=float(settings.get("refill_per_sec", DEFAULT_REFILL_PER_SEC)),
+                )
+        return limiter
+
+    def configure(self, host: str, burst: int, refill_per_sec: float) -> None:
+        with self._lock:
+            if host in self._settings:
+                old_burst, old_rate = self._settings[host]
+                burst, refill_per_sec = min(burst, old_burst), min(refill_per_sec, old_rate)
+            self._settings[host] = (burst, refill_per_sec)
+            self._buckets.pop(host, None)
+
+    def bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            if host not in self._buckets:
+                burst, rate = self._settings.get(host, (self.default_burst, self.default_refill_per_sec))
+                self._buckets[host] = TokenBucket(burst, rate)
+            return self._buckets[host]
+
+    def acquire(self, host: str) -> float:
+        """Block until `host` may be hit again. Returns the seconds spent waiting."""
+        return self.bucket(host).acquire()
+
+
+def host_of(url: str) -> str:
+    """Lower-cased hostname of a URL, used as the rate-limit key."""
+    return urlparse(url).netloc.lower()
@@ -0,0 +1,202 @@
+"""
+Source Registry Module
+Single source of truth for the news sources the pipeline scrapes, loaded from
+site_configs.json. Each entry carries its selector, language, region, fetch
+cadence and concurrency class. The file is re-read when it changes on disk,
+and a small schedule file records when each source was last fetched so that
+fast feeds can be polled hourly while slow front pages are fetched daily.
+"""
+
+import os
+import json
+import time
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# ── Project root resolved from this file's location ───────────
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+REGISTRY_PATH = os.environ.get(
+    'SCRAPER_SOURCE_REGISTRY', str(Path(__file__).resolve().parent / "site_configs.json")
+)
+SCHEDULE_STATE_PATH = os.environ.get(
+    'SCRAPER_SCHEDULE_PATH', str(PROJECT_ROOT / "Data_Output" / "cache" / "source_schedule.json")
+)
+
+# ── Defaults (overridable per type in the file's "defaults" block) ────────
+SOURCE_TYPES = ("html", "rss")
+REQUIRED_FIELDS = ("name", "language", "url", "type")
+TYPE_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "html": {"fetch_interval_minutes": 1440, "concurrency_class": "page"},
+    "rss":  {"fetch_interval_minutes": 60,   "concurrency_class": "feed"},
+}
+DEFAULT_REGION = "Global"
+DEFAULT_CLASS_LIMIT = 4   # concurrent fetches for a class the file does not size
+# A source counts as due slightly early so that a daily cron a few seconds
+# ahead of yesterday's run does not skip a whole day.
+SCHEDULE_GRACE_SECONDS = float(os.environ.get('SCRAPER_SCHEDULE_GRACE_SECONDS', 300))
+
+
+def _normalize(entry: dict, defaults: Dict[str, Dict[str, Any]]) -> dict:
+    """Validate one registry entry and fill in its type defaults."""
+    missing = [f for f in REQUIRED_FIELDS if not entry.get(f)]
+    if missing:
+        raise ValueError(f"source {entry.get('name', '?')!r} is missing {', '.join(missing)}")
+    if entry["type"] not in SOURCE_TYPES:
+        raise ValueError(f"source {entry['name']!r} has unknown type {entry['type']!r}")
+    if entry["type"] == "html" and not entry.get("selector"):
+        raise ValueError(f"html source {entry['name']!r} needs a selector")
+
+    source = {**TYPE_DEFAULTS[entry["type"]], **defaults.get(entry["type"], {}), **entry}
+    source.setdefault("region", DEFAULT_REGION)
+    source.setdefault("selector", None)
+    source.setdefault("requires_translation", source["language"] != "en")
+    source.setdefault("enabled", True)
+    source["fetch_interval_minutes"] = float(source["fetch_interval_minutes"])
+    return source
+
+
+def parse_registry(config: dict) -> Tuple[List[dict], Dict[str, int]]:
+    """Turn the registry document into (sources, concurrency class limits)."""
+    defaults = config.get("defaults", {})
+    sources = [_normalize(entry, defaults) for entry in config.get("sources", [])]
+    names = [s["name"] for s in sources]
+    duplicates = sorted({n for n in names if names.count(n) > 1})
+    if duplicates:
+        raise ValueError(f"duplicate source names: {', '.join(duplicates)}")
+    classes = {name: int(limit) for name, limit in config.get("concurrency_classes", {}).items()}
+    return sources, classes
+
+
+def load_sources(path: Optional[str] = None) -> List[dict]:
+    """Read and validate the registry file."""
+    with open(path or REGISTRY_PATH, encoding='utf-8') as f:
+        return parse_registry(json.load(f))[0]
+
+
+class SourceRegistry:
+    """The registry file plus hot reload: `sources()` re-reads it when its mtime changes.
+
+    A file that fails to parse or validate is reported and the previously
+    loaded sources stay in effect, so a bad edit never stops a running scraper.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or REGISTRY_PATH
+        self._mtime: Optional[float] = None
+        self._sources: List[dict] = []
+        self._classes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.reload(force=True)
+
+    def reload(self, force: bool = False) -> bool:
+        """Re-read the file if it changed. Returns True when new sources were loaded."""
+        with self._lock:
+            try:
+                mtime = os.stat(self.path).st_mtime
+            except OSError as e:
+                if force:
+                    raise
+                print(f"    [REGISTRY WARN] {self.path}: {e}")
+                return False
+            if not force and mtime == self._mtime:
+                return False
+            try:
+                with open(self.path, encoding='utf-8') as f:
+                    sources, classes = parse_registry(json.load(f))
+            except (ValueError, OSError) as e:   # json.JSONDecodeError is a ValueError
+                if force:
+                    raise
+                print(f"    [REGISTRY WARN] keeping previous sources, {self.path} is invalid: {e}")
+                self._mtime = mtime
+                return False
+            self._sources, self._classes, self._mtime = sources, classes, mtime
+            return True
+
+    def sources(self) -> List[dict]:
+        self.reload()
+        return list(self._sources)
+
+    def enabled_sources(self) -> List[dict]:
+        return [s for s in self.sources() if s["enabled"]]
+
+    def class_limit(self, concurrency_class: str) -> int:
+        return self._classes.get(concurrency_class, DEFAULT_CLASS_LIMIT)
+
+    def metadata(self) -> Dict[str, Tuple[str, str, str]]:
+        """name -> (language, region, url), for the warehouse's dim_source."""
+        return {s["name"]: (s["language"], s["region"], s["url"]) for s in self.sources()}
+
+    def regions(self) -> Dict[str, str]:
+        return {s["name"]: s["region"] for s in self.sources()}
+
+
+_registry: Optional[SourceRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> SourceRegistry:
+    """Process-wide registry loaded from REGISTRY_PATH."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = SourceRegistry()
+    return _registry
+
+
+# ── Per-Source Scheduling ──────────────────────────────────────────────────
+
+class ScheduleState:
+    """Last successful fetch time per source name, persisted as JSON."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or SCHEDULE_STATE_PATH
+        self._lock = threading.Lock()
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                self._last_fetched: Dict[str, float] = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self._last_fetched = {}
+
+    def last_fetched(self, name: str) -> Optional[float]:
+        return self._last_fetched.get(name)
+
+    def is_due(self, source: dict, now: Optional[float] = None) -> bool:
+        last = self._last_fetched.get(source["name"])
+        if last is None:
+            return True
+        now = time.time() if now is None else now
+        return now - last + SCHEDULE_GRACE_SECONDS >= source["fetch_interval_minutes"] * 60
+
+    def due_sources(self, sources: List[dict], now: Optional[float] = None) -> List[dict]:
+        """Enabled sources whose interval has elapsed, in registry order."""
+        return [s for s in sources if s["enabled"] and self.is_due(s, now)]
+
+    def seconds_until_next(self, sources: List[dict], now: Optional[float] = None) -> Optional[float]:
+        """Seconds until the earliest enabled source becomes due; None if nothing is enabled."""
+        now = time.time() if now is None else now
+        waits = []
+        for source in sources:
+            if not source["enabled"]:
+                continue
+            last = self._last_fetched.get(source["name"])
+            if last is None:
+                return 0.0
+            waits.append(max(0.0, last + source["fetch_interval_minutes"] * 60 - SCHEDULE_GRACE_SECONDS - now))
+        return min(waits) if waits else None
+
+    def mark_fetched(self, names: List[str], when: Optional[float] = None) -> None:
+        when = time.time() if when is None else when
+        with self._lock:
+            for name in names:
+                self._last_fetched[name] = when
+            self._save()
+
+    def _save(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._last_fetched, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
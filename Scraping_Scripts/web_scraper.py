@@ -6,36 +6,108 @@ translates them to English, and performs sentiment + NER analysis.
 
 import os
 import re
-import csv
+import sys
 import json
 import logging
 import random
 import time
 import subprocess
-import requests
+import threading
+import importlib.util
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import date
-from typing import List, Dict, Optional, Tuple
-from bs4 import BeautifulSoup
-from deep_translator import GoogleTranslator
-import spacy
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, List, Dict, Optional, Tuple, Union
 
-# ── Setup SpaCy ───────────────────────────────────────────────────────────
 try:
-    import en_core_web_sm
+    from Scraping_Scripts.rate_limiter import HostRateLimiter, host_of
+    from Scraping_Scripts.http_client import get_session, close_session, get_validator_cache
+    from Scraping_Scripts.nlp_cache import HeadlineIndex, SentimentCache, TranslationMemory
+    from Scraping_Scripts.source_registry import ScheduleState, get_registry
+    from Scraping_Scripts.raw_csv_writer import RawCsvWriter
+    from Scraping_Scripts.lexicon_sentiment import get_lexicon_scorer
+    from Scraping_Scripts.local_sentiment import LocalSentimentModel, get_local_model
+    from Scraping_Scripts.language_detect import detect_language, group_by_language
+    from Scraping_Scripts.entity_codec import encode_entities
 except ImportError:
-    subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"], check=True)
-    import en_core_web_sm
-
-nlp = spacy.load('en_core_web_sm')
+    from rate_limiter import HostRateLimiter, host_of
+    from http_client import get_session, close_session, get_validator_cache
+    from nlp_cache import HeadlineIndex, SentimentCache, TranslationMemory
+    from source_registry import ScheduleState, get_registry
+    from raw_csv_writer import RawCsvWriter
+    from lexicon_sentiment import get_lexicon_scorer
+    from local_sentiment import LocalSentimentModel, get_local_model
+    from language_detect import detect_language, group_by_language
+    from entity_codec import encode_entities
+
+# ── Lazily Loaded Resources ───────────────────────────────────────────────
+# spaCy, BeautifulSoup and deep_translator are imported on first use so that
+# importing this module (Airflow DAG parsing, tests that only need SOURCES or
+# _fallback_sentiment) stays cheap. Each resource is created once per process.
+SPACY_MODEL = 'en_core_web_sm'
+# Only tok2vec + ner are needed for entities; the rest is never used.
+NER_UNUSED_COMPONENTS = ["tagger", "parser", "attribute_ruler", "lemmatizer", "senter"]
+NER_BATCH_SIZE = int(os.environ.get('NER_BATCH_SIZE', 256))
+NER_N_PROCESS = int(os.environ.get('NER_N_PROCESS', 1))
+
+nlp = None                # spaCy pipeline, see get_nlp()
+GoogleTranslator = None   # deep_translator client class, see _translator_cls()
+_resource_lock = threading.Lock()
+
+def get_nlp():
+    """Load the NER pipeline on first use, downloading the model if missing."""
+    global nlp
+    if nlp is None:
+        with _resource_lock:
+            if nlp is None:
+                import spacy
+                try:
+                    import en_core_web_sm
+                except ImportError:
+                    subprocess.run([sys.executable, "-m", "spacy", "download", SPACY_MODEL], check=True)
+                nlp = spacy.load(SPACY_MODEL, exclude=NER_UNUSED_COMPONENTS)
+    return nlp
+
+def _translator_cls():
+    global GoogleTranslator
+    if GoogleTranslator is None:
+        from deep_translator import GoogleTranslator as translator_cls
+        GoogleTranslator = translator_cls
+    return GoogleTranslator
 
 # ── Constants & Config ─────────────────────────────────────────────────────
 MIN_HEADLINE_LENGTH = 20
 MAX_HEADLINES_PER_SOURCE = 10
 
+# HTML parser backend: lxml (C-accelerated) when installed, else the stdlib parser.
+HTML_PARSER = os.environ.get('SCRAPER_HTML_PARSER') or (
+    'lxml' if importlib.util.find_spec('lxml') is not None else 'html.parser'
+)
+
+# Feeds are parsed as they stream in; reading stops once enough titles are seen.
+FEED_CHUNK_SIZE = 16 * 1024
+FEED_ENTRY_TAGS = ('item', 'entry')   # RSS 2.0 / RSS 1.0 items and Atom entries
+
+# Fetch stage concurrency: total worker threads, and how many of them may
+# talk to the same host at once (the six BBC services share bbc.com).
+# Request spacing per host comes from each source's `rate_limit` setting.
+MAX_FETCH_WORKERS = int(os.environ.get('SCRAPER_MAX_WORKERS', 8))
+MAX_REQUESTS_PER_HOST = int(os.environ.get('SCRAPER_MAX_PER_HOST', 1))
+
 HF_API_TOKEN = os.environ.get('HF_API_TOKEN', '')
 HF_MODEL = "cardiffnlp/twitter-roberta-base-sentiment-latest"
 HF_API_URL = f"https://router.huggingface.co/models/{HF_MODEL}"
+HF_BATCH_SIZE = int(os.environ.get('HF_BATCH_SIZE', 16))
+HF_MAX_CONCURRENT_BATCHES = int(os.environ.get('HF_MAX_CONCURRENT_BATCHES', 4))
+HF_BATCH_TIMEOUT = 30
+# Cache key for results produced by _fallback_sentiment rather than HF
+# (a custom SENTIMENT_LEXICON_PATH adds the lexicon's fingerprint)
+FALLBACK_MODEL = "keyword-fallback"
+# 'hf' (remote RoBERTa, keyword fallback without a token), 'local' (offline
+# CPU model from local_sentiment.py) or 'keyword' (lexicon only).
+SENTIMENT_ENGINE = os.environ.get('SENTIMENT_ENGINE', 'hf').lower()
 
 LABEL_TO_POLARITY = {
     'negative': -1.0,
@@ -50,230 +122,713 @@ USER_AGENTS = [
 ]
 
 # ── Source Registry ────────────────────────────────────────────────────────
-SOURCES = [
-    # BBC Language Sites (Legacy)
-    {"name": "BBC Mundo", "language": "es", "region": "Latin America", "url": "https://www.bbc.com/mundo", "type": "html", "selector": "h3", "requires_translation": True, "enabled": True},
-    {"name": "BBC Hindi", "language": "hi", "region": "South Asia", "url": "https://www.bbc.com/hindi", "type": "html", "selector": "h3", "requires_translation": True, "enabled": True},
-    {"name": "BBC Portuguese", "language": "pt", "region": "Latin America", "url": "https://www.bbc.com/portuguese", "type": "html", "selector": "h3", "requires_translation": True, "enabled": True},
-    {"name": "BBC Russian", "language": "ru", "region": "Eastern Europe", "url": "https://www.bbc.com/russian", "type": "html", "selector": "h3", "requires_translation": True, "enabled": True},
-    {"name": "BBC Japanese", "language": "ja", "region": "East Asia", "url": "https://www.bbc.com/japanese", "type": "html", "selector": "h3", "requires_translation": True, "enabled": True},
-    {"name": "BBC Swahili", "language": "sw", "region": "Africa", "url": "https://www.bbc.com/swahili", "type": "html", "selector": "h3", "requires_translation": True, "enabled": True},
-    
-    # New International Sources
-    {"name": "Al Jazeera", "language": "en", "region": "Middle East", "url": "https://www.aljazeera.com/news", "type": "html", "selector": "h2.article-card__title", "requires_translation": False, "enabled": True},
-    {"name": "France 24", "language": "en", "region": "Global", "url": "https://www.france24.com/en", "type": "html", "selector": "h2.a-daily-news-link__title", "requires_translation": False, "enabled": True},
-    {"name": "The Hindu", "language": "en", "region": "South Asia", "url": "https://www.thehindu.com", "type": "html", "selector": "h3.title", "requires_translation": False, "enabled": True},
-    {"name": "Reuters", "language": "en", "region": "Global", "url": "https://www.reuters.com", "type": "html", "selector": "a[data-testid='Heading'] span", "requires_translation": False, "enabled": False}, # SKIP (JS Req)
-    
-    # RSS Feeds
-    {"name": "BBC World RSS", "language": "en", "region": "Global", "url": "https://feeds.bbci.co.uk/news/world/rss.xml", "type": "rss", "selector": None, "requires_translation": False, "enabled": True},
-    {"name": "NYT World RSS", "language": "en", "region": "Global", "url": "https://rss.nytimes.com/services/xml/rss/nyt/World.xml", "type": "rss", "selector": None, "requires_translation": False, "enabled": True}
-]
+# The registry lives in site_configs.json (see source_registry.py); SOURCES is
+# refreshed from it by refresh_sources() whenever the file changes.
+SOURCES = get_registry().sources()
 
 # ── Core Functions ─────────────────────────────────────────────────────────
 
+def _conditional_get(source: dict, stream: bool = False):
+    """GET a source with its stored validators.
+
+    Returns (response, None) for a fresh body, or (None, headlines) when the
+    server answers 304 Not Modified and the last parsed headlines still apply.
+    """
+    cache = get_validator_cache()
+    headers = {'User-Agent': random.choice(USER_AGENTS), **cache.conditional_headers(source["url"])}
+    response = get_session().get(source["url"], headers=headers, timeout=10, stream=stream)
+    if response.status_code == 304:
+        cached = cache.cached_headlines(source["url"])
+        if cached is not None:
+            response.close()   # nothing to read: hand the connection back to the pool
+            return None, cached
+    if not response.ok:
+        response.close()
+    response.raise_for_status()
+    return response, None
+
+def _strainer_tags(selector: str) -> Optional[Tuple[str, ...]]:
+    """Tags a SoupStrainer may keep for `selector`, or None when it needs the whole page.
+
+    One root tag per comma-separated group; a group that does not start with
+    a tag, or any sibling combinator (+, ~) or pseudo-class (:nth-child, ...),
+    depends on context a strained tree would lose.
+    """
+    bare = re.sub(r"\[[^\]]*\]|'[^']*'|\"[^\"]*\"", "", selector)   # attribute values may hold any character
+    if any(c in bare for c in '+~:'):
+        return None
+    tags = []
+    for group in bare.split(','):
+        match = re.match(r'\s*([A-Za-z][\w-]*)', group)
+        if not match:
+            return None
+        tags.append(match.group(1).lower())
+    return tuple(dict.fromkeys(tags))
+
+class CompiledSelector:
+    """A source selector compiled once: a soupsieve matcher plus the subtree filter.
+
+    `root_tags` are the leading tags of the selector's groups; pages are
+    parsed with a SoupStrainer on them so only candidate headline subtrees
+    are built. None when the selector cannot be strained safely.
+    """
+
+    def __init__(self, selector: str):
+        import soupsieve
+        self.selector = selector
+        self.matcher = soupsieve.compile(selector)
+        self.root_tags = _strainer_tags(selector)
+
+    def parse_only(self):
+        from bs4 import SoupStrainer
+        return SoupStrainer(list(self.root_tags)) if self.root_tags else None
+
+    def select(self, soup) -> list:
+        return self.matcher.select(soup)
+
+@lru_cache(maxsize=None)
+def compile_selector(selector: str) -> CompiledSelector:
+    """Compile (and memoise) a registry selector."""
+    return CompiledSelector(selector)
+
+def parse_html_document(content: bytes, parse_only=None):
+    """Parse HTML with the configured backend, optionally restricted to a subtree filter."""
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(content, HTML_PARSER, parse_only=parse_only)
+
+def parse_html_headlines(content: bytes, source: dict) -> List[str]:
+    """Extract headlines from an HTML page using the source's compiled selector."""
+    compiled = compile_selector(source["selector"])
+    elements = compiled.select(parse_html_document(content, compiled.parse_only()))
+
+    # BBC Special Fallback (needs the full tree, so only parsed when required)
+    if not elements and "bbc.com" in source["url"]:
+        soup = parse_html_document(content)
+        main_list = soup.find('ul', class_='bbc-1rrncb9') or soup.find('div', class_='bbc-1ajedpd')
+        if main_list:
+            elements = main_list.find_all('h3')
+
+    headlines = []
+    for el in elements:
+        text = el.get_text(strip=True)
+        if len(text) >= MIN_HEADLINE_LENGTH:
+            headlines.append(text)
+        if len(headlines) >= MAX_HEADLINES_PER_SOURCE:
+            break
+    return headlines
+
+def iter_feed_titles(chunks: Iterable[bytes]) -> Iterator[str]:
+    """Yield RSS <item> / Atom <entry> titles incrementally as chunks arrive.
+
+    Nothing past the last title the caller asks for is read, so stopping
+    early leaves the rest of the response on the wire.
+    """
+    parser = ET.XMLPullParser(events=('start', 'end'))
+    path: List[str] = []
+    for chunk in chunks:
+        parser.feed(chunk)
+        for event, elem in parser.read_events():
+            name = elem.tag.rsplit('}', 1)[-1]   # drop Atom / RDF namespaces
+            if event == 'start':
+                path.append(name)
+                continue
+            path.pop()
+            if name == 'title' and path and path[-1] in FEED_ENTRY_TAGS:
+                yield "".join(elem.itertext()).strip()
+            elif name in FEED_ENTRY_TAGS:
+                elem.clear()   # keep memory flat on large feeds
+
+def parse_rss_headlines(content: Union[bytes, Iterable[bytes]]) -> List[str]:
+    """Extract item/entry titles from an RSS or Atom document (bytes or a chunk stream)."""
+    chunks = [content] if isinstance(content, (bytes, str)) else content
+    headlines = []
+    for text in iter_feed_titles(chunks):
+        if len(text) >= MIN_HEADLINE_LENGTH:
+            headlines.append(text)
+        if len(headlines) >= MAX_HEADLINES_PER_SOURCE:
+            break
+    return headlines
+
 def scrape_html_source(source: dict) -> List[str]:
-    """Scrapes headlines from an HTML source using BeautifulSoup."""
-    headers = {'User-Agent': random.choice(USER_AGENTS)}
+    """Scrapes headlines from an HTML source using BeautifulSoup (lxml backend when available)."""
     try:
-        response = requests.get(source["url"], headers=headers, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        selector = source["selector"]
-        if '.' in selector:
-            tag, cls = selector.split('.', 1)
-            elements = soup.find_all(tag, class_=cls)
-        elif '[' in selector:
-            elements = soup.select(selector)
-        else:
-            elements = soup.find_all(selector)
-
-        # BBC Special Fallback
-        if not elements and "bbc.com" in source["url"]:
-            main_list = soup.find('ul', class_='bbc-1rrncb9') or soup.find('div', class_='bbc-1ajedpd')
-            if main_list:
-                elements = main_list.find_all('h3')
-
-        headlines = []
-        for el in elements:
-            text = el.get_text(strip=True)
-            if len(text) >= MIN_HEADLINE_LENGTH:
-                headlines.append(text)
-            if len(headlines) >= MAX_HEADLINES_PER_SOURCE:
-                break
+        response, cached = _conditional_get(source)
+        if cached is not None:
+            return cached
+        headlines = parse_html_headlines(response.content, source)
+        get_validator_cache().store(source["url"], response.headers, headlines)
         return headlines
     except Exception as e:
         print(f"    [SCRAPE ERROR] {source['name']}: {e}")
         return []
 
 def scrape_rss_source(source: dict) -> List[str]:
-    """Scrapes headlines from an RSS source using ElementTree."""
-    headers = {'User-Agent': random.choice(USER_AGENTS)}
+    """Scrapes headlines from an RSS/Atom source, streaming the feed with ElementTree."""
     try:
-        response = requests.get(source["url"], headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        root = ET.fromstring(response.content)
-        titles = root.findall('.//item/title')
-        
-        headlines = []
-        for t in titles:
-            text = t.text.strip() if t.text else ""
-            if len(text) >= MIN_HEADLINE_LENGTH:
-                headlines.append(text)
-            if len(headlines) >= MAX_HEADLINES_PER_SOURCE:
-                break
+        response, cached = _conditional_get(source, stream=True)
+        if cached is not None:
+            return cached
+        try:
+            headlines = parse_rss_headlines(response.iter_content(chunk_size=FEED_CHUNK_SIZE))
+        finally:
+            response.close()   # drops the unread remainder once the cap is hit
+        get_validator_cache().store(source["url"], response.headers, headlines)
         return headlines
     except Exception as e:
         print(f"    [RSS ERROR] {source['name']}: {e}")
         return []
 
+# ── Concurrent Fetch Stage ─────────────────────────────────────────────────
+
+_host_lock = threading.Lock()
+_host_semaphores: Dict[str, threading.Semaphore] = {}
+_class_semaphores: Dict[str, threading.Semaphore] = {}
+
+RATE_LIMITER = HostRateLimiter.from_sources(SOURCES)
+
+def refresh_sources() -> bool:
+    """Pick up registry edits (hot reload). Returns True if SOURCES changed."""
+    global SOURCES, RATE_LIMITER
+    registry = get_registry()
+    if not registry.reload():
+        return False
+    SOURCES = registry.sources()
+    RATE_LIMITER = HostRateLimiter.from_sources(SOURCES)
+    with _host_lock:
+        _class_semaphores.clear()   # class sizes may have changed
+    print(f"    [REGISTRY] Reloaded {len(SOURCES)} sources from {registry.path}")
+    return True
+
+@contextmanager
+def _class_slot(concurrency_class: str):
+    """Bound concurrent fetches per concurrency class (e.g. heavy pages vs light feeds)."""
+    with _host_lock:
+        sem = _class_semaphores.get(concurrency_class)
+        if sem is None:
+            sem = _class_semaphores[concurrency_class] = threading.Semaphore(
+                get_registry().class_limit(concurrency_class))
+    with sem:
+        yield
+
+@contextmanager
+def _host_slot(host: str):
+    """Bound concurrent requests per host and throttle repeat hits to it."""
+    with _host_lock:
+        sem = _host_semaphores.setdefault(host, threading.Semaphore(MAX_REQUESTS_PER_HOST))
+    with sem:
+        RATE_LIMITER.acquire(host)
+        yield
+
+def fetch_source(source: dict) -> List[str]:
+    """Fetch one source's headlines, honouring its per-host and concurrency-class limits.
+
+    The host slot comes first: a source waiting on its host (or its host's
+    rate limit) must not hold a class slot other hosts could be using.
+    """
+    with _host_slot(host_of(source["url"])), _class_slot(source.get("concurrency_class", source["type"])):
+        if source["type"] == "html":
+            return scrape_html_source(source)
+        return scrape_rss_source(source)
+
+def _host_lanes(sources: List[dict]) -> List[List[int]]:
+    """Positions in `sources` split into lanes, each fetched one after another by one worker.
+
+    A host gets at most MAX_REQUESTS_PER_HOST lanes, so a worker never sits
+    blocked on a host slot held by another worker while other hosts wait.
+    """
+    by_host: Dict[str, List[int]] = {}
+    for i, source in enumerate(sources):
+        by_host.setdefault(host_of(source["url"]), []).append(i)
+    per_host = max(1, MAX_REQUESTS_PER_HOST)
+    return [positions[k::per_host] for positions in by_host.values() for k in range(min(per_host, len(positions)))]
+
+def fetch_all_sources(sources: List[dict], max_workers: Optional[int] = None) -> List[Tuple[dict, List[str]]]:
+    """Fetch all sources in parallel, one lane per host. Results come back in registry order."""
+    if not sources:
+        return []
+    # Compile every HTML selector once, before the workers start.
+    for source in sources:
+        if source.get("type") == "html" and source.get("selector"):
+            compile_selector(source["selector"])
+
+    headlines: List[List[str]] = [[] for _ in sources]
+
+    def fetch_lane(lane: List[int]) -> None:
+        for i in lane:
+            try:
+                headlines[i] = fetch_source(sources[i])
+            except Exception as e:
+                print(f"    [FETCH ERROR] {sources[i]['name']}: {e}")
+
+    lanes = _host_lanes(sources)
+    workers = max(1, min(max_workers or MAX_FETCH_WORKERS, len(lanes)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fetch") as pool:
+        list(pool.map(fetch_lane, lanes))
+    return list(zip(sources, headlines))
+
 def translate_headline(headline: str, src_language: str) -> str:
     """Translate a headline from source language to English."""
     if not headline.strip(): return ""
     try:
-        translator = GoogleTranslator(source=src_language, target='en')
+        translator = _translator_cls()(source=src_language, target='en')
         return translator.translate(headline)
     except Exception:
         return headline
 
+_translators: Dict[str, Any] = {}
+_translation_memory: Optional[TranslationMemory] = None
+
+def _get_translator(src_language: str):
+    """One shared translator client per source language."""
+    if src_language not in _translators:
+        _translators[src_language] = _translator_cls()(source=src_language, target='en')
+    return _translators[src_language]
+
+def get_translation_memory() -> TranslationMemory:
+    global _translation_memory
+    if _translation_memory is None:
+        _translation_memory = TranslationMemory()
+    return _translation_memory
+
+def _translate_misses(texts: List[str], src_language: str) -> List[Optional[str]]:
+    """Translate uncached texts in one batch; None marks a failed item."""
+    translator = _get_translator(src_language)
+    try:
+        return list(translator.translate_batch(texts))
+    except Exception:
+        # One bad item aborts the whole batch; retry item by item.
+        results = []
+        for text in texts:
+            try:
+                results.append(translator.translate(text))
+            except Exception:
+                results.append(None)
+        return results
+
+def translate_headlines(headlines: List[str], src_language: str,
+                        memory: Optional[TranslationMemory] = None) -> List[str]:
+    """Translate a batch to English, paying only for texts not in the translation memory.
+
+    Failed translations fall back to the original text and are not stored.
+    """
+    if memory is None:
+        memory = get_translation_memory()
+    results = memory.get_many(src_language, headlines)
+
+    misses = list(dict.fromkeys(h for h, r in zip(headlines, results) if r is None and h.strip()))
+    translated: Dict[str, Optional[str]] = {}
+    if misses:
+        translated = dict(zip(misses, _translate_misses(misses, src_language)))
+        memory.put_many(src_language, [(orig, tr) for orig, tr in translated.items() if tr])
+    return [
+        r if r is not None else ((translated.get(h) or h) if h.strip() else "")
+        for h, r in zip(headlines, results)
+    ]
+
+# Per-process counts: headlines kept out of the translator because they were
+# already English, and headlines sent under a language other than the source's.
+translation_stats = {'bypassed': 0, 'regrouped': 0}
+
+def translate_detected(headlines: List[str], src_language: str) -> Dict[str, str]:
+    """Original -> English for a source's headlines, translating only what needs it.
+
+    English headlines pass through untouched; the rest are batched per detected
+    language (e.g. a Portuguese item on BBC Mundo).
+    """
+    translations: Dict[str, str] = {}
+    for language, group in group_by_language(headlines, src_language).items():
+        if language == 'en':
+            translation_stats['bypassed'] += len(group)
+            translations.update((h, h) for h in group)
+            continue
+        if language != src_language.lower():
+            translation_stats['regrouped'] += len(group)
+        translations.update(zip(group, translate_headlines(group, language)))
+    return translations
+
+def _polarity_from_predictions(predictions: List[dict]) -> Tuple[float, str]:
+    """Collapse HF label scores into (polarity, top_label) via LABEL_TO_POLARITY."""
+    polarity = 0.0
+    top_label, top_score = 'neutral', 0.0
+    for pred in predictions:
+        label = pred.get('label', '').lower()
+        score = pred.get('score', 0.0)
+        weight = LABEL_TO_POLARITY.get(label, 0.0)
+        polarity += weight * score
+        if score > top_score:
+            top_score, top_label = score, label
+    return round(polarity, 4), top_label
+
 def analyze_sentiment(headline_en: str) -> Tuple[float, str]:
-    """Analyze sentiment using RoBERTa (HF API) or keyword fallback."""
-    if not HF_API_TOKEN:
+    """Analyze sentiment using RoBERTa (HF API), the local model, or keyword fallback."""
+    if _local_model() is not None:
+        return _score_sentiment_batch([headline_en])[0][:2]
+    if not HF_API_TOKEN or SENTIMENT_ENGINE == 'keyword':
         return _fallback_sentiment(headline_en)
 
     headers = {"Authorization": f"Bearer {HF_API_TOKEN}"}
     payload = {"inputs": headline_en}
 
     try:
-        response = requests.post(HF_API_URL, headers=headers, json=payload, timeout=10)
+        response = get_session().post(HF_API_URL, headers=headers, json=payload, timeout=10)
         if response.status_code == 200:
             result = response.json()
             if isinstance(result, list) and len(result) > 0:
                 predictions = result[0] if isinstance(result[0], list) else result
-                polarity = 0.0
-                top_label, top_score = 'neutral', 0.0
-                for pred in predictions:
-                    label = pred.get('label', '').lower()
-                    score = pred.get('score', 0.0)
-                    weight = LABEL_TO_POLARITY.get(label, 0.0)
-                    polarity += weight * score
-                    if score > top_score:
-                        top_score, top_label = score, label
-                return round(polarity, 4), top_label
+                return _polarity_from_predictions(predictions)
         return _fallback_sentiment(headline_en)
     except Exception:
         return _fallback_sentiment(headline_en)
 
+def _analyze_sentiment_chunk(chunk: List[str]) -> List[Tuple[float, str, str]]:
+    """Score one multi-input HF request as (polarity, label, model_used).
+
+    Items HF cannot score use the fallback and are tagged with fallback_model().
+    """
+    headers = {"Authorization": f"Bearer {HF_API_TOKEN}"}
+    try:
+        response = get_session().post(HF_API_URL, headers=headers, json={"inputs": chunk}, timeout=HF_BATCH_TIMEOUT)
+        if response.status_code == 200:
+            result = response.json()
+            # A single input may come back unwrapped: [{label, score}, ...]
+            if len(chunk) == 1 and isinstance(result, list) and result and isinstance(result[0], dict):
+                result = [result]
+            if isinstance(result, list) and len(result) == len(chunk):
+                return [
+                    (*_polarity_from_predictions(preds), HF_MODEL) if isinstance(preds, list) and preds
+                    else (*_fallback_sentiment(text), fallback_model())
+                    for text, preds in zip(chunk, result)
+                ]
+    except Exception as e:
+        print(f"    [HF ERROR] batch of {len(chunk)}: {e}")
+    return [(*scored, fallback_model()) for scored in fallback_sentiment_batch(chunk)]
+
+def _score_sentiment_batch(headlines_en: List[str], batch_size: Optional[int] = None,
+                           max_workers: Optional[int] = None) -> List[Tuple[float, str, str]]:
+    local = _local_model()
+    if local is not None:
+        name = local.name
+        return [(*_polarity_from_predictions(preds), name) for preds in local.predictions(headlines_en)]
+    if not HF_API_TOKEN or SENTIMENT_ENGINE == 'keyword':
+        return [(*scored, fallback_model()) for scored in fallback_sentiment_batch(headlines_en)]
+
+    size = max(1, batch_size or HF_BATCH_SIZE)
+    chunks = [headlines_en[i:i + size] for i in range(0, len(headlines_en), size)]
+    workers = max(1, min(max_workers or HF_MAX_CONCURRENT_BATCHES, len(chunks)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hf") as pool:
+        scored = pool.map(_analyze_sentiment_chunk, chunks)
+        return [result for chunk_results in scored for result in chunk_results]
+
+def analyze_sentiment_batch(headlines_en: List[str], batch_size: Optional[int] = None,
+                            max_workers: Optional[int] = None) -> List[Tuple[float, str]]:
+    """Score many headlines: chunked multi-input HF requests, run concurrently.
+
+    Returns (polarity, label) per headline in input order, with the same
+    polarity formula as analyze_sentiment().
+    """
+    if not headlines_en:
+        return []
+    return [(pol, label) for pol, label, _ in _score_sentiment_batch(headlines_en, batch_size, max_workers)]
+
+_sentiment_cache: Optional[SentimentCache] = None
+
+def get_sentiment_cache() -> SentimentCache:
+    global _sentiment_cache
+    if _sentiment_cache is None:
+        _sentiment_cache = SentimentCache()
+    return _sentiment_cache
+
+def _sentiment_cached_with_models(headlines_en: List[str],
+                                  cache: Optional[SentimentCache] = None) -> List[Tuple[float, str, str]]:
+    """analyze_sentiment_cached() plus the model behind each score."""
+    if not headlines_en:
+        return []
+    if cache is None:
+        cache = get_sentiment_cache()
+    model = active_sentiment_model()
+    results = [(*r, model) if r is not None else None for r in cache.get_many(model, headlines_en)]
+
+    missing = list(dict.fromkeys(h for h, r in zip(headlines_en, results) if r is None))
+    if missing:
+        scored = dict(zip(missing, _score_sentiment_batch(missing)))
+        by_model: Dict[str, List[Tuple[str, float, str]]] = {}
+        for text, (pol, label, used) in scored.items():
+            by_model.setdefault(used, []).append((text, pol, label))
+        for used, items in by_model.items():
+            cache.put_many(used, items)
+        results = [r if r is not None else scored[h] for h, r in zip(headlines_en, results)]
+    return [(float(pol), label, used) for pol, label, used in results]
+
+def analyze_sentiment_cached(headlines_en: List[str], cache: Optional[SentimentCache] = None) -> List[Tuple[float, str]]:
+    """Batch sentiment that consults the persistent cache before HF or the fallback.
+
+    Lookups use the active engine's key (HF_MODEL with a token, the local
+    model's name with SENTIMENT_ENGINE=local, FALLBACK_MODEL otherwise).
+    Results are stored under the model that actually produced them, so an
+    HF outage never pins fallback scores into the HF cache.
+    """
+    return [(pol, label) for pol, label, _ in _sentiment_cached_with_models(headlines_en, cache)]
+
+def active_sentiment_model() -> str:
+    """Cache key of the engine that scores headlines in this process."""
+    local = _local_model()
+    if local is not None:
+        return local.name
+    return HF_MODEL if HF_API_TOKEN and SENTIMENT_ENGINE != 'keyword' else fallback_model()
+
+def _local_model() -> Optional[LocalSentimentModel]:
+    """The offline model when SENTIMENT_ENGINE=local and one has been trained."""
+    return get_local_model() if SENTIMENT_ENGINE == 'local' else None
+
 def _fallback_sentiment(headline_en: str) -> Tuple[float, str]:
-    text = headline_en.lower()
-    positive_words = {'good', 'great', 'success', 'win', 'peace', 'growth', 'progress', 'victory', 'improve'}
-    negative_words = {'war', 'kill', 'death', 'attack', 'crisis', 'fail', 'disaster', 'conflict', 'terror'}
-    pos = sum(1 for w in positive_words if w in text)
-    neg = sum(1 for w in negative_words if w in text)
-    total = pos + neg
-    if total == 0: return 0.0, 'neutral'
-    polarity = round((pos - neg) / total, 4)
-    label = 'positive' if polarity > 0 else ('negative' if polarity < 0 else 'neutral')
-    return polarity, label
+    return get_lexicon_scorer().score(headline_en)
+
+def fallback_model() -> str:
+    """Cache key of the keyword fallback with the configured lexicon."""
+    scorer = get_lexicon_scorer()
+    return FALLBACK_MODEL if scorer.is_default else f"{FALLBACK_MODEL}:{scorer.fingerprint}"
+
+def fallback_sentiment_batch(headlines_en: List[str]) -> List[Tuple[float, str]]:
+    """Keyword fallback for a whole batch in one vectorized pass."""
+    return get_lexicon_scorer().score_batch(headlines_en)
 
 def perform_ner(text: str) -> List[Tuple[str, str]]:
-    doc = nlp(text)
+    doc = get_nlp()(text)
     return [(ent.text, ent.label_) for ent in doc.ents]
 
+def perform_ner_batch(texts: List[str], batch_size: Optional[int] = None,
+                      n_process: Optional[int] = None) -> List[List[Tuple[str, str]]]:
+    """NER over many texts with nlp.pipe. Same tuples as perform_ner, in input order."""
+    docs = get_nlp().pipe(texts, batch_size=batch_size or NER_BATCH_SIZE, n_process=n_process or NER_N_PROCESS)
+    return [[(ent.text, ent.label_) for ent in doc.ents] for doc in docs]
+
+def analysis_models() -> str:
+    """HeadlineIndex key part: the sentiment engine and spaCy model behind a stored analysis."""
+    return f"{active_sentiment_model()}|{SPACY_MODEL}"
+
+_headline_index: Optional[HeadlineIndex] = None
+
+def get_headline_index() -> HeadlineIndex:
+    global _headline_index
+    if _headline_index is None:
+        _headline_index = HeadlineIndex()
+    return _headline_index
+
 # ── Main Entry Point ───────────────────────────────────────────────────────
 
-def main():
+def new_headlines(source: dict, raw_headlines: List[str], writer: RawCsvWriter, headline_index: HeadlineIndex,
+                  models: str) -> Tuple[List[str], List[Optional[Dict]]]:
+    """A source's headlines not yet in today's CSV, with the stored analysis of those seen in earlier runs.
+
+    Returns (originals, known): known[i] is None for a headline that still needs analysing.
+    """
+    # 2. New headlines (double check length safeguard), skipping ones already saved today
+    originals = [h for h in dict.fromkeys(raw_headlines)
+                 if len(h) >= MIN_HEADLINE_LENGTH and not writer.has_headline(source['name'], h)]
+    if not originals:
+        print("    No new headlines since the last fetch.")
+        return [], []
+
+    # Headlines seen in an earlier run reuse their stored analysis
+    known = headline_index.get_many(models, source['name'], originals)
+    fresh = sum(1 for k in known if k is None)
+    if fresh < len(originals):
+        print(f"    [INDEX] {len(originals) - fresh} already analysed, {fresh} new.")
+    return originals, known
+
+def analyse_headlines(pending: List[Tuple[dict, List[str]]]) -> Dict[Tuple[str, str], Dict]:
+    """Translate, score and tag the new headlines of many sources in one pass.
+
+    Translation is batched per source language across sources; sentiment and
+    NER each run once over everything, so HF chunking and nlp.pipe see the
+    whole run. Returns (source name, original) -> analysis.
+    """
+    by_language: Dict[str, List[str]] = {}
+    for source, fresh in pending:
+        if source["requires_translation"]:
+            by_language.setdefault(source["language"], []).extend(fresh)
+    translations = {language: translate_detected(list(dict.fromkeys(group)), language)
+                    for language, group in by_language.items() if group}
+
+    items = [(source, original, translations[source["language"]][original] if source["requires_translation"]
+              else original) for source, fresh in pending for original in fresh]
+    if not items:
+        return {}
+    english = [translated for _, _, translated in items]
+
+    # 3. Analysis phase (new headlines only), batched across the run
+    sentiments = _sentiment_cached_with_models(english)
+    entity_lists = perform_ner_batch(english)
+    active = active_sentiment_model()
+    analysed = {}
+    for (source, original, translated), (polarity, label, model_used), entities in zip(items, sentiments, entity_lists):
+        # Failed translations and HF fallbacks are retried next run rather than pinned
+        translated_ok = (not source["requires_translation"] or translated != original
+                         or detect_language(original, source["language"]) == 'en')
+        analysed[(source['name'], original)] = {
+            'Translated_Headline': translated, 'Polarity': polarity, 'Sentiment_Label': label,
+            'Entities': entities, 'Indexable': translated_ok and model_used == active,
+        }
+    return analysed
+
+def commit_source(source: dict, originals: List[str], known: List[Optional[Dict]],
+                  analysed: Dict[Tuple[str, str], Dict], writer: RawCsvWriter, headline_index: HeadlineIndex,
+                  models: str, scrape_date: str) -> int:
+    """Append one source's rows to today's CSV and index its newly analysed headlines.
+
+    Returns the number of rows written.
+    """
+    rows = []
+    to_index = []
+    for original_headline, analysis in zip(originals, known):
+        if analysis is None:
+            analysis = analysed[(source['name'], original_headline)]
+            if analysis['Indexable']:
+                to_index.append((source['name'], original_headline, analysis['Translated_Headline'],
+                                 analysis['Polarity'], analysis['Sentiment_Label'], analysis['Entities']))
+            # Safe console print
+            try:
+                print(f"    -> [{analysis['Sentiment_Label']}] {analysis['Polarity']:+.2f} | {analysis['Translated_Headline'][:70]}...")
+            except UnicodeEncodeError:
+                print(f"    -> [{analysis['Sentiment_Label']}] {analysis['Polarity']:+.2f} | [Encoded Content]")
+        # --- PHASE 4: CSV Schema Preservation ---
+        rows.append({
+            'Scrape_Date': scrape_date,
+            'Source_Name': source['name'],
+            'Source_URL': source['url'],
+            'Source_Language_Code': source['language'],
+            'Source_Region': source['region'], # Regional data for dashboard
+            'Original_Headline': original_headline,
+            'Translated_Headline': analysis['Translated_Headline'],
+            'Polarity': analysis['Polarity'],
+            'Sentiment_Label': analysis['Sentiment_Label'],
+            'Entities_Raw': encode_entities(analysis['Entities']),
+        })
+    written = writer.append_rows(rows)
+    headline_index.put_many(models, to_index)
+    return written
+
+def main(run_all: bool = False, schedule: Optional[ScheduleState] = None, resume: bool = False):
+    """One scrape pass over the sources that are due (all enabled ones with run_all).
+
+    The new headlines of every due source are analysed in one run-wide pass;
+    each source's rows are then committed to today's raw CSV on their own,
+    so a crash keeps the sources already done. Headlines a source
+    already produced earlier today are skipped; with `resume`, sources that
+    already have rows in today's file are skipped entirely (task retries).
+    """
     current_date_str = date.today().strftime("%Y_%m_%d")
     output_dir = os.path.join(os.getcwd(), "raw_csv_daily")
     os.makedirs(output_dir, exist_ok=True)
     csv_filepath = os.path.join(output_dir, f"raw_headlines_data_{current_date_str}.csv")
 
-    data_to_save = []
-    total_sources = 0
+    writer = RawCsvWriter(csv_filepath)
     failed_sources = 0
 
     print(f"\n--- Intelligence Gathering: {current_date_str} ---")
 
-    for source in SOURCES:
-        if not source["enabled"]:
-            continue
-        
-        total_sources += 1
+    refresh_sources()
+    schedule = schedule if schedule is not None else ScheduleState()
+    enabled_sources = [s for s in SOURCES if s["enabled"]]
+    due_sources = enabled_sources if run_all else schedule.due_sources(enabled_sources)
+    if resume:
+        done = writer.sources_written()
+        if done:
+            print(f"[*] Resuming: {len(done)} sources already in today's file.")
+        due_sources = [s for s in due_sources if s["name"] not in done]
+    total_sources = len(due_sources)
+    if not due_sources:
+        print("[*] No sources due yet.")
+        return
+    print(f"[*] Fetching {total_sources}/{len(enabled_sources)} due sources ({min(MAX_FETCH_WORKERS, len(_host_lanes(due_sources)))} workers)...")
+    # Every source is stamped with this, not with when its own processing
+    # finished, so a late-processed source is not pushed past the next run.
+    run_started = time.time()
+    get_validator_cache().reset_counts()
+    fetched = fetch_all_sources(due_sources)
+    not_modified = get_validator_cache().not_modified
+    if not_modified:
+        print(f"    [CACHE] {not_modified} sources unchanged since last fetch (304 Not Modified)")
+    headline_index = get_headline_index()
+    models = analysis_models()
+
+    pending = []
+    for source, raw_headlines in fetched:
         print(f"\n[*] Processing {source['name']} ({source['region']})...")
-        
+
         # --- PHASE 4: Try/Except Safeguard per Source ---
         try:
-            # 1. Scrape
-            if source["type"] == "html":
-                raw_headlines = scrape_html_source(source)
-            else:
-                raw_headlines = scrape_rss_source(source)
-
             if not raw_headlines:
                 # --- PHASE 4: [WARN] logging ---
                 print(f"    [WARN] {source['name']} returned 0 headlines.")
                 failed_sources += 1
-                time.sleep(1) # Maintain rhythm
                 continue
 
             print(f"    Fetched {len(raw_headlines)} headlines.")
-
-            # 2. Process Headlines
-            for original_headline in raw_headlines:
-                # Double check length safeguard
-                if len(original_headline) < MIN_HEADLINE_LENGTH:
-                    continue
-
-                # Translation phase
-                if source["requires_translation"]:
-                    translated_headline = translate_headline(original_headline, source["language"])
-                else:
-                    translated_headline = original_headline
-
-                # Analysis phase
-                polarity, sentiment_label = analyze_sentiment(translated_headline)
-                entities = perform_ner(translated_headline)
-
-                # Safe console print
-                try:
-                    print(f"    -> [{sentiment_label}] {polarity:+.2f} | {translated_headline[:70]}...")
-                except UnicodeEncodeError:
-                    print(f"    -> [{sentiment_label}] {polarity:+.2f} | [Encoded Content]")
-
-                # --- PHASE 4: CSV Schema Preservation ---
-                data_to_save.append({
-                    'Scrape_Date': current_date_str,
-                    'Source_Name': source['name'],
-                    'Source_URL': source['url'],
-                    'Source_Language_Code': source['language'],
-                    'Source_Region': source['region'], # Regional data for dashboard
-                    'Original_Headline': original_headline,
-                    'Translated_Headline': translated_headline,
-                    'Polarity': polarity,
-                    'Sentiment_Label': sentiment_label,
-                    'Entities_Raw': str(entities)
-                })
+            originals, known = new_headlines(source, raw_headlines, writer, headline_index, models)
+            if originals:
+                pending.append((source, originals, known))
+            else:
+                schedule.mark_fetched([source['name']], when=run_started)
 
         except Exception as e:
             print(f"    [CRITICAL ERROR] Failed to process source {source['name']}: {e}")
             failed_sources += 1
 
-        # --- PHASE 4: Rate Limiting ---
-        time.sleep(1)
+    # One translation / sentiment / NER pass for the whole run; should it fail,
+    # each source is analysed on its own so one bad source only loses itself.
+    fresh = [(source, [h for h, k in zip(originals, known) if k is None]) for source, originals, known in pending]
+    try:
+        analysed = analyse_headlines(fresh)
+    except Exception as e:
+        print(f"\n    [WARN] Run-wide analysis failed ({e}); analysing source by source.")
+        analysed = None
 
-    if data_to_save:
-        # Downstream scripts expect these columns
-        fieldnames = ['Scrape_Date', 'Source_Name', 'Source_URL', 'Source_Language_Code', 'Source_Region', 
-                      'Original_Headline', 'Translated_Headline', 'Polarity', 'Sentiment_Label', 'Entities_Raw']
+    for (source, originals, known), source_fresh in zip(pending, fresh):
+        print(f"\n[*] Committing {source['name']}...")
+        try:
+            source_analysis = analysed if analysed is not None else analyse_headlines([source_fresh])
+            commit_source(source, originals, known, source_analysis, writer, headline_index, models,
+                          current_date_str)
+            # Only a committed source counts as fetched for the schedule
+            schedule.mark_fetched([source['name']], when=run_started)
 
-        with open(csv_filepath, mode='w', newline='', encoding='utf-8') as csv_file:
-            writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(data_to_save)
+        except Exception as e:
+            print(f"    [CRITICAL ERROR] Failed to process source {source['name']}: {e}")
+            failed_sources += 1
 
-    print(f"\n[DONE] {len(data_to_save)} headlines collected from {total_sources - failed_sources} sources. {failed_sources} sources failed.")
+    for cache_name, cache in (("translation", get_translation_memory()), ("sentiment", get_sentiment_cache()),
+                              ("headline index", headline_index)):
+        stats = cache.stats()
+        print(f"    [CACHE] {cache_name}: {stats['hits']} hits, {stats['misses']} misses, {stats['entries']} cached")
+    if translation_stats['bypassed'] or translation_stats['regrouped']:
+        print(f"    [TRANSLATE] {translation_stats['bypassed']} English headlines skipped the translator, "
+              f"{translation_stats['regrouped']} sent under their detected language")
+    local = _local_model()
+    if local is not None and local.rows_scored:
+        print(f"    [SENTIMENT] local engine: {local.rows_scored} headlines at {local.throughput():,.0f}/s")
+
+    close_session()
+    print(f"\n[DONE] {writer.rows_written} headlines collected from {total_sources - failed_sources} sources. {failed_sources} sources failed.")
+
+def run_scheduler(max_sleep_seconds: float = 300.0):
+    """Keep scraping: each source runs at its own fetch_interval_minutes."""
+    schedule = ScheduleState()
+    while True:
+        main(schedule=schedule)
+        wait = schedule.seconds_until_next(SOURCES)
+        wait = max_sleep_seconds if wait is None else min(max(wait, 1.0), max_sleep_seconds)
+        print(f"[*] Next check in {wait:.0f}s")
+        time.sleep(wait)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    import argparse
+    parser = argparse.ArgumentParser(description="Scrape the sources in site_configs.json.")
+    parser.add_argument("--all", action="store_true", help="fetch every enabled source, ignoring schedules")
+    parser.add_argument("--loop", action="store_true", help="keep running, fetching each source when it is due")
+    parser.add_argument("--resume", action="store_true", help="skip sources already present in today's CSV")
+    args = parser.parse_args()
+    if args.loop:
+        run_scheduler()
+    else:
+        main(run_all=args.all, resume=args.resume)
@@ -34,8 +34,12 @@ default_args = {
 def task_scrape_headlines(**context):
     """Step 1: Scrape headlines from 6 BBC language services."""
     from Scraping_Scripts.web_scraper import main as run_scraper
-    print("[AIRFLOW] Starting headline scraping...")
-    run_scraper()
+    # A retry only redoes the sources that are not yet in today's CSV.
+    ti = context.get('ti')
+    resume = bool(ti and ti.try_number > 1)
+    print(f"[AIRFLOW] Starting headline scraping{' (resume)' if resume else ''}...")
+    # A daily DAG fetches every enabled source; per-source schedules are for --loop.
+    run_scraper(run_all=True, resume=resume)
     print("[AIRFLOW] Scraping complete.")
 
 
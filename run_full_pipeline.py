@@ -47,7 +47,8 @@ def run_full_pipeline(force_summaries: bool = False) -> None:
 
     # ── Step 1/8: Scrape Headlines ─────────────────────────────
     logger.info("[STEP 1/8] Scraping Headlines (HF RoBERTa Sentiment)...")
-    run_scraper()
+    # Once a day: fetch every enabled source, per-source schedules are for --loop.
+    run_scraper(run_all=True)
     logger.info("[STEP 1/8] Complete.")
 
     # ── Step 2/8: Data Quality Validation ──────────────────────
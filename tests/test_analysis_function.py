@@ -0,0 +1,63 @@
+"""
+Tests for Data_Processing/analysis_function.py
+"""
+
+import subprocess
+import sys
+import pytest
+import pandas as pd
+from unittest.mock import patch
+import Data_Processing.analysis_function as analysis
+from Data_Processing.entity_store import EntityCountStore
+
+
+def _raw(day, headline):
+    return pd.DataFrame({
+        'Scrape_Date': [day], 'Source_Name': ['BBC Mundo'], 'Source_URL': ['https://www.bbc.com/mundo'],
+        'Source_Language_Code': ['es'], 'Source_Region': ['Latin America'], 'Original_Headline': [headline],
+        'Translated_Headline': [headline], 'Polarity': [0.2], 'Sentiment_Label': ['positive'],
+        'Entities_Raw': ['[["Madrid", "GPE"]]'],
+    })
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    raw, cleaned = tmp_path / "raw", tmp_path / "cleaned"
+    raw.mkdir()
+    for day in ("2026_01_01", "2026_01_03"):
+        _raw(day, f"headline {day}").to_csv(raw / f"raw_headlines_data_{day}.csv", index=False)
+    with patch.object(analysis, 'RAW_DIR', raw), patch.object(analysis, 'OUTPUT_DIR', cleaned), \
+            patch.object(analysis, 'CHART_DIR', tmp_path / "charts"), \
+            patch.object(analysis, 'get_entity_store', return_value=EntityCountStore(':memory:')), \
+            patch.object(analysis, 'sync_table'):
+        yield raw, cleaned
+
+
+class TestRunAnalysisPipeline:
+    """Tests for date-parameterized runs and backfills."""
+
+    def test_import_does_no_io(self, tmp_path):
+        code = ("import os; os.makedirs = os.mkdir = None; "
+                "import Data_Processing.analysis_function as a; assert not hasattr(a, 'INPUT_FILE')")
+        subprocess.run([sys.executable, "-c", code], check=True, cwd=str(analysis.PROJECT_ROOT))
+
+    def test_days_between(self):
+        assert analysis.days_between("2026-01-30", "2026_02_01") == ["2026_01_30", "2026_01_31", "2026_02_01"]
+
+    def test_single_day(self, dirs):
+        _, cleaned = dirs
+        df_h, df_e = analysis.run_analysis_pipeline("2026-01-03", max_workers=1)
+        assert df_h['Original_Headline'].tolist() == ["headline 2026_01_03"]
+        assert df_e[['Entity', 'Label']].values.tolist() == [["Madrid", "GPE"]]
+        assert sorted(p.name for p in cleaned.iterdir()) == [
+            "processed_data_final_2026_01_03.csv", "processed_entities_final_2026_01_03.csv"]
+
+    def test_backfill_range_in_pool(self, dirs):
+        _, cleaned = dirs
+        df_h, _ = analysis.run_analysis_pipeline("2026_01_01", "2026_01_05", max_workers=2)
+        assert df_h['Scrape_Date'].tolist() == ["2026_01_01", "2026_01_03"]
+        assert len(list(cleaned.glob("processed_data_final_*.csv"))) == 2
+        assert not list(cleaned.glob("*.tmp"))
+
+    def test_missing_day_returns_none(self, dirs):
+        assert analysis.run_analysis_pipeline("2026_01_02", max_workers=1) == (None, None)
@@ -0,0 +1,53 @@
+"""
+Tests for Data_Processing/charts.py
+"""
+
+import pandas as pd
+from unittest.mock import patch
+from Data_Processing.charts import (
+    ChartJob, render_charts, sentiment_by_source_job, top_entities_job,
+)
+
+
+def _headlines(polarity=0.4):
+    return pd.DataFrame({'Source_Name': ['BBC Mundo', 'BBC Hindi'], 'Polarity': [polarity, -0.2]})
+
+
+class TestChartJobs:
+    """Tests for job construction and input hashing."""
+
+    def test_hash_follows_inputs(self):
+        job = sentiment_by_source_job(_headlines(), '2026_01_01')
+        assert job.filename == 'sentiment_by_source_2026_01_01.png'
+        assert job.points == (('BBC Hindi', -0.2), ('BBC Mundo', 0.4))
+        assert job.input_hash() == sentiment_by_source_job(_headlines(), '2026_01_01').input_hash()
+        assert job.input_hash() != sentiment_by_source_job(_headlines(0.5), '2026_01_01').input_hash()
+
+    def test_no_entities_no_job(self):
+        assert top_entities_job(pd.Series(dtype='int64')) is None
+
+
+class TestRenderCharts:
+    """Tests for skip-if-unchanged and the worker pool."""
+
+    def test_unchanged_charts_are_skipped(self, tmp_path):
+        jobs = [sentiment_by_source_job(_headlines(), '2026_01_01'),
+                top_entities_job(pd.Series({'US': 3, 'UN': 1}))]
+        first = render_charts(jobs, tmp_path, max_workers=2)
+        assert sorted(first['rendered']) == ['sentiment_by_source_2026_01_01.png', 'top_entities.png']
+        assert (tmp_path / 'top_entities.png').stat().st_size > 0
+
+        with patch('Data_Processing.charts._render') as render:
+            second = render_charts(jobs, tmp_path)
+        render.assert_not_called()
+        assert len(second['skipped']) == 2
+
+    def test_changed_or_missing_chart_is_redrawn(self, tmp_path):
+        render_charts([sentiment_by_source_job(_headlines(), '2026_01_01')], tmp_path)
+        (tmp_path / 'sentiment_by_source_2026_01_01.png').unlink()
+        job = ChartJob('top_entities', 'top_entities.png', (('US', 1.0),))
+        with patch('Data_Processing.charts._render', side_effect=lambda j, p: j.filename) as render:
+            result = render_charts([sentiment_by_source_job(_headlines(), '2026_01_01'), job], tmp_path,
+                                   max_workers=1)
+        assert render.call_count == 2
+        assert sorted(result['rendered']) == ['sentiment_by_source_2026_01_01.png', 'top_entities.png']
@@ -3,6 +3,7 @@ Tests for Data_Processing/data_aggregator.py
 Validates dashboard JSON generation, geo_data fields, and digest synthesis.
 """
 
+import os
 import pytest
 import json
 from unittest.mock import patch
@@ -79,3 +80,179 @@ class TestBuildDailySummary:
             assert 'date' in day
             assert 'total_headlines' in day
             assert 'avg_polarity' in day
+
+
+def _reference_daily_summary(df_headlines, df_entities):
+    """The per-date filtering version _build_daily_summary replaced, kept as its oracle."""
+    from collections import Counter
+    result = {}
+    grouped = df_headlines.groupby(['Scrape_Date', 'Source_Name'])['Polarity'].agg(['size', 'mean'])
+    for (date, source), row in grouped.iterrows():
+        day = result.setdefault(str(date), {'date': str(date), 'sources': {}})
+        day['sources'][source] = {'count': int(row['size']), 'avg_polarity': round(float(row['mean']), 4)}
+    for date_key, data in result.items():
+        day_df = df_headlines[df_headlines['Scrape_Date'] == date_key]
+        total = len(day_df)
+        data['total_headlines'] = total
+        data['avg_polarity'] = round(float(day_df['Polarity'].mean()), 4)
+        counts = day_df['Polarity'].apply(_sentiment_label).value_counts()
+        pos, neu, neg = (int(counts.get(k, 0)) for k in ('Positive', 'Neutral', 'Negative'))
+        data['sentiment_distribution'] = {
+            'positive': pos, 'neutral': neu, 'negative': neg,
+            'positive_pct': round(pos / total * 100, 1), 'neutral_pct': round(neu / total * 100, 1),
+            'negative_pct': round(neg / total * 100, 1),
+        }
+        src_sent = data['sources']
+        data['most_positive_source'] = max(src_sent, key=lambda s: src_sent[s]['avg_polarity'])
+        data['most_negative_source'] = min(src_sent, key=lambda s: src_sent[s]['avg_polarity'])
+        day_ents = df_entities[df_entities['Scrape_Date'] == date_key]
+        data['top_entities'] = dict(Counter(day_ents['Entity'].tolist()).most_common(5))
+    return list(result.values())
+
+
+def _synthetic_history(days, per_day=40, seed=0):
+    """Headlines and entities for `days` days, with tied entity counts and boundary polarities."""
+    import numpy as np
+    import pandas as pd
+    rng = np.random.default_rng(seed)
+    dates = [f"2025_{1 + d // 28:02d}_{1 + d % 28:02d}" for d in range(days)]
+    headlines = pd.DataFrame({
+        'Scrape_Date': np.repeat(dates, per_day),
+        'Source_Name': rng.choice(['BBC Hindi', 'BBC Russian', 'BBC Spanish', 'DW'], days * per_day),
+        'Polarity': rng.choice([0.05, -0.05, 0.0501, -0.3, 0.0, 0.4], days * per_day),
+    })
+    entities = pd.DataFrame({
+        'Scrape_Date': np.repeat(dates, per_day * 2),
+        'Entity': rng.choice(['Modi', 'Putin', 'Delhi', 'Moscow', 'Tokyo', 'Lula', 'EU', 'UN'], days * per_day * 2),
+    })
+    return headlines, entities
+
+
+class TestBuildDailySummaryGrouped:
+    """The single-pass daily summary must match the per-date version exactly."""
+
+    def test_matches_per_date_reference(self):
+        headlines, entities = _synthetic_history(days=30)
+        expected = _reference_daily_summary(headlines, entities)
+        assert json.dumps(_build_daily_summary(headlines, entities)) == json.dumps(expected)
+
+    def test_entity_ties_keep_first_appearance(self):
+        import pandas as pd
+        headlines = pd.DataFrame({'Scrape_Date': ['2025_01_15'], 'Source_Name': ['DW'], 'Polarity': [0.1]})
+        entities = pd.DataFrame({
+            'Scrape_Date': ['2025_01_15'] * 8 + ['2025_01_16'],
+            'Entity': ['F', 'E', 'D', 'C', 'B', 'A', 'A', 'B', 'Z'],
+        })
+        top = _build_daily_summary(headlines, entities)[0]['top_entities']
+        assert list(top.items()) == [('B', 2), ('A', 2), ('F', 1), ('E', 1), ('D', 1)]
+
+    def test_sentiment_thresholds_are_exclusive(self):
+        import pandas as pd
+        headlines = pd.DataFrame({
+            'Scrape_Date': ['2025_01_15'] * 4, 'Source_Name': ['DW'] * 4,
+            'Polarity': [0.05, -0.05, 0.0501, -0.0501],
+        })
+        dist = _build_daily_summary(headlines)[0]['sentiment_distribution']
+        assert (dist['positive'], dist['neutral'], dist['negative']) == (1, 2, 1)
+
+    def test_row_scans_do_not_grow_with_the_number_of_days(self):
+        """The per-date version compared every row against each day; the grouped one never does."""
+        import pandas as pd
+        compare = pd.Series.__eq__
+
+        def scans(days):
+            headlines, entities = _synthetic_history(days=days)
+            calls = []
+
+            def counting(self, other):
+                calls.append(len(self))
+                return compare(self, other)
+            with patch.object(pd.Series, '__eq__', counting):
+                _build_daily_summary(headlines, entities)
+            return len(calls)
+
+        assert scans(10) == scans(100)
+
+    @pytest.mark.skipif(not os.environ.get('RUN_BENCHMARKS'), reason="wall-clock benchmark; set RUN_BENCHMARKS=1")
+    def test_faster_than_per_date_reference_at_10x_history(self):
+        """Benchmark: ~10x the current history (about 130k headlines over 330 days)."""
+        import time
+        headlines, entities = _synthetic_history(days=330, per_day=400)
+
+        started = time.perf_counter()
+        expected = _reference_daily_summary(headlines, entities)
+        reference_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        result = _build_daily_summary(headlines, entities)
+        grouped_seconds = time.perf_counter() - started
+
+        assert json.dumps(result) == json.dumps(expected)
+        assert grouped_seconds * 5 < reference_seconds, \
+            f"grouped {grouped_seconds:.3f}s vs per-date {reference_seconds:.3f}s"
+
+
+class TestGenerateDashboardDataReuse:
+    """Tests for the run-manifest skip of an unchanged rebuild."""
+
+    @pytest.fixture
+    def aggregator_env(self, tmp_path, sample_headlines_df, sample_entities_df):
+        """data_aggregator with its inputs, output and manifest under tmp_path; yields the build spy."""
+        import Data_Processing.data_aggregator as aggregator
+        from Data_Processing.run_manifest import RunManifest
+
+        cleaned = tmp_path / 'cleaned_csv_daily'
+        cleaned.mkdir()
+        headlines = sample_headlines_df.assign(Source_Name=sample_entities_df['Source_Name'].iloc[0])
+        headlines.to_csv(cleaned / 'processed_data_final_2025_01_15.csv', index=False)
+        sample_entities_df.to_csv(cleaned / 'processed_entities_final_2025_01_15.csv', index=False)
+        with patch.object(aggregator, 'PROJECT_ROOT', tmp_path), \
+                patch.object(aggregator, 'get_run_manifest', return_value=RunManifest(str(tmp_path / 'm.json'))), \
+                patch.object(aggregator, 'generate_all_briefings', None), \
+                patch.object(aggregator, '_build_daily_summary', wraps=aggregator._build_daily_summary) as build:
+            yield aggregator, build
+
+    def test_rebuilds_only_when_inputs_change(self, aggregator_env, tmp_path, capsys):
+        import os
+        aggregator, build = aggregator_env
+        built = aggregator.generate_dashboard_data()
+        reused = aggregator.generate_dashboard_data()
+        assert build.call_count == 1
+        assert 'reusing' in capsys.readouterr().out
+
+        path = tmp_path / 'cleaned_csv_daily' / 'processed_data_final_2025_01_15.csv'
+        os.utime(path, (1, 1))
+        aggregator.generate_dashboard_data()
+        aggregator.generate_dashboard_data(force=True)
+        assert build.call_count == 3
+        written = json.loads((tmp_path / 'Data_Output' / 'dashboard_data.json').read_text())
+        assert written['total_headlines'] > 0
+        # Both paths return the dashboard contents.
+        assert reused == json.loads(json.dumps(built, default=str))
+
+    def test_failed_briefing_is_not_reused(self, aggregator_env, capsys):
+        aggregator, build = aggregator_env
+        briefings = {'daily': {'briefing': 'Error: 429 quota exhausted'}}
+        with patch.object(aggregator, 'generate_all_briefings', return_value=briefings), \
+                patch.object(aggregator, 'briefing_input_state', return_value=[True]):
+            first = aggregator.generate_dashboard_data()
+            aggregator.generate_dashboard_data()
+            assert build.call_count == 2
+            assert first['reports']['daily']['briefing'].startswith('Error:')
+
+            briefings['daily'] = {'briefing': 'All quiet.'}
+            aggregator.generate_dashboard_data()
+            aggregator.generate_dashboard_data()
+            assert build.call_count == 3
+
+    def test_briefing_inputs_are_part_of_the_version(self, aggregator_env):
+        aggregator, build = aggregator_env
+        state = [False]
+        with patch.object(aggregator, 'generate_all_briefings', return_value={}), \
+                patch.object(aggregator, 'briefing_input_state', side_effect=lambda: list(state)):
+            aggregator.generate_dashboard_data()
+            state[:] = [True]                                # a key turned up in .env
+            aggregator.generate_dashboard_data()
+            state[:] = [True, ['sqlite', '120', '2025-01-15', '300']]   # headlines loaded into the DB
+            aggregator.generate_dashboard_data()
+            aggregator.generate_dashboard_data()
+            assert build.call_count == 3
@@ -0,0 +1,126 @@
+"""
+Tests for Data_Processing/dataset.py
+"""
+
+import os
+import pytest
+import pandas as pd
+from unittest.mock import patch
+from Data_Processing.dataset import PartitionedDataset
+
+pytest.importorskip("pyarrow")
+
+
+def _write_day(directory, day, rows):
+    df = pd.DataFrame(rows, columns=['Source_Name', 'Original_Headline', 'Translated_Headline', 'Polarity',
+                                     'Scrape_Date'])
+    path = directory / f"processed_data_final_{day}.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+def _csv_history(directory):
+    frames = [pd.read_csv(p) for p in sorted(directory.glob("processed_data_final_*.csv"))]
+    return pd.concat([f for f in frames if not f.empty], ignore_index=True)
+
+
+@pytest.fixture
+def cleaned(tmp_path):
+    directory = tmp_path / "cleaned"
+    directory.mkdir()
+    _write_day(directory, "2026_01_30", [("BBC Mundo", "a", "A", 0.5, "2026_01_30")])
+    _write_day(directory, "2026_01_31", [("BBC Hindi", "b", "B", -0.2, "2026_01_31"),
+                                         ("BBC Mundo", "c", "C", None, "2026_01_31")])
+    _write_day(directory, "2026_02_01", [("France 24", "d", "D", 0.0, "2026_02_01")])
+    return directory
+
+
+class TestPartitionedDataset:
+    """Tests for migration, hybrid reads and pushdown."""
+
+    def test_migrated_history_matches_csvs(self, tmp_path, cleaned):
+        dataset = PartitionedDataset(str(tmp_path / "dataset"))
+        assert dataset.sync('headlines', csv_dir=str(cleaned)) == 3
+        assert sorted(p.parent.name for p in (tmp_path / "dataset" / "headlines").glob("*/part.parquet")) == \
+            ["month=2026_01", "month=2026_02"]
+        pd.testing.assert_frame_equal(dataset.read('headlines', csv_dir=str(cleaned)), _csv_history(cleaned))
+        assert dataset.sync('headlines', csv_dir=str(cleaned)) == 0
+
+    def test_projection_and_date_range(self, tmp_path, cleaned):
+        dataset = PartitionedDataset(str(tmp_path / "dataset"))
+        dataset.sync('headlines', csv_dir=str(cleaned))
+        df = dataset.read('headlines', columns=['Source_Name', 'Polarity'], start='2026-01-31', end='2026_02_01',
+                          csv_dir=str(cleaned))
+        assert list(df.columns) == ['Source_Name', 'Polarity']
+        assert df['Source_Name'].tolist() == ["BBC Hindi", "BBC Mundo", "France 24"]
+
+    def test_changed_and_new_days_come_from_csv_in_order(self, tmp_path, cleaned):
+        dataset = PartitionedDataset(str(tmp_path / "dataset"))
+        dataset.sync('headlines', csv_dir=str(cleaned))
+        path = _write_day(cleaned, "2026_01_30", [("BBC Mundo", "a2", "A2", 0.1, "2026_01_30")])
+        os.utime(path, (1, 1))
+        _write_day(cleaned, "2026_01_29", [("The Hindu", "z", "Z", 0.3, "2026_01_29")])
+        pd.testing.assert_frame_equal(dataset.read('headlines', csv_dir=str(cleaned)), _csv_history(cleaned))
+
+        assert dataset.sync('headlines', csv_dir=str(cleaned)) == 2
+        pd.testing.assert_frame_equal(dataset.read('headlines', csv_dir=str(cleaned)), _csv_history(cleaned))
+
+    def test_fresh_checkout_of_unchanged_csvs_is_not_remigrated(self, tmp_path, cleaned):
+        """A checkout rewrites every CSV with a new mtime but the same bytes."""
+        dataset = PartitionedDataset(str(tmp_path / "dataset"))
+        dataset.sync('headlines', csv_dir=str(cleaned))
+        for path in cleaned.iterdir():
+            os.utime(path, (1, 1))
+        assert dataset.sync('headlines', csv_dir=str(cleaned)) == 0
+        assert {entry['mtime'] for entry in dataset.manifest('headlines').values()} == {1}
+        with patch('Data_Processing.dataset._digest') as digest:
+            pd.testing.assert_frame_equal(dataset.read('headlines', csv_dir=str(cleaned)), _csv_history(cleaned))
+        digest.assert_not_called()
+
+    def test_other_directories_are_not_mixed_in(self, tmp_path, cleaned):
+        dataset = PartitionedDataset(str(tmp_path / "dataset"))
+        dataset.sync('headlines', csv_dir=str(cleaned))
+        other = tmp_path / "other"
+        other.mkdir()
+        assert dataset.read('headlines', csv_dir=str(other)).empty
+
+    def test_without_pyarrow_reads_csvs(self, tmp_path, cleaned):
+        dataset = PartitionedDataset(str(tmp_path / "dataset"))
+        with patch("Data_Processing.dataset._pyarrow", return_value=None):
+            assert dataset.sync('headlines', csv_dir=str(cleaned)) == 0
+            pd.testing.assert_frame_equal(dataset.read('headlines', csv_dir=str(cleaned)), _csv_history(cleaned))
+
+    def test_deleted_days_are_not_served_and_sync_drops_them(self, tmp_path, cleaned):
+        dataset = PartitionedDataset(str(tmp_path / "dataset"))
+        dataset.sync('headlines', csv_dir=str(cleaned))
+        os.remove(cleaned / "processed_data_final_2026_01_31.csv")
+        pd.testing.assert_frame_equal(dataset.read('headlines', csv_dir=str(cleaned)), _csv_history(cleaned))
+
+        assert dataset.sync('headlines', csv_dir=str(cleaned)) == 0
+        assert sorted(dataset.manifest('headlines')) == ["2026_01_30", "2026_02_01"]
+        os.remove(cleaned / "processed_data_final_2026_01_30.csv")
+        os.remove(cleaned / "processed_data_final_2026_02_01.csv")
+        dataset.sync('headlines', csv_dir=str(cleaned))
+        assert dataset.manifest('headlines') == {}
+        assert dataset.read('headlines', csv_dir=str(cleaned)).empty
+
+    def test_raw_columns_keep_csv_header_order(self, tmp_path):
+        """Old raw files lack the newer columns; the union comes out as concatenating the CSVs gives it."""
+        raw = tmp_path / "raw"
+        raw.mkdir()
+        old_header = ['Scrape_Date', 'Source_URL', 'Source_Language_Code', 'Original_Headline',
+                      'Translated_Headline', 'Polarity', 'Entities_Raw']
+        pd.DataFrame([["2026_01_30", "https://x", "es", "a", "A", 0.5, "[]"]], columns=old_header) \
+            .to_csv(raw / "raw_headlines_data_2026_01_30.csv", index=False)
+        pd.DataFrame([["2026_01_31", "BBC Mundo", "https://x", "es", "Latin America", "b", "B", 0.1, "Neutral", "[]"]],
+                     columns=['Scrape_Date', 'Source_Name', 'Source_URL', 'Source_Language_Code', 'Source_Region',
+                              'Original_Headline', 'Translated_Headline', 'Polarity', 'Sentiment_Label',
+                              'Entities_Raw']) \
+            .to_csv(raw / "raw_headlines_data_2026_01_31.csv", index=False)
+        expected = pd.concat([pd.read_csv(p) for p in sorted(raw.glob("*.csv"))], ignore_index=True)
+
+        dataset = PartitionedDataset(str(tmp_path / "dataset"))
+        dataset.sync('raw_headlines', csv_dir=str(raw))
+        pd.testing.assert_frame_equal(dataset.read('raw_headlines', csv_dir=str(raw)), expected)
+        projected = dataset.read('raw_headlines', columns=['Source_Name', 'Scrape_Date', 'Polarity'], csv_dir=str(raw))
+        assert list(projected.columns) == ['Scrape_Date', 'Polarity', 'Source_Name']
@@ -0,0 +1,65 @@
+"""
+Tests for Scraping_Scripts/entity_codec.py
+"""
+
+import pandas as pd
+from Scraping_Scripts.entity_codec import decode_entities, encode_entities, entity_arrays, explode_entities
+
+ENTITIES = [("O'Brien", "PERSON"), ('say "hi"\\', "ORG"), ("東京\n", "GPE")]
+
+
+class TestDecodeEntities:
+    """Tests for the single-cell reader."""
+
+    def test_round_trips_json(self):
+        encoded = encode_entities(ENTITIES)
+        assert encoded.startswith('[["O\'Brien", "PERSON"]')
+        assert decode_entities(encoded) == ENTITIES
+
+    def test_reads_legacy_tuple_repr(self):
+        assert decode_entities(repr(ENTITIES)) == ENTITIES
+        assert decode_entities("[('US', 'GPE'), ('Europe', 'LOC')]") == [("US", "GPE"), ("Europe", "LOC")]
+
+    def test_reads_ascii_escaped_json(self):
+        import json
+        assert decode_entities(json.dumps([["Café 😀", "ORG"]])) == [("Café 😀", "ORG")]
+
+    def test_empty_and_missing(self):
+        assert decode_entities("[]") == []
+        assert decode_entities("") == []
+        assert decode_entities(float("nan")) == []
+
+    def test_code_is_never_evaluated(self):
+        assert decode_entities("__import__('os').system('true')") == []
+
+
+class TestExplodeEntities:
+    """Tests for the column reader."""
+
+    def test_mixed_formats_keep_row_index(self):
+        column = pd.Series([encode_entities([("Madrid", "GPE")]), None, "[('Delhi', 'GPE'), ('Modi', 'PERSON')]", "[]"],
+                           index=[10, 11, 12, 13])
+        exploded = explode_entities(column)
+        assert exploded.index.tolist() == [10, 12, 12]
+        assert exploded["Entity"].tolist() == ["Madrid", "Delhi", "Modi"]
+        assert exploded["Label"].tolist() == ["GPE", "GPE", "PERSON"]
+
+    def test_no_entities(self):
+        exploded = explode_entities(pd.Series(["[]", None]))
+        assert exploded.empty and list(exploded.columns) == ["Entity", "Label"]
+
+
+class TestEntityArrays:
+    """Tests for the flat offset-array decoder."""
+
+    def test_rows_point_at_source_cells(self):
+        column = pd.Series(["[('US', 'GPE')]", None, '[["a", "B"], ["c", "D"]]', "[]", "[('it\\'s', 'ORG')]"])
+        rows, entities, labels = entity_arrays(column)
+        assert rows.tolist() == [0, 2, 2, 4]
+        assert entities.tolist() == ["US", "a", "c", "it's"]
+        assert labels.tolist() == ["GPE", "B", "D", "ORG"]
+
+    def test_malformed_cell_does_not_shift_later_pairs(self):
+        column = pd.Series(["[('US', 'GPE'), ('stray'", "[('UN', 'ORG')]"])
+        rows, entities, labels = entity_arrays(column)
+        assert list(zip(rows.tolist(), entities.tolist(), labels.tolist())) == [(0, "US", "GPE"), (1, "UN", "ORG")]
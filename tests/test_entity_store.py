@@ -0,0 +1,97 @@
+"""
+Tests for Data_Processing/entity_store.py
+"""
+
+import os
+import sqlite3
+from unittest.mock import patch
+
+import pandas as pd
+from Data_Processing.entity_store import EntityCountStore, content_digest, stat_fingerprint
+
+
+def _entities(*pairs):
+    return pd.DataFrame(pairs, columns=['Entity', 'Label'])
+
+
+class TestEntityCountStore:
+    """Tests for incremental folding and the top-N query."""
+
+    def test_fold_accumulates_across_days(self):
+        store = EntityCountStore(':memory:')
+        store.fold('2026_01_01', _entities(('US', 'GPE'), ('US', 'GPE'), ('UN', 'ORG')))
+        store.fold('2026_01_02', _entities(('UN', 'ORG'), ('UN', 'ORG'), ('Monday', 'DATE')))
+        top = store.top_entities(10)
+        assert top.to_dict() == {'UN': 3, 'US': 2}
+        assert store.ingested_dates() == ['2026_01_01', '2026_01_02']
+
+    def test_refolding_a_day_replaces_its_counts(self):
+        store = EntityCountStore(':memory:')
+        store.fold('2026_01_01', _entities(('US', 'GPE'), ('UN', 'ORG')))
+        store.fold('2026_01_01', _entities(('US', 'GPE')))
+        assert store.top_entities(10).to_dict() == {'US': 1}
+
+    def test_labels_are_summed_per_entity(self):
+        store = EntityCountStore(':memory:')
+        store.fold('2026_01_01', _entities(('Jordan', 'GPE'), ('Jordan', 'PERSON'), ('Jordan', 'LOC')))
+        assert store.top_entities(1).to_dict() == {'Jordan': 2}
+
+    def test_sync_directory_reads_only_new_files(self, tmp_path):
+        _entities(('US', 'GPE')).to_csv(tmp_path / 'processed_entities_final_2026_01_01.csv', index=False)
+        _entities(('UN', 'ORG')).to_csv(tmp_path / 'processed_entities_final_2026_01_02.csv', index=False)
+        (tmp_path / 'processed_entities_final_2026_01_03.csv').write_text('')
+        store = EntityCountStore(str(tmp_path / 'store.db'))
+        assert store.sync_directory(tmp_path, skip=['2026_01_02']) == ['2026_01_01', '2026_01_03']
+
+        # Ingested files are only stat'ed while they are unchanged on disk.
+        reopened = EntityCountStore(str(tmp_path / 'store.db'))
+        with patch('Data_Processing.entity_store.pd.read_csv', wraps=pd.read_csv) as read_csv:
+            assert reopened.sync_directory(tmp_path) == ['2026_01_02']
+        assert read_csv.call_count == 1
+        assert reopened.top_entities(10).to_dict() == {'UN': 1, 'US': 1}
+
+    def test_sync_directory_refolds_rewritten_files(self, tmp_path):
+        """A day regenerated outside the pipeline replaces its stale counts."""
+        path = tmp_path / 'processed_entities_final_2026_01_01.csv'
+        _entities(('US', 'GPE')).to_csv(path, index=False)
+        store = EntityCountStore(str(tmp_path / 'store.db'))
+        store.sync_directory(tmp_path)
+
+        _entities(('UN', 'ORG'), ('UN', 'ORG')).to_csv(path, index=False)
+        os.utime(path, (1, 1))
+        assert store.sync_directory(tmp_path) == ['2026_01_01']
+        assert store.top_entities(10).to_dict() == {'UN': 2}
+        assert store.sync_directory(tmp_path) == []
+
+    def test_days_folded_with_their_file_fingerprint_are_not_reread(self, tmp_path):
+        path = tmp_path / 'processed_entities_final_2026_01_01.csv'
+        df = _entities(('US', 'GPE'))
+        df.to_csv(path, index=False)
+        store = EntityCountStore(':memory:')
+        store.fold('2026_01_01', df, stat_fingerprint(path))
+        assert store.sync_directory(tmp_path) == []
+
+    def test_fresh_checkout_of_an_unchanged_file_is_not_reread(self, tmp_path):
+        """A checkout rewrites every file with a new mtime but the same bytes."""
+        path = tmp_path / 'processed_entities_final_2026_01_01.csv'
+        df = _entities(('US', 'GPE'))
+        df.to_csv(path, index=False)
+        store = EntityCountStore(':memory:')
+        store.fold('2026_01_01', df, stat_fingerprint(path), content_digest(path))
+        os.utime(path, (1, 1))
+        with patch('Data_Processing.entity_store.pd.read_csv') as read_csv:
+            assert store.sync_directory(tmp_path) == []
+        read_csv.assert_not_called()
+        with patch('Data_Processing.entity_store.content_digest') as digest:
+            assert store.sync_directory(tmp_path) == []
+        digest.assert_not_called()
+
+    def test_store_without_fingerprints_is_upgraded(self, tmp_path):
+        db = tmp_path / 'store.db'
+        with sqlite3.connect(db) as conn:
+            conn.execute("CREATE TABLE ingested_dates (scrape_date TEXT PRIMARY KEY, rows INTEGER NOT NULL)")
+            conn.execute("INSERT INTO ingested_dates VALUES ('2026_01_01', 1)")
+        _entities(('US', 'GPE')).to_csv(tmp_path / 'processed_entities_final_2026_01_01.csv', index=False)
+        store = EntityCountStore(str(db))
+        assert store.sync_directory(tmp_path) == ['2026_01_01']
+        assert store.sync_directory(tmp_path) == []
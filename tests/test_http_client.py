@@ -0,0 +1,93 @@
+"""
+Tests for Scraping_Scripts/http_client.py
+Runs against a local stub HTTP server; no external network access.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from Scraping_Scripts import http_client
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'   # keep-alive
+    failures_left = 0
+    connections = set()
+
+    def do_GET(self):
+        _StubHandler.connections.add(self.client_address)
+        if _StubHandler.failures_left > 0:
+            _StubHandler.failures_left -= 1
+            status, body = 503, b'busy'
+        else:
+            status, body = 200, b'ok'
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    _StubHandler.failures_left = 0
+    _StubHandler.connections = set()
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+class TestSharedSession:
+    """Tests for the process-wide session accessor."""
+
+    def test_get_session_is_shared(self):
+        http_client.close_session()
+        assert http_client.get_session() is http_client.get_session()
+        http_client.close_session()
+
+    def test_host_pool_override(self):
+        session = http_client.build_session(host_pool_sizes={'router.huggingface.co': 12})
+        adapter = session.get_adapter('https://router.huggingface.co/models/x')
+        assert adapter._pool_maxsize == 12
+        default = session.get_adapter('https://www.bbc.com/mundo')
+        assert default._pool_maxsize == http_client.POOL_MAXSIZE
+
+
+class TestPooling:
+    """Tests for keep-alive reuse and retry behaviour."""
+
+    def test_connections_are_reused(self, stub_server):
+        session = http_client.build_session()
+        for _ in range(5):
+            assert session.get(stub_server, timeout=5).text == 'ok'
+        assert len(_StubHandler.connections) == 1
+
+    def test_retries_transient_errors(self, stub_server, monkeypatch):
+        monkeypatch.setattr(http_client, 'BACKOFF_FACTOR', 0.0)
+        _StubHandler.failures_left = 2
+        session = http_client.build_session()
+        response = session.get(stub_server, timeout=5)
+        assert response.status_code == 200
+
+
+class TestValidatorCache:
+    """Tests for the conditional GET validator store."""
+
+    def test_skips_responses_without_validators(self, tmp_path):
+        cache = http_client.ValidatorCache(str(tmp_path / 'v.json'))
+        cache.store('https://example.com', {}, ['headline'])
+        assert cache.conditional_headers('https://example.com') == {}
+
+    def test_sends_both_validators(self, tmp_path):
+        cache = http_client.ValidatorCache(str(tmp_path / 'v.json'))
+        cache.store('https://example.com', {'ETag': 'abc', 'Last-Modified': 'Mon, 01 Jan 2026 00:00:00 GMT'}, ['h'])
+        assert cache.conditional_headers('https://example.com') == {
+            'If-None-Match': 'abc', 'If-Modified-Since': 'Mon, 01 Jan 2026 00:00:00 GMT'
+        }
+        assert cache.cached_headlines('https://example.com') == ['h']
@@ -0,0 +1,53 @@
+"""
+Tests for Scraping_Scripts/language_detect.py
+"""
+
+import pytest
+from unittest.mock import patch
+from Scraping_Scripts.language_detect import detect_language, dominant_script, group_by_language
+
+
+class TestDetectLanguage:
+    """Tests for script and stopword detection."""
+
+    @pytest.mark.parametrize("text, expected, detected", [
+        ("भारत में चुनाव के नतीजे घोषित", "hi", "hi"),
+        ("Election results: what we know so far", "hi", "en"),          # English item on BBC Hindi
+        ("Россия и Украина обменялись пленными", "ru", "ru"),
+        ("東京で大規模な地震が発生", "ja", "ja"),
+        ("The war in Ukraine and the race for the White House", "es", "en"),
+        ("La crisis de los refugiados en la frontera", "es", "es"),
+        ("O governo não divulgou as novas medidas da economia no Brasil", "es", "pt"),
+        ("Rais wa Kenya azungumza na wananchi kuhusu uchumi", "sw", "sw"),
+        ("Ucrania", "es", "es"),                                         # no signal: keep the source's
+        ("12:30", "pt", "pt"),
+    ])
+    def test_detection(self, text, expected, detected):
+        assert detect_language(text, expected) == detected
+
+    def test_dominant_script(self):
+        assert dominant_script("BBC हिंदी समाचार") == "DEVANAGARI"
+        assert dominant_script("2024") is None
+
+    def test_group_by_language(self):
+        groups = group_by_language(["La guerra sigue en el norte", "What happens next for the talks"], "es")
+        assert groups == {"es": ["La guerra sigue en el norte"], "en": ["What happens next for the talks"]}
+
+
+class TestTranslateDetected:
+    """English headlines skip the translator; the rest are batched per language."""
+
+    def test_bypass_and_regroup(self):
+        from Scraping_Scripts import web_scraper
+        headlines = ["La guerra sigue en el norte", "What happens next for the talks",
+                     "O governo não divulgou as novas medidas da economia no Brasil"]
+        fake = lambda group, lang: [f"[{lang}] {h}" for h in group]
+        with patch.object(web_scraper, 'translate_headlines', side_effect=fake) as translate, \
+             patch.dict(web_scraper.translation_stats, {'bypassed': 0, 'regrouped': 0}):
+            result = web_scraper.translate_detected(headlines, "es")
+            stats = dict(web_scraper.translation_stats)
+
+        assert result == {headlines[0]: f"[es] {headlines[0]}", headlines[1]: headlines[1],
+                          headlines[2]: f"[pt] {headlines[2]}"}
+        assert sorted(call.args[1] for call in translate.call_args_list) == ["es", "pt"]
+        assert stats == {'bypassed': 1, 'regrouped': 1}
@@ -0,0 +1,89 @@
+"""
+Tests for Scraping_Scripts/lexicon_sentiment.py
+The batch scorer must agree exactly with the per-headline keyword scorer.
+"""
+
+import json
+import random
+import pytest
+from Scraping_Scripts.lexicon_sentiment import LexiconScorer, load_lexicon, rescore_csv
+
+
+def legacy_fallback(headline_en):
+    """The original per-headline keyword fallback from web_scraper.py."""
+    text = headline_en.lower()
+    positive_words = {'good', 'great', 'success', 'win', 'peace', 'growth', 'progress', 'victory', 'improve'}
+    negative_words = {'war', 'kill', 'death', 'attack', 'crisis', 'fail', 'disaster', 'conflict', 'terror'}
+    pos = sum(1 for w in positive_words if w in text)
+    neg = sum(1 for w in negative_words if w in text)
+    total = pos + neg
+    if total == 0: return 0.0, 'neutral'
+    polarity = round((pos - neg) / total, 4)
+    label = 'positive' if polarity > 0 else ('negative' if polarity < 0 else 'neutral')
+    return polarity, label
+
+
+HEADLINES = [
+    "Peace talks collapse as war resumes",
+    "Economic growth and progress bring great success",
+    "Weather forecast for tomorrow",
+    "Skilled workers win award; warrant issued",       # substrings inside longer words
+    "TERROR ATTACK: death toll rises, crisis deepens",
+    "Peace, peace and more peace",                      # a term counts once
+    "",
+    "Wartime victory parade draws crowds",
+]
+
+
+class TestLexiconScorer:
+    """Tests for scalar and batch scoring."""
+
+    def test_default_lexicon_matches_legacy_fallback(self):
+        scorer = LexiconScorer()
+        assert [scorer.score(h) for h in HEADLINES] == [legacy_fallback(h) for h in HEADLINES]
+        assert scorer.score_batch(HEADLINES) == [legacy_fallback(h) for h in HEADLINES]
+
+    def test_overlapping_terms_all_count(self):
+        scorer = LexiconScorer({'win': 1.0, 'wins': 1.0, 'in': -1.0, 'ins': -3.0})
+        texts = ["she wins", "win", "in", "twinset", "nothing"]
+        assert scorer.score_batch(texts) == [scorer.score(t) for t in texts]
+        assert scorer.score("she wins") == (-0.3333, 'negative')   # (1 + 1 - 1 - 3) / 6
+
+    def test_random_large_lexicon_agrees_with_scalar(self):
+        rng = random.Random(7)
+        lexicon = {"".join(rng.choice("abcde") for _ in range(rng.randint(1, 4))): rng.choice([-2.0, -1.0, 0.5, 1.0])
+                   for _ in range(300)}
+        texts = ["".join(rng.choice("abcde ") for _ in range(rng.randint(0, 40))) for _ in range(500)]
+        scorer = LexiconScorer(lexicon)
+        assert scorer.score_batch(texts) == [scorer.score(t) for t in texts]
+
+    def test_empty_lexicon_is_neutral(self):
+        assert LexiconScorer({}).score_batch(["war", "peace"]) == [(0.0, 'neutral')] * 2
+
+    def test_fingerprint_tracks_lexicon(self):
+        assert LexiconScorer().is_default
+        assert LexiconScorer({'war': -1.0}).fingerprint != LexiconScorer().fingerprint
+
+
+class TestLexiconFiles:
+    """Tests for weighted lexicon files and the CSV backfill."""
+
+    def test_load_lexicon_lowercases_and_drops_zero(self, tmp_path):
+        path = tmp_path / "lexicon.json"
+        path.write_text(json.dumps({"Ceasefire": 2, "Riot": -1.5, "said": 0}), encoding='utf-8')
+        assert load_lexicon(str(path)) == {"ceasefire": 2.0, "riot": -1.5}
+
+    def test_load_lexicon_rejects_lists(self, tmp_path):
+        path = tmp_path / "lexicon.json"
+        path.write_text("[\"war\"]", encoding='utf-8')
+        with pytest.raises(ValueError):
+            load_lexicon(str(path))
+
+    def test_rescore_csv(self, tmp_path):
+        import pandas as pd
+        src = tmp_path / "raw.csv"
+        pd.DataFrame({'Translated_Headline': HEADLINES, 'Polarity': 9.9, 'Sentiment_Label': 'x'}).to_csv(src, index=False)
+        out = tmp_path / "out" / "raw.csv"
+        assert rescore_csv(str(src), str(out), LexiconScorer()) == len(HEADLINES)
+        df = pd.read_csv(out)
+        assert list(df['Sentiment_Label']) == [legacy_fallback(h)[1] for h in HEADLINES]
@@ -0,0 +1,82 @@
+"""
+Tests for Scraping_Scripts/local_sentiment.py
+Trains tiny models on synthetic headlines; no network or model download.
+"""
+
+import pytest
+from unittest.mock import patch
+from Scraping_Scripts.local_sentiment import LABELS, LocalSentimentModel, labels_from_frame
+
+TRAIN = [
+    ("Peace deal brings hope to the region", "positive"),
+    ("Economy grows as exports surge to record", "positive"),
+    ("Team celebrates historic championship win", "positive"),
+    ("Bombing kills dozens in capital", "negative"),
+    ("Floods leave thousands homeless", "negative"),
+    ("Riots erupt after disputed vote", "negative"),
+    ("Parliament meets on Tuesday", "neutral"),
+    ("Minister publishes annual report", "neutral"),
+    ("Weather forecast for the weekend", "neutral"),
+] * 5
+
+
+@pytest.fixture(scope="module")
+def model():
+    texts, labels = zip(*TRAIN)
+    return LocalSentimentModel.train(texts, labels, epochs=80, n_features=2 ** 12)
+
+
+class TestLocalSentimentModel:
+    """Tests for training, scoring and persistence."""
+
+    def test_learns_training_labels(self, model):
+        probs = model.predict_proba([t for t, _ in TRAIN[:9]])
+        assert [LABELS[i] for i in probs.argmax(axis=1)] == [label for _, label in TRAIN[:9]]
+
+    def test_predictions_are_hf_shaped(self, model):
+        preds = model.predictions(["Bombing kills dozens", ""])
+        assert len(preds) == 2
+        assert [p['label'] for p in preds[0]] == list(LABELS)
+        assert sum(p['score'] for p in preds[1]) == pytest.approx(1.0)
+
+    def test_throughput_is_tracked(self, model):
+        before = model.rows_scored
+        model.predict_proba(["a", "b", "c"])
+        assert model.rows_scored == before + 3 and model.throughput() > 0
+
+    def test_save_load_roundtrip(self, model, tmp_path):
+        path = str(tmp_path / "model.npz")
+        model.save(path)
+        loaded = LocalSentimentModel.load(path)
+        assert loaded.predict_proba(["Floods leave thousands homeless"]) == pytest.approx(
+            model.predict_proba(["Floods leave thousands homeless"]), abs=1e-5)
+        assert loaded.name == LocalSentimentModel.load(path).name
+
+    def test_labels_from_frame_derives_missing_labels(self):
+        import pandas as pd
+        df = pd.DataFrame({'Translated_Headline': ["a", "b", None, "c"],
+                           'Polarity': [0.5, -0.2, 0.0, 0.0],
+                           'Sentiment_Label': ["neutral", None, "neutral", None]})
+        assert labels_from_frame(df) == (["a", "b", "c"], ["neutral", "negative", "neutral"])
+
+
+class TestLocalEngineRouting:
+    """SENTIMENT_ENGINE=local routes the scraper's sentiment through the local model."""
+
+    def test_batch_and_cache_key_use_local_model(self, model):
+        from Scraping_Scripts import web_scraper
+        with patch.object(web_scraper, 'SENTIMENT_ENGINE', 'local'), \
+             patch.object(web_scraper, 'get_local_model', return_value=model), \
+             patch.object(web_scraper, 'HF_API_TOKEN', 'token-that-must-not-be-used'), \
+             patch.object(web_scraper, 'get_session', side_effect=AssertionError("network used")):
+            scored = web_scraper._score_sentiment_batch(["Bombing kills dozens in capital"])
+            assert scored[0][1] == 'negative' and scored[0][2] == model.name
+            assert web_scraper.active_sentiment_model() == model.name
+            assert web_scraper.analyze_sentiment("Bombing kills dozens in capital") == scored[0][:2]
+
+    def test_untrained_local_engine_falls_back(self):
+        from Scraping_Scripts import web_scraper
+        with patch.object(web_scraper, 'SENTIMENT_ENGINE', 'local'), \
+             patch.object(web_scraper, 'get_local_model', return_value=None), \
+             patch.object(web_scraper, 'HF_API_TOKEN', ''):
+            assert web_scraper.active_sentiment_model() == web_scraper.FALLBACK_MODEL
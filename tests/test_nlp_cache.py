@@ -0,0 +1,105 @@
+"""
+Tests for Scraping_Scripts/nlp_cache.py
+Validates content addressing, LRU eviction and hit/miss accounting.
+"""
+
+import time
+import pytest
+from Scraping_Scripts.nlp_cache import HeadlineIndex, SentimentCache, TranslationMemory, normalize_text
+
+
+@pytest.fixture
+def sentiment_cache(tmp_path):
+    cache = SentimentCache(tmp_path / "sentiment.db", max_entries=3)
+    yield cache
+    cache.close()
+
+
+class TestNormalizeText:
+    """Tests for cache-key normalization."""
+
+    def test_collapses_whitespace(self):
+        assert normalize_text('  War  in\tthe \n north ') == 'War in the north'
+
+    def test_preserves_case(self):
+        assert normalize_text('US') != normalize_text('us')
+
+
+class TestSentimentCache:
+    """Tests for the persistent sentiment cache."""
+
+    def test_roundtrip_and_counters(self, sentiment_cache):
+        assert sentiment_cache.get_many('m', ['a headline']) == [None]
+        sentiment_cache.put_many('m', [('a headline', -0.5, 'negative')])
+        assert sentiment_cache.get_many('m', ['a  headline ']) == [(-0.5, 'negative')]
+        assert sentiment_cache.stats() == {'hits': 1, 'misses': 1, 'entries': 1}
+
+    def test_model_is_part_of_key(self, sentiment_cache):
+        sentiment_cache.put_many('model-a', [('text', 1.0, 'positive')])
+        assert sentiment_cache.get_many('model-b', ['text']) == [None]
+
+    def test_evicts_least_recently_used(self, sentiment_cache):
+        for i in range(3):
+            sentiment_cache.put_many('m', [(f'h{i}', 0.0, 'neutral')])
+            time.sleep(0.01)
+        sentiment_cache.get_many('m', ['h0'])    # refresh h0
+        time.sleep(0.01)
+        sentiment_cache.put_many('m', [('h3', 0.0, 'neutral')])
+        assert len(sentiment_cache) == 3
+        assert sentiment_cache.get_many('m', ['h0', 'h1', 'h3']) == [(0.0, 'neutral'), None, (0.0, 'neutral')]
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "persist.db"
+        first = SentimentCache(path)
+        first.put_many('m', [('repeat story', 0.25, 'positive')])
+        first.close()
+        second = SentimentCache(path)
+        assert second.get_many('m', ['repeat story']) == [(0.25, 'positive')]
+        second.close()
+
+
+class TestTranslationMemory:
+    """Tests for the persistent translation memory."""
+
+    def test_bulk_lookup_keyed_by_language(self, tmp_path):
+        memory = TranslationMemory(tmp_path / "tm.db")
+        memory.put_many('es', [('Hola mundo', 'Hello world')])
+        assert memory.get_many('es', ['Hola mundo', 'Adiós']) == ['Hello world', None]
+        assert memory.get_many('pt', ['Hola mundo']) == [None]
+        assert memory.stats()['hits'] == 1
+        memory.close()
+
+    def test_size_bound(self, tmp_path):
+        memory = TranslationMemory(tmp_path / "tm.db", max_entries=2)
+        memory.put_many('ru', [(f'text {i}', f'translation {i}') for i in range(5)])
+        assert len(memory) == 2
+        memory.close()
+
+
+class TestHeadlineIndex:
+    """Tests for the cross-run headline fingerprint index."""
+
+    def test_roundtrip_per_source(self):
+        index = HeadlineIndex(':memory:')
+        index.put_many("hf|sm", [("BBC Mundo", "Titular  uno", "Headline one", 0.5, "positive", [("Lula", "PERSON")])])
+        hit, miss, other_source = (
+            index.get_many("hf|sm", "BBC Mundo", ["Titular uno"])[0],
+            index.get_many("hf|sm", "BBC Mundo", ["Titular dos"])[0],
+            index.get_many("hf|sm", "BBC Hindi", ["Titular uno"])[0],
+        )
+        assert hit == {'Translated_Headline': "Headline one", 'Polarity': 0.5,
+                       'Sentiment_Label': "positive", 'Entities': [("Lula", "PERSON")]}
+        assert miss is None and other_source is None
+        assert index.stats()['hits'] == 1
+
+    def test_other_models_miss(self):
+        """An analysis made by another sentiment engine or NER model is never served."""
+        index = HeadlineIndex(':memory:')
+        index.put_many("hf|sm", [("S", "Titular uno", "Headline one", 0.5, "positive", [])])
+        assert index.get_many("keyword-fallback|sm", "S", ["Titular uno"]) == [None]
+        assert index.get_many("hf|lg", "S", ["Titular uno"]) == [None]
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "index.db"
+        HeadlineIndex(path).put_many("m", [("S", "h", "h", 0.0, "neutral", [])])
+        assert HeadlineIndex(path).get_many("m", "S", ["h"])[0]['Entities'] == []
@@ -0,0 +1,67 @@
+"""
+Tests for Scraping_Scripts/rate_limiter.py
+Uses a fake clock so no test actually sleeps.
+"""
+
+import pytest
+from Scraping_Scripts.rate_limiter import TokenBucket, HostRateLimiter, host_of
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket:
+    """Tests for the TokenBucket primitive."""
+
+    def test_burst_is_free(self):
+        bucket = TokenBucket(burst=3, refill_per_sec=1.0, clock=FakeClock())
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+    def test_waits_queue_after_burst(self):
+        bucket = TokenBucket(burst=1, refill_per_sec=2.0, clock=FakeClock())
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(0.5)
+        assert bucket.reserve() == pytest.approx(1.0)
+
+    def test_refills_over_time(self):
+        clock = FakeClock()
+        bucket = TokenBucket(burst=2, refill_per_sec=1.0, clock=clock)
+        bucket.reserve()
+        bucket.reserve()
+        clock.now = 10.0
+        # Refill is capped at the burst size
+        assert [bucket.reserve() for _ in range(2)] == [0.0, 0.0]
+        assert bucket.reserve() == pytest.approx(1.0)
+
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError):
+            TokenBucket(burst=0)
+
+
+class TestHostRateLimiter:
+    """Tests for per-host bucket routing."""
+
+    def test_hosts_are_independent(self):
+        limiter = HostRateLimiter()
+        assert limiter.bucket('www.bbc.com') is not limiter.bucket('www.aljazeera.com')
+        assert limiter.bucket('www.bbc.com') is limiter.bucket('www.bbc.com')
+
+    def test_from_sources_uses_most_conservative_settings(self):
+        sources = [
+            {'url': 'https://www.bbc.com/mundo', 'rate_limit': {'burst': 4, 'refill_per_sec': 2.0}},
+            {'url': 'https://www.bbc.com/hindi', 'rate_limit': {'burst': 2, 'refill_per_sec': 3.0}},
+            {'url': 'https://www.thehindu.com'},
+        ]
+        limiter = HostRateLimiter.from_sources(sources)
+        bbc = limiter.bucket('www.bbc.com')
+        assert (bbc.burst, bbc.refill_per_sec) == (2, 2.0)
+        other = limiter.bucket('www.thehindu.com')
+        assert (other.burst, other.refill_per_sec) == (1, 1.0)
+
+    def test_host_of(self):
+        assert host_of('https://Feeds.BBCI.co.uk/news/world/rss.xml') == 'feeds.bbci.co.uk'
@@ -0,0 +1,57 @@
+"""
+Tests for Scraping_Scripts/raw_csv_writer.py
+"""
+
+import csv
+import os
+import pytest
+from unittest.mock import patch
+from Scraping_Scripts.raw_csv_writer import FIELDNAMES, RawCsvWriter
+
+
+def _row(source, headline):
+    return {'Scrape_Date': '2026_01_01', 'Source_Name': source, 'Source_URL': 'https://x',
+            'Source_Language_Code': 'en', 'Source_Region': 'Global', 'Original_Headline': headline,
+            'Translated_Headline': headline, 'Polarity': 0.0, 'Sentiment_Label': 'neutral',
+            'Entities_Raw': '[]'}
+
+
+def _read(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+class TestRawCsvWriter:
+    """Tests for incremental, atomic appends."""
+
+    def test_appends_batches_with_one_header(self, tmp_path):
+        path = str(tmp_path / "raw.csv")
+        writer = RawCsvWriter(path)
+        writer.append_rows([_row("A", "one, with a comma"), _row("A", "two\nlines")])
+        writer.append_rows([_row("B", "three")])
+        rows = _read(path)
+        assert [r['Original_Headline'] for r in rows] == ["one, with a comma", "two\nlines", "three"]
+        assert list(rows[0].keys()) == FIELDNAMES
+        assert writer.rows_written == 3
+
+    def test_reopen_knows_sources_and_headlines(self, tmp_path):
+        path = str(tmp_path / "raw.csv")
+        RawCsvWriter(path).append_rows([_row("A", "one")])
+        writer = RawCsvWriter(path)
+        assert writer.sources_written() == {"A"}
+        assert writer.has_headline("A", "one") and not writer.has_headline("B", "one")
+
+    def test_failed_write_leaves_file_intact(self, tmp_path):
+        path = str(tmp_path / "raw.csv")
+        writer = RawCsvWriter(path)
+        writer.append_rows([_row("A", "one")])
+        with patch('Scraping_Scripts.raw_csv_writer.os.replace', side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                writer.append_rows([_row("B", "two")])
+        assert [r['Source_Name'] for r in _read(path)] == ["A"]
+        assert not writer.has_headline("B", "two")
+
+    def test_empty_batch_is_a_noop(self, tmp_path):
+        path = str(tmp_path / "raw.csv")
+        assert RawCsvWriter(path).append_rows([]) == 0
+        assert not os.path.exists(path)
@@ -0,0 +1,30 @@
+"""
+Tests for Data_Processing/run_manifest.py
+"""
+
+from Data_Processing.run_manifest import RunManifest, file_fingerprint, input_version
+
+
+class TestRunManifest:
+    """Tests for stage reuse decisions."""
+
+    def test_current_until_inputs_or_outputs_change(self, tmp_path):
+        output = tmp_path / 'out.json'
+        output.write_text('{}')
+        manifest = RunManifest(str(tmp_path / 'manifest.json'))
+        assert not manifest.is_current('stage', 'v1')
+
+        manifest.record('stage', 'v1', [str(output)])
+        assert RunManifest(str(tmp_path / 'manifest.json')).is_current('stage', 'v1')
+        assert not manifest.is_current('stage', 'v2')
+        output.unlink()
+        assert not manifest.is_current('stage', 'v1')
+
+    def test_input_version_tracks_file_changes(self, tmp_path):
+        path = tmp_path / 'a.csv'
+        path.write_text('x')
+        before = input_version(file_fingerprint([str(path)]), '2026_01_01')
+        assert before == input_version(file_fingerprint([str(path)]), '2026_01_01')
+        path.write_text('xy')
+        assert before != input_version(file_fingerprint([str(path)]), '2026_01_01')
+        assert file_fingerprint([str(tmp_path / 'missing.csv')]) == []
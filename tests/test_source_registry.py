@@ -0,0 +1,129 @@
+"""
+Tests for Scraping_Scripts/source_registry.py
+"""
+
+import os
+import json
+import pytest
+from Scraping_Scripts.source_registry import (
+    SCHEDULE_GRACE_SECONDS, ScheduleState, SourceRegistry, load_sources, parse_registry,
+)
+
+
+def _config(**overrides):
+    config = {
+        "concurrency_classes": {"page": 2, "feed": 6},
+        "sources": [
+            {"name": "Page", "language": "es", "url": "https://a.example/news", "type": "html", "selector": "h3"},
+            {"name": "Feed", "language": "en", "url": "https://b.example/rss", "type": "rss", "region": "Africa"},
+        ],
+    }
+    config.update(overrides)
+    return config
+
+
+def _write(path, config, mtime=None):
+    path.write_text(json.dumps(config), encoding='utf-8')
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+class TestParseRegistry:
+    """Tests for validation and defaults."""
+
+    def test_shipped_registry_is_valid(self):
+        sources = load_sources()
+        assert sources and all(s["region"] for s in sources)
+        assert {s["type"] for s in sources} <= {"html", "rss"}
+
+    def test_type_defaults_fill_in(self):
+        sources, classes = parse_registry(_config())
+        page, feed = sources
+        assert page["fetch_interval_minutes"] == 1440 and page["concurrency_class"] == "page"
+        assert feed["fetch_interval_minutes"] == 60 and feed["concurrency_class"] == "feed"
+        assert page["requires_translation"] is True and feed["requires_translation"] is False
+        assert page["region"] == "Global" and feed["region"] == "Africa"
+        assert classes == {"page": 2, "feed": 6}
+
+    def test_file_defaults_override_type_defaults(self):
+        sources, _ = parse_registry(_config(defaults={"rss": {"fetch_interval_minutes": 15}}))
+        assert sources[1]["fetch_interval_minutes"] == 15
+
+    @pytest.mark.parametrize("bad", [
+        {"name": "x", "language": "en", "url": "https://x", "type": "html"},             # no selector
+        {"name": "x", "language": "en", "url": "https://x", "type": "json"},             # unknown type
+        {"name": "x", "language": "en", "type": "rss"},                                 # no url
+    ])
+    def test_invalid_entries_raise(self, bad):
+        with pytest.raises(ValueError):
+            parse_registry({"sources": [bad]})
+
+    def test_duplicate_names_raise(self):
+        config = _config()
+        config["sources"].append(dict(config["sources"][0]))
+        with pytest.raises(ValueError, match="duplicate"):
+            parse_registry(config)
+
+
+class TestSourceRegistry:
+    """Tests for hot reload."""
+
+    def test_reloads_when_file_changes(self, tmp_path):
+        path = tmp_path / "sources.json"
+        _write(path, _config(), mtime=1_000)
+        registry = SourceRegistry(str(path))
+        assert [s["name"] for s in registry.sources()] == ["Page", "Feed"]
+
+        config = _config()
+        config["sources"] = config["sources"][:1]
+        _write(path, config, mtime=2_000)
+        assert [s["name"] for s in registry.sources()] == ["Page"]
+        assert registry.metadata() == {"Page": ("es", "Global", "https://a.example/news")}
+
+    def test_invalid_edit_keeps_previous_sources(self, tmp_path, capsys):
+        path = tmp_path / "sources.json"
+        _write(path, _config(), mtime=1_000)
+        registry = SourceRegistry(str(path))
+        path.write_text("{ not json", encoding='utf-8')
+        os.utime(path, (2_000, 2_000))
+        assert len(registry.sources()) == 2
+        assert "REGISTRY WARN" in capsys.readouterr().out
+
+    def test_class_limits(self, tmp_path):
+        path = tmp_path / "sources.json"
+        _write(path, _config())
+        registry = SourceRegistry(str(path))
+        assert registry.class_limit("feed") == 6
+        assert registry.class_limit("unknown") >= 1
+
+
+class TestScheduleState:
+    """Tests for per-source cadence."""
+
+    def test_due_sources_follow_each_interval(self, tmp_path):
+        sources, _ = parse_registry(_config())
+        state = ScheduleState(str(tmp_path / "schedule.json"))
+        assert state.due_sources(sources, now=0) == sources       # never fetched
+
+        state.mark_fetched(["Page", "Feed"], when=0)
+        assert state.due_sources(sources, now=600) == []
+        assert [s["name"] for s in state.due_sources(sources, now=3600)] == ["Feed"]
+        assert [s["name"] for s in state.due_sources(sources, now=86400)] == ["Page", "Feed"]
+
+    def test_grace_window_and_next_wait(self, tmp_path):
+        sources, _ = parse_registry(_config())
+        state = ScheduleState(str(tmp_path / "schedule.json"))
+        state.mark_fetched(["Page", "Feed"], when=0)
+        assert state.is_due(sources[0], now=86400 - SCHEDULE_GRACE_SECONDS)
+        assert state.seconds_until_next(sources, now=0) == 3600 - SCHEDULE_GRACE_SECONDS
+
+    def test_state_persists(self, tmp_path):
+        path = str(tmp_path / "schedule.json")
+        ScheduleState(path).mark_fetched(["Feed"], when=123.0)
+        assert ScheduleState(path).last_fetched("Feed") == 123.0
+
+    def test_disabled_sources_never_due(self, tmp_path):
+        sources, _ = parse_registry(_config())
+        sources[1]["enabled"] = False
+        state = ScheduleState(str(tmp_path / "schedule.json"))
+        assert [s["name"] for s in state.due_sources(sources)] == ["Page"]
@@ -0,0 +1,57 @@
+"""
+Tests for Data_Processing/summary_generator.py
+Covers the inputs the dashboard build versions its briefings by.
+"""
+
+import sqlite3
+from unittest.mock import patch
+
+import Data_Processing.summary_generator as summary_generator
+
+
+class TestGeminiApiKey:
+    """Tests for the environment / .env key lookup."""
+
+    def test_environment_wins(self, tmp_path, monkeypatch):
+        (tmp_path / '.env').write_text("GEMINI_API_KEY=from-file\n")
+        monkeypatch.setenv('GEMINI_API_KEY', 'from-env')
+        with patch.object(summary_generator, 'PROJECT_ROOT', str(tmp_path)):
+            assert summary_generator.get_gemini_api_key() == 'from-env'
+
+    def test_falls_back_to_dotenv(self, tmp_path, monkeypatch):
+        (tmp_path / '.env').write_text("OTHER=1\nGEMINI_API_KEY=from-file\n")
+        monkeypatch.delenv('GEMINI_API_KEY', raising=False)
+        with patch.object(summary_generator, 'PROJECT_ROOT', str(tmp_path)):
+            assert summary_generator.get_gemini_api_key() == 'from-file'
+
+    def test_missing_everywhere(self, tmp_path, monkeypatch):
+        monkeypatch.delenv('GEMINI_API_KEY', raising=False)
+        with patch.object(summary_generator, 'PROJECT_ROOT', str(tmp_path)):
+            assert summary_generator.get_gemini_api_key() is None
+
+
+class TestBriefingInputState:
+    """The state changes with the headline tables, not with the summaries cache."""
+
+    def test_tracks_headlines_but_not_summaries(self, tmp_path, monkeypatch):
+        db = tmp_path / 'news_headlines.db'
+        with sqlite3.connect(db) as conn:
+            conn.executescript("""
+                CREATE TABLE headlines (scrape_date TEXT);
+                CREATE TABLE entities (headline_id INTEGER);
+                CREATE TABLE summaries (content TEXT);
+                INSERT INTO headlines VALUES ('2025-01-14');
+            """)
+        monkeypatch.setenv('GEMINI_API_KEY', 'key')
+        with patch.object(summary_generator, 'SQLITE_PATH', str(db)), \
+                patch.object(summary_generator, '_get_mysql_connection', return_value=None):
+            before = summary_generator.briefing_input_state()
+            assert before == [True, ['sqlite', '1', '2025-01-14', '0']]
+
+            with sqlite3.connect(db) as conn:
+                conn.execute("INSERT INTO summaries VALUES ('cached briefing')")
+            assert summary_generator.briefing_input_state() == before
+
+            with sqlite3.connect(db) as conn:
+                conn.execute("INSERT INTO headlines VALUES ('2025-01-15')")
+            assert summary_generator.briefing_input_state() != before
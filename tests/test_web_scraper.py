@@ -3,6 +3,10 @@ Tests for Scraping_Scripts/web_scraper.py
 Tests translation and sentiment functions without making live API calls.
 """
 
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -73,3 +77,653 @@ class TestAnalyzeSentimentHF:
         polarity, label = analyze_sentiment_hf('There is a terrible war and crisis happening')
         assert polarity < 0
         assert label == 'negative'
+
+
+class TestFetchAllSources:
+    """Tests for the concurrent fetch stage."""
+
+    @patch('Scraping_Scripts.web_scraper.RATE_LIMITER')
+    @patch('Scraping_Scripts.web_scraper.fetch_source')
+    def test_results_keep_registry_order(self, mock_fetch, mock_limiter):
+        from Scraping_Scripts.web_scraper import fetch_all_sources
+        import time
+        sources = [
+            {'name': f'Source {i}', 'url': f'https://host{i}.example/news', 'type': 'html'}
+            for i in range(5)
+        ]
+
+        def slow_first(source):
+            if source['name'] == 'Source 0':
+                time.sleep(0.05)
+            return [source['name']]
+        mock_fetch.side_effect = slow_first
+
+        results = fetch_all_sources(sources, max_workers=5)
+        assert [s['name'] for s, _ in results] == [f'Source {i}' for i in range(5)]
+        assert [h for _, h in results] == [[f'Source {i}'] for i in range(5)]
+
+    @patch('Scraping_Scripts.web_scraper.fetch_source')
+    def test_worker_error_yields_empty_list(self, mock_fetch):
+        from Scraping_Scripts.web_scraper import fetch_all_sources
+        mock_fetch.side_effect = RuntimeError('boom')
+        results = fetch_all_sources([{'name': 'Broken', 'url': 'https://x.example', 'type': 'rss'}])
+        assert results[0][1] == []
+
+    @patch('Scraping_Scripts.web_scraper.RATE_LIMITER')
+    @patch('Scraping_Scripts.web_scraper.scrape_html_source')
+    def test_same_host_requests_are_serialized(self, mock_scrape, mock_limiter):
+        from Scraping_Scripts import web_scraper
+        import threading
+        import time
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def track(source):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return []
+        mock_scrape.side_effect = track
+
+        sources = [{'name': f'BBC {i}', 'url': f'https://serial.example/{i}', 'type': 'html'} for i in range(4)]
+        web_scraper.fetch_all_sources(sources, max_workers=4)
+        assert peak[0] <= web_scraper.MAX_REQUESTS_PER_HOST
+
+    @pytest.mark.parametrize('max_workers, class_limit', [(2, 8), (8, 2)])
+    @patch('Scraping_Scripts.web_scraper.RATE_LIMITER')
+    @patch('Scraping_Scripts.web_scraper.scrape_html_source')
+    def test_saturated_host_does_not_delay_other_hosts(self, mock_scrape, mock_limiter, max_workers, class_limit):
+        """Neither a worker nor a class slot may be held by a source queued behind its own host."""
+        from Scraping_Scripts import web_scraper
+        import time
+        started = {}
+
+        def slow(source):
+            started[source['name']] = time.perf_counter()
+            time.sleep(0.15)
+            return []
+        mock_scrape.side_effect = slow
+
+        busy = [{'name': f'Busy {i}', 'url': f'https://busy.example/{i}', 'type': 'html',
+                 'concurrency_class': 'page'} for i in range(3)]
+        other = {'name': 'Other', 'url': 'https://other.example/', 'type': 'html', 'concurrency_class': 'page'}
+        with patch.object(web_scraper, 'MAX_REQUESTS_PER_HOST', 1), \
+             patch.object(web_scraper, '_class_semaphores', {}), \
+             patch.object(web_scraper.get_registry(), 'class_limit', return_value=class_limit):
+            t0 = time.perf_counter()
+            web_scraper.fetch_all_sources(busy + [other], max_workers=max_workers)
+        assert started['Other'] - t0 < 0.1
+
+
+class _StubHFHandler(BaseHTTPRequestHandler):
+    """Mimics the HF router: one prediction list per input, in order."""
+    requests_seen = []
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        inputs = body['inputs'] if isinstance(body['inputs'], list) else [body['inputs']]
+        _StubHFHandler.requests_seen.append(len(inputs))
+        out = []
+        for text in inputs:
+            pos = 0.8 if 'good' in text else 0.1
+            out.append([
+                {'label': 'positive', 'score': pos},
+                {'label': 'neutral', 'score': 0.1},
+                {'label': 'negative', 'score': round(0.9 - pos, 2)},
+            ])
+        payload = json.dumps(out).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_hf_url():
+    _StubHFHandler.requests_seen = []
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _StubHFHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}/models/stub'
+    server.shutdown()
+    server.server_close()
+
+
+class TestAnalyzeSentimentBatch:
+    """Tests for batched HF sentiment against a local stub server."""
+
+    def test_batch_matches_single_and_keeps_order(self, stub_hf_url):
+        from Scraping_Scripts import web_scraper
+        headlines = [f'headline {i} is {"good" if i % 3 == 0 else "bad"}' for i in range(10)]
+        with patch.object(web_scraper, 'HF_API_TOKEN', 'fake_token'), \
+             patch.object(web_scraper, 'HF_API_URL', stub_hf_url):
+            batched = web_scraper.analyze_sentiment_batch(headlines, batch_size=4, max_workers=3)
+            single = [web_scraper.analyze_sentiment(h) for h in headlines]
+
+        assert batched == single
+        assert batched[0][1] == 'positive' and batched[1][1] == 'negative'
+        assert sorted(_StubHFHandler.requests_seen[:3]) == [2, 4, 4]
+
+    def test_unreachable_endpoint_falls_back(self):
+        from Scraping_Scripts import web_scraper
+        with patch.object(web_scraper, 'HF_API_TOKEN', 'fake_token'), \
+             patch.object(web_scraper, 'HF_API_URL', 'http://127.0.0.1:9/unreachable'), \
+             patch.object(web_scraper, 'get_session', lambda: __import__('requests').Session()):
+            result = web_scraper.analyze_sentiment_batch(['war and crisis', 'calm day'])
+        assert result == [(-1.0, 'negative'), (0.0, 'neutral')]
+
+    def test_empty_input(self):
+        from Scraping_Scripts.web_scraper import analyze_sentiment_batch
+        assert analyze_sentiment_batch([]) == []
+
+
+class TestAnalyzeSentimentCached:
+    """Tests for cache-first sentiment scoring."""
+
+    @patch('Scraping_Scripts.web_scraper.HF_API_TOKEN', '')
+    def test_second_run_is_served_from_cache(self, tmp_path):
+        from Scraping_Scripts import web_scraper
+        from Scraping_Scripts.nlp_cache import SentimentCache
+        cache = SentimentCache(tmp_path / "s.db")
+        headlines = ['peace talks bring progress', 'war and crisis deepen', 'peace talks bring progress']
+
+        first = web_scraper.analyze_sentiment_cached(headlines, cache=cache)
+        with patch.object(web_scraper, '_score_sentiment_batch') as mock_score:
+            second = web_scraper.analyze_sentiment_cached(headlines, cache=cache)
+            mock_score.assert_not_called()
+
+        assert first == second == [web_scraper._fallback_sentiment(h) for h in headlines]
+        assert cache.hits == 3
+
+    @patch('Scraping_Scripts.web_scraper.HF_API_TOKEN', 'fake_token')
+    def test_fallback_results_not_cached_as_hf(self, tmp_path):
+        from Scraping_Scripts import web_scraper
+        from Scraping_Scripts.nlp_cache import SentimentCache
+        cache = SentimentCache(tmp_path / "s.db")
+        with patch.object(web_scraper, '_analyze_sentiment_chunk',
+                          side_effect=lambda chunk: [(0.0, 'neutral', web_scraper.FALLBACK_MODEL) for _ in chunk]):
+            web_scraper.analyze_sentiment_cached(['calm day'], cache=cache)
+        assert cache.get_many(web_scraper.HF_MODEL, ['calm day']) == [None]
+        assert cache.get_many(web_scraper.FALLBACK_MODEL, ['calm day']) == [(0.0, 'neutral')]
+
+
+class TestTranslateHeadlines:
+    """Tests for memory-backed batch translation."""
+
+    def test_only_misses_reach_the_translator(self, tmp_path):
+        from Scraping_Scripts import web_scraper
+        from Scraping_Scripts.nlp_cache import TranslationMemory
+        memory = TranslationMemory(tmp_path / "tm.db")
+        memory.put_many('es', [('Hola', 'Hello')])
+        translator = MagicMock()
+        translator.translate_batch.side_effect = lambda texts: [f'EN:{t}' for t in texts]
+
+        with patch.object(web_scraper, '_get_translator', return_value=translator):
+            result = web_scraper.translate_headlines(['Hola', 'Adiós', 'Adiós', '  '], 'es', memory=memory)
+
+        assert result == ['Hello', 'EN:Adiós', 'EN:Adiós', '']
+        translator.translate_batch.assert_called_once_with(['Adiós'])
+        assert memory.get_many('es', ['Adiós']) == ['EN:Adiós']
+
+    def test_failed_items_keep_original_and_are_not_stored(self, tmp_path):
+        from Scraping_Scripts import web_scraper
+        from Scraping_Scripts.nlp_cache import TranslationMemory
+        memory = TranslationMemory(tmp_path / "tm.db")
+        translator = MagicMock()
+        translator.translate_batch.side_effect = Exception('API Error')
+        translator.translate.side_effect = lambda t: 'Good' if t == 'Bueno' else (_ for _ in ()).throw(Exception('x'))
+
+        with patch.object(web_scraper, '_get_translator', return_value=translator):
+            result = web_scraper.translate_headlines(['Bueno', 'Malo'], 'es', memory=memory)
+
+        assert result == ['Good', 'Malo']
+        assert memory.get_many('es', ['Bueno', 'Malo']) == ['Good', None]
+
+
+@pytest.fixture
+def ruler_nlp():
+    """Blank English pipeline with a rule-based NER, standing in for en_core_web_sm."""
+    import spacy
+    nlp = spacy.blank('en')
+    ruler = nlp.add_pipe('entity_ruler')
+    ruler.add_patterns([
+        {'label': 'GPE', 'pattern': 'Moscow'},
+        {'label': 'PERSON', 'pattern': 'Modi'},
+        {'label': 'ORG', 'pattern': 'UNESCO'},
+    ])
+    return nlp
+
+
+class TestPerformNerBatch:
+    """Tests for the batched NER stage."""
+
+    def test_matches_per_document_ner(self, ruler_nlp):
+        from Scraping_Scripts import web_scraper
+        texts = ['Modi visits Moscow', 'No entities here', 'UNESCO praises Moscow museum']
+        with patch.object(web_scraper, 'nlp', ruler_nlp):
+            batched = web_scraper.perform_ner_batch(texts, batch_size=2)
+            single = [web_scraper.perform_ner(t) for t in texts]
+        assert batched == single
+        assert batched[0] == [('Modi', 'PERSON'), ('Moscow', 'GPE')]
+        assert batched[1] == []
+
+    def test_empty_input(self, ruler_nlp):
+        from Scraping_Scripts import web_scraper
+        with patch.object(web_scraper, 'nlp', ruler_nlp):
+            assert web_scraper.perform_ner_batch([]) == []
+
+
+class TestImportTime:
+    """Import-time benchmark: the DAG parser and tests import this module cold."""
+
+    IMPORT_BUDGET_SECONDS = 0.5
+
+    def test_cold_import_within_budget(self):
+        import subprocess
+        import sys
+        from pathlib import Path
+        project_root = Path(__file__).resolve().parent.parent
+        code = (
+            "import sys, time\n"
+            "t = time.perf_counter()\n"
+            "import Scraping_Scripts.web_scraper\n"
+            "elapsed = time.perf_counter() - t\n"
+            "heavy = [m for m in ('spacy', 'bs4', 'deep_translator', 'requests') if m in sys.modules]\n"
+            "print(elapsed, ','.join(heavy))\n"
+        )
+        out = subprocess.run([sys.executable, "-c", code], cwd=str(project_root),
+                             capture_output=True, text=True, check=True).stdout.split()
+        elapsed = float(out[0])
+        assert len(out) == 1, f"heavy modules imported eagerly: {out[1]}"
+        assert elapsed < self.IMPORT_BUDGET_SECONDS, f"import took {elapsed:.3f}s"
+
+    def test_model_loads_lazily_once(self, ruler_nlp):
+        from Scraping_Scripts import web_scraper
+        with patch.object(web_scraper, 'nlp', ruler_nlp):
+            assert web_scraper.get_nlp() is ruler_nlp
+            assert web_scraper.perform_ner('Modi in Moscow') == [('Modi', 'PERSON'), ('Moscow', 'GPE')]
+
+
+RSS_FEED = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Stub</title>
+<item><title>First headline long enough to keep around</title></item>
+<item><title>Second headline long enough to keep around</title></item>
+</channel></rss>"""
+
+
+class _StubFeedHandler(BaseHTTPRequestHandler):
+    """Serves RSS_FEED with an ETag and honours If-None-Match."""
+    protocol_version = 'HTTP/1.1'
+    seen_conditional = []
+
+    def do_GET(self):
+        _StubFeedHandler.seen_conditional.append(self.headers.get('If-None-Match'))
+        if self.headers.get('If-None-Match') == '"v1"':
+            self.send_response(304)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('ETag', '"v1"')
+        self.send_header('Content-Length', str(len(RSS_FEED)))
+        self.end_headers()
+        self.wfile.write(RSS_FEED)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestConditionalGet:
+    """Tests for ETag / Last-Modified short-circuiting."""
+
+    def test_304_serves_cached_headlines_without_parsing(self, tmp_path):
+        from Scraping_Scripts import web_scraper
+        from Scraping_Scripts.http_client import ValidatorCache, build_session
+        _StubFeedHandler.seen_conditional = []
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _StubFeedHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        source = {'name': 'Stub RSS', 'url': f'http://127.0.0.1:{server.server_address[1]}/rss', 'type': 'rss'}
+        validators = ValidatorCache(str(tmp_path / 'validators.json'))
+        try:
+            with patch.object(web_scraper, 'get_validator_cache', return_value=validators), \
+                 patch.object(web_scraper, 'get_session', return_value=build_session()):
+                first = web_scraper.scrape_rss_source(source)
+                with patch.object(web_scraper, 'parse_rss_headlines') as mock_parse:
+                    second = web_scraper.scrape_rss_source(source)
+                    mock_parse.assert_not_called()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert len(first) == 2
+        assert second == first
+        assert _StubFeedHandler.seen_conditional == [None, '"v1"']
+        assert validators.not_modified == 1
+        # Validators survive a restart
+        assert ValidatorCache(str(tmp_path / 'validators.json')).conditional_headers(source['url']) == {'If-None-Match': '"v1"'}
+
+    def test_304_releases_the_streamed_response(self, tmp_path):
+        from Scraping_Scripts import web_scraper
+        from Scraping_Scripts.http_client import ValidatorCache
+        validators = ValidatorCache(str(tmp_path / 'validators.json'))
+        response = MagicMock(status_code=200, headers={'ETag': '"v1"'})
+        validators.store('https://a.example/rss', response.headers, ['Cached headline long enough to keep'])
+        response.status_code = 304
+        session = MagicMock()
+        session.get.return_value = response
+        with patch.object(web_scraper, 'get_validator_cache', return_value=validators), \
+             patch.object(web_scraper, 'get_session', return_value=session):
+            assert web_scraper._conditional_get({'url': 'https://a.example/rss'}, stream=True) == \
+                (None, ['Cached headline long enough to keep'])
+        response.close.assert_called_once()
+
+    def test_not_modified_counts_only_the_current_pass(self, scraper_run, capsys):
+        scraper_run.validators.not_modified = 3   # left over from an earlier pass
+        scraper_run.main([_source("Feed", "https://b.example/rss")], run_all=True)
+        assert scraper_run.validators.not_modified == 0
+        assert '304 Not Modified' not in capsys.readouterr().out
+
+
+class TestStreamingFeedParser:
+    """Tests for incremental RSS/Atom parsing."""
+
+    def test_atom_entries(self):
+        from Scraping_Scripts.web_scraper import parse_rss_headlines
+        atom = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>Feed title is not a headline at all</title>
+<entry><title>Atom entry headline number one here</title></entry>
+<entry><title type="html">Atom entry headline number two here</title></entry>
+</feed>"""
+        assert parse_rss_headlines(atom) == [
+            'Atom entry headline number one here',
+            'Atom entry headline number two here',
+        ]
+
+    def test_matches_rss_item_titles(self):
+        from Scraping_Scripts.web_scraper import parse_rss_headlines
+        assert parse_rss_headlines(RSS_FEED) == [
+            'First headline long enough to keep around',
+            'Second headline long enough to keep around',
+        ]
+
+    def test_stops_reading_once_cap_is_hit(self):
+        from Scraping_Scripts import web_scraper
+        items = b"".join(
+            b"<item><title>Streaming headline number %d of the feed</title></item>" % i for i in range(40)
+        )
+        document = b'<?xml version="1.0"?><rss><channel>' + items + b'</channel></rss>'
+        chunks_read = []
+
+        def stream():
+            for i in range(0, len(document), 64):
+                chunks_read.append(i)
+                yield document[i:i + 64]
+
+        with patch.object(web_scraper, 'MAX_HEADLINES_PER_SOURCE', 3):
+            headlines = web_scraper.parse_rss_headlines(stream())
+        assert len(headlines) == 3
+        assert len(chunks_read) < len(document) // 64 / 4
+
+
+HTML_PAGE = b"""<html><body>
+<div class="nav"><h3>Short</h3></div>
+<h3>Plain h3 headline that is long enough</h3>
+<h2 class="article-card__title extra">Class selector headline long enough</h2>
+<h2 class="other">Unrelated h2 heading that should be skipped</h2>
+<a data-testid="Heading" href="#"><span>Attribute selector headline long enough</span></a>
+<ul class="bbc-1rrncb9"><li><h3>BBC list headline that is long enough</h3></li></ul>
+</body></html>"""
+
+
+class TestParseHtmlHeadlines:
+    """Tests for compiled selectors across parser backends."""
+
+    @pytest.fixture(params=['html.parser', 'lxml'])
+    def backend(self, request):
+        if request.param == 'lxml':
+            pytest.importorskip('lxml')
+        from Scraping_Scripts import web_scraper
+        with patch.object(web_scraper, 'HTML_PARSER', request.param):
+            yield web_scraper
+
+    def test_tag_selector(self, backend):
+        source = {'url': 'https://example.com', 'selector': 'h3'}
+        assert backend.parse_html_headlines(HTML_PAGE, source) == [
+            'Plain h3 headline that is long enough',
+            'BBC list headline that is long enough',
+        ]
+
+    def test_class_selector(self, backend):
+        source = {'url': 'https://example.com', 'selector': 'h2.article-card__title'}
+        assert backend.parse_html_headlines(HTML_PAGE, source) == ['Class selector headline long enough']
+
+    def test_attribute_selector(self, backend):
+        source = {'url': 'https://example.com', 'selector': "a[data-testid='Heading'] span"}
+        assert backend.parse_html_headlines(HTML_PAGE, source) == ['Attribute selector headline long enough']
+
+    def test_bbc_fallback(self, backend):
+        source = {'url': 'https://www.bbc.com/mundo', 'selector': 'h4'}
+        assert backend.parse_html_headlines(HTML_PAGE, source) == ['BBC list headline that is long enough']
+
+    def test_selectors_are_compiled_once(self, backend):
+        assert backend.compile_selector('h3.title') is backend.compile_selector('h3.title')
+        assert backend.compile_selector('h3.title').root_tags == ('h3',)
+
+    def test_grouped_selector_keeps_every_group(self, backend):
+        source = {'url': 'https://example.com', 'selector': 'h2.article-card__title, h3'}
+        assert backend.compile_selector(source['selector']).root_tags == ('h2', 'h3')
+        assert backend.parse_html_headlines(HTML_PAGE, source) == [
+            'Plain h3 headline that is long enough',
+            'Class selector headline long enough',
+            'BBC list headline that is long enough',
+        ]
+
+    @pytest.mark.parametrize('selector, expected', [
+        ('h3 + h2', ['Class selector headline long enough']),
+        ('h2.article-card__title ~ h2', ['Unrelated h2 heading that should be skipped']),
+        ('body > h2:nth-child(4)', ['Unrelated h2 heading that should be skipped']),
+    ])
+    def test_sibling_selectors_parse_the_whole_page(self, backend, selector, expected):
+        assert backend.compile_selector(selector).root_tags is None
+        source = {'url': 'https://example.com', 'selector': selector}
+        assert backend.parse_html_headlines(HTML_PAGE, source) == expected
+
+    def test_attribute_values_do_not_disable_the_strainer(self, backend):
+        assert backend.compile_selector("a[title='a, b + c'] span").root_tags == ('a',)
+
+
+def _source(name, url, **overrides):
+    """A registry entry as site_configs.json would give it (an English RSS feed unless overridden)."""
+    source = {"name": name, "language": "en", "region": "Global", "url": url, "type": "rss", "selector": None,
+              "requires_translation": False, "enabled": True, "fetch_interval_minutes": 60.0,
+              "concurrency_class": "feed"}
+    source.update(overrides)
+    return source
+
+
+class ScraperRun:
+    """web_scraper.main() with every cache and output under tmp_path and the network and NLP stubbed."""
+
+    def __init__(self, tmp_path, monkeypatch):
+        from Scraping_Scripts import web_scraper
+        from Scraping_Scripts.http_client import ValidatorCache
+        from Scraping_Scripts.nlp_cache import HeadlineIndex, SentimentCache, TranslationMemory
+
+        self.web_scraper = web_scraper
+        self.tmp_path = tmp_path
+        self.fetched = []
+        # Headlines each source "returns"; tests override it per case.
+        self.headlines = lambda source: [f"{source['name']} first headline long enough",
+                                         f"{source['name']} second headline long enough"]
+        self.index = HeadlineIndex(':memory:')
+        self.validators = ValidatorCache(str(tmp_path / 'validators.json'))
+        self.translate = MagicMock(side_effect=lambda hs, lang: [f"EN {h}" for h in hs])
+        self.sentiment = MagicMock(side_effect=lambda hs: [(0.25, 'positive', web_scraper.FALLBACK_MODEL)] * len(hs))
+        self.ner = MagicMock(side_effect=lambda ts: [[] for _ in ts])
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(web_scraper, 'refresh_sources', lambda: False)
+        monkeypatch.setattr(web_scraper, 'fetch_all_sources', self._fetch)
+        monkeypatch.setattr(web_scraper, 'get_headline_index', lambda: self.index)
+        monkeypatch.setattr(web_scraper, 'get_translation_memory',
+                            lambda: TranslationMemory(tmp_path / 'translation_memory.db'))
+        monkeypatch.setattr(web_scraper, 'get_sentiment_cache', lambda: SentimentCache(tmp_path / 'sentiment.db'))
+        monkeypatch.setattr(web_scraper, 'get_validator_cache', lambda: self.validators)
+        monkeypatch.setattr(web_scraper, 'translate_headlines', lambda *a: self.translate(*a))
+        monkeypatch.setattr(web_scraper, '_sentiment_cached_with_models', lambda hs: self.sentiment(hs))
+        monkeypatch.setattr(web_scraper, 'perform_ner_batch', lambda ts: self.ner(ts))
+        self._monkeypatch = monkeypatch
+
+    def _fetch(self, sources):
+        self.fetched.append([s["name"] for s in sources])
+        return [(s, self.headlines(s)) for s in sources]
+
+    def schedule(self):
+        return self.web_scraper.ScheduleState(str(self.tmp_path / "schedule.json"))
+
+    def main(self, sources, **kwargs):
+        self._monkeypatch.setattr(self.web_scraper, 'SOURCES', sources)
+        kwargs.setdefault('schedule', self.schedule())
+        self.web_scraper.main(**kwargs)
+
+    def csv_path(self):
+        return str(next((self.tmp_path / "raw_csv_daily").glob("*.csv")))
+
+    def rows(self):
+        import csv as csv_module
+        with open(self.csv_path(), newline='', encoding='utf-8') as f:
+            return list(csv_module.DictReader(f))
+
+
+@pytest.fixture
+def scraper_run(tmp_path, monkeypatch):
+    return ScraperRun(tmp_path, monkeypatch)
+
+
+class TestMainScheduling:
+    """Tests for due-source selection and append-only daily CSVs."""
+
+    def test_only_due_sources_and_no_duplicate_rows(self, scraper_run):
+        feed = _source("Feed", "https://b.example/rss")
+        page = _source("Page", "https://a.example", type="html", selector="h3", fetch_interval_minutes=1440.0,
+                       concurrency_class="page")
+        schedule = scraper_run.schedule()
+        schedule.mark_fetched(["Page"])
+
+        scraper_run.main([page, feed], schedule=schedule)
+        scraper_run.main([page, feed], schedule=schedule, run_all=True)
+
+        assert scraper_run.fetched == [["Feed"], ["Page", "Feed"]]
+        assert [r['Source_Name'] for r in scraper_run.rows()] == ["Feed", "Feed", "Page", "Page"]
+
+    def test_sources_are_stamped_with_the_run_start(self, scraper_run, monkeypatch):
+        """A daily source processed late in a run must still be due at the same time tomorrow."""
+        import time
+        clock = [1_000_000.0]
+        monkeypatch.setattr(time, 'time', lambda: clock[0])
+
+        def slow_sentiment(headlines):
+            clock[0] += 600   # ten minutes of analysis per source
+            return [(0.0, 'neutral', scraper_run.web_scraper.FALLBACK_MODEL)] * len(headlines)
+
+        scraper_run.sentiment.side_effect = slow_sentiment
+        sources = [_source(name, f"https://{name.lower()}.example/rss", fetch_interval_minutes=1440.0)
+                   for name in ("First", "Second", "Third")]
+        schedule = scraper_run.schedule()
+        scraper_run.main(sources, schedule=schedule)
+
+        assert {schedule.last_fetched(s["name"]) for s in sources} == {1_000_000.0}
+        tomorrow = 1_000_000.0 + 1440 * 60 - 60
+        assert schedule.due_sources(sources, now=tomorrow) == sources
+
+
+class TestHeadlineIndexReuse:
+    """Headlines seen in an earlier run skip translation, sentiment and NER."""
+
+    def test_known_headlines_skip_nlp(self, scraper_run):
+        source = _source("BBC Test", "https://www.bbc.com/x", language="es", region="Latin America",
+                         type="html", selector="h3", requires_translation=True, concurrency_class="page")
+        old, new = "Un titular que ya se vio ayer", "Un titular completamente nuevo hoy"
+        scraper_run.headlines = lambda s: [old, new]
+        models = scraper_run.web_scraper.analysis_models()
+        scraper_run.index.put_many(models, [("BBC Test", old, "A headline seen yesterday", -0.5, "negative",
+                                             [("BBC", "ORG")])])
+        scraper_run.ner.side_effect = lambda ts: [[("Hoy", "DATE")] for _ in ts]
+
+        scraper_run.main([source], run_all=True)
+
+        scraper_run.translate.assert_called_once_with([new], "es")
+        assert scraper_run.sentiment.call_args[0][0] == [f"EN {new}"]
+        assert scraper_run.ner.call_args[0][0] == [f"EN {new}"]
+        rows = scraper_run.rows()
+        assert rows[0]['Translated_Headline'] == "A headline seen yesterday"
+        assert rows[0]['Entities_Raw'] == '[["BBC", "ORG"]]'
+        assert rows[1]['Translated_Headline'] == f"EN {new}"
+        assert (rows[1]['Polarity'], rows[1]['Entities_Raw']) == ("0.25", '[["Hoy", "DATE"]]')
+        # The new headline is indexed for the next run
+        assert scraper_run.index.get_many(models, "BBC Test", [new])[0]['Polarity'] == 0.25
+
+    def test_analysis_from_another_engine_is_redone(self, scraper_run, monkeypatch):
+        source = _source("Feed", "https://a.example/rss")
+        headline = "A headline analysed by the old engine"
+        scraper_run.headlines = lambda s: [headline]
+        scraper_run.index.put_many(scraper_run.web_scraper.analysis_models(),
+                                   [("Feed", headline, headline, -0.5, "negative", [])])
+        monkeypatch.setattr(scraper_run.web_scraper, 'active_sentiment_model', lambda: "local-model")
+
+        scraper_run.main([source], run_all=True)
+
+        assert scraper_run.sentiment.call_args[0][0] == [headline]
+        assert scraper_run.rows()[0]['Polarity'] == "0.25"
+
+
+class TestRunWideAnalysis:
+    """Translation, sentiment and NER are batched across sources, commits stay per source."""
+
+    def test_one_model_call_per_stage(self, scraper_run):
+        mundo = _source("BBC Mundo", "https://www.bbc.com/mundo", language="es", requires_translation=True)
+        elpais = _source("El Pais", "https://elpais.com/rss", language="es", requires_translation=True)
+        feed = _source("Feed", "https://a.example/rss")
+        spanish = {"BBC Mundo": ["El gobierno anuncia nuevas medidas para la economía",
+                                 "Los precios de la vivienda suben en todo el país"],
+                   "El Pais": ["La selección gana el partido en el último minuto"]}
+        scraper_run.headlines = lambda s: spanish.get(s["name"], ["An English headline that is long enough"])
+
+        scraper_run.main([mundo, elpais, feed], run_all=True)
+
+        scraper_run.translate.assert_called_once_with(spanish["BBC Mundo"] + spanish["El Pais"], "es")
+        assert scraper_run.sentiment.call_count == 1 and scraper_run.ner.call_count == 1
+        assert len(scraper_run.ner.call_args[0][0]) == 4
+        rows = scraper_run.rows()
+        assert [r['Source_Name'] for r in rows] == ["BBC Mundo", "BBC Mundo", "El Pais", "Feed"]
+        assert rows[2]['Translated_Headline'] == "EN " + spanish["El Pais"][0]
+
+
+class TestMainResume:
+    """Sources are committed one at a time; resume skips the ones already written."""
+
+    def test_crash_keeps_earlier_sources_and_resume_skips_them(self, scraper_run):
+        from Scraping_Scripts.raw_csv_writer import RawCsvWriter
+
+        good = _source("Good", "https://a.example/rss")
+        bad = _source("Bad", "https://b.example/rss")
+        scraper_run.headlines = lambda s: [f"{s['name']} headline that is long enough"]
+
+        def flaky_ner(texts):
+            if any(t.startswith("Bad") for t in texts):
+                raise RuntimeError("worker died")
+            return [[] for _ in texts]
+
+        scraper_run.ner.side_effect = flaky_ner
+        scraper_run.main([good, bad], run_all=True)
+        assert RawCsvWriter(scraper_run.csv_path()).sources_written() == {"Good"}
+
+        scraper_run.main([good, bad], run_all=True, resume=True)
+        assert scraper_run.fetched == [["Good", "Bad"], ["Bad"]]